@@ -0,0 +1,7 @@
+'''Benchmarks of the flash, phase and property calculations of thermo, in
+the format of `airspeed velocity <https://asv.readthedocs.io>`_.
+
+Run them with `asv run` from the root of the repository, or without asv
+with `python -m benchmarks`, which times each benchmark once in the current
+environment.
+'''
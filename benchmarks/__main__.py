@@ -0,0 +1,56 @@
+'''Run each benchmark once in the current environment, without asv:
+
+    python -m benchmarks [name filter]
+'''
+import sys
+import inspect
+import importlib
+import itertools
+import pkgutil
+from time import perf_counter
+
+import benchmarks
+
+
+def run(pattern=''):
+    for info in pkgutil.iter_modules(benchmarks.__path__):
+        if not info.name.startswith('bench_'):
+            continue
+        module = importlib.import_module('benchmarks.' + info.name)
+        for cls_name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__:
+                continue
+            params = getattr(cls, 'params', ())
+            for args in itertools.product(*params) if params else [()]:
+                names = sorted(name for name in dir(cls) if name.startswith(('time_', 'track_')))
+                names = [name for name in names if pattern in '%s.%s.%s' %(info.name, cls_name, name)]
+                if not names:
+                    continue
+                bench = cls()
+                try:
+                    if hasattr(bench, 'setup'):
+                        bench.setup(*args)
+                except NotImplementedError as e:
+                    print('%s.%s%s skipped: %s' %(info.name, cls_name, list(args) if args else '', e))
+                    continue
+                for name in names:
+                    method = getattr(bench, name)
+                    if name.startswith('track_'):
+                        print('%s.%s.%s%s: %s' %(info.name, cls_name, name, list(args) if args else '',
+                                                 method(*args)))
+                        continue
+                    number, elapsed = 1, 0.0
+                    while True:
+                        t0 = perf_counter()
+                        for _ in range(number):
+                            method(*args)
+                        elapsed = perf_counter() - t0
+                        if elapsed > 0.2 or number >= 10000:
+                            break
+                        number *= 10
+                    print('%s.%s.%s%s: %.3g ms' %(info.name, cls_name, name, list(args) if args else '',
+                                                  elapsed/number*1e3))
+
+
+if __name__ == '__main__':
+    run(sys.argv[1] if len(sys.argv) > 1 else '')
@@ -0,0 +1,138 @@
+'''Timings of the flashes of representative systems.'''
+from thermo.flash import sequential_substitution_NP
+from benchmarks.systems import (cubic_flasher, natural_gas_IDs,
+                                natural_gas, natural_gas_zs, oil, oil_zs,
+                                water_ethanol, water_ethanol_zs, steam,
+                                water_methane_octane, water_methane_octane_zs)
+
+
+class FlashNaturalGas(object):
+    '''Natural gas with the Peng-Robinson equation of state.'''
+    def setup(self):
+        self.flasher = natural_gas()
+        self.zs = natural_gas_zs
+        self.state = self.flasher.flash(T=200.0, P=3e6, zs=self.zs)
+
+    def time_TP_gas(self):
+        self.flasher.flash(T=300.0, P=5e6, zs=self.zs)
+
+    def time_TP_two_phase(self):
+        self.flasher.flash(T=200.0, P=3e6, zs=self.zs)
+
+    def time_PH(self):
+        self.flasher.flash(P=3e6, H=self.state.H(), zs=self.zs)
+
+    def time_PS(self):
+        self.flasher.flash(P=3e6, S=self.state.S(), zs=self.zs)
+
+    def time_PVF_dew(self):
+        self.flasher.flash(P=3e6, VF=1.0, zs=self.zs)
+
+    def time_TVF_bubble(self):
+        self.flasher.flash(T=150.0, VF=0.0, zs=self.zs)
+
+
+class PhaseEnvelopeNaturalGas(object):
+    '''Bubble and dew curves of the natural gas, traced by continuation and
+    by repeated flashes. The flasher is not shared, as the envelopes it
+    stores change its bubble and dew point flashes.'''
+    def setup(self):
+        self.flasher = cubic_flasher(natural_gas_IDs)
+
+    def time_trace_phase_envelope(self):
+        self.flasher.VF_envelopes = None
+        self.flasher.trace_phase_envelope(natural_gas_zs)
+
+    def time_build_VF_envelope(self):
+        self.flasher.VF_envelopes = None
+        self.flasher.build_VF_envelope(natural_gas_zs)
+
+
+class FlashWaterEthanol(object):
+    '''Water and ethanol with UNIFAC and an ideal gas.'''
+    def setup(self):
+        self.flasher = water_ethanol()
+        self.zs = water_ethanol_zs
+        self.state = self.flasher.flash(T=360.0, P=1e5, zs=self.zs)
+
+    def time_TP_liquid(self):
+        self.flasher.flash(T=300.0, P=1e5, zs=self.zs)
+
+    def time_TP_two_phase(self):
+        self.flasher.flash(T=360.0, P=1e5, zs=self.zs)
+
+    def time_PH(self):
+        self.flasher.flash(P=1e5, H=self.state.H(), zs=self.zs)
+
+    def time_PS(self):
+        self.flasher.flash(P=1e5, S=self.state.S(), zs=self.zs)
+
+    def time_PVF_bubble(self):
+        self.flasher.flash(P=1e5, VF=0.0, zs=self.zs)
+
+
+class FlashSteam(object):
+    '''Water with IAPWS-95.'''
+    def setup(self):
+        self.flasher = steam()
+        self.state = self.flasher.flash(T=500.0, P=1e6)
+
+    def time_TP(self):
+        self.flasher.flash(T=500.0, P=1e6)
+
+    def time_PH(self):
+        self.flasher.flash(P=1e6, H=self.state.H())
+
+    def time_PS(self):
+        self.flasher.flash(P=1e6, S=self.state.S())
+
+    def time_PVF(self):
+        self.flasher.flash(P=1e6, VF=0.5)
+
+    def time_TVF(self):
+        self.flasher.flash(T=450.0, VF=0.5)
+
+
+class FlashOil(object):
+    '''A 20 component mixture of n-alkanes with the Peng-Robinson equation
+    of state.'''
+    def setup(self):
+        self.flasher = oil()
+        self.zs = oil_zs
+        self.state = self.flasher.flash(T=400.0, P=2e6, zs=self.zs)
+
+    def time_TP_two_phase(self):
+        self.flasher.flash(T=400.0, P=2e6, zs=self.zs)
+
+    def time_PH(self):
+        self.flasher.flash(P=2e6, H=self.state.H(), zs=self.zs)
+
+    def time_PVF_bubble(self):
+        self.flasher.flash(P=2e6, VF=0.0, zs=self.zs)
+
+
+class SequentialSubstitutionNP(object):
+    '''Three phase sequential substitution of water, methane and octane
+    with the Peng-Robinson equation of state, near the boundary where the
+    gas disappears, with each acceleration method.'''
+    params = ([None, 'DEM', 'GDEM'],)
+    param_names = ['acceleration']
+
+    def setup(self, acceleration):
+        self.flasher = flasher = water_methane_octane()
+        self.phases = [flasher.gas, flasher.liquids[0], flasher.liquids[1]]
+        self.zs = water_methane_octane_zs
+        self.compositions = [[0.03, 0.95, 0.02], [0.999, 1e-6, 1e-5], [0.01, 0.01, 0.98]]
+
+    def solve(self, acceleration):
+        return sequential_substitution_NP(450.0, 1.4e7, self.zs, [list(xs) for xs in self.compositions],
+                                          [0.35, 0.3], self.phases, maxiter=5000,
+                                          acceleration=acceleration,
+                                          acc_frequency=self.flasher.SS_NP_ACC_FREQUENCY,
+                                          acc_delay=self.flasher.SS_NP_ACC_DELAY)
+
+    def time_solve(self, acceleration):
+        self.solve(acceleration)
+
+    def track_iterations(self, acceleration):
+        return self.solve(acceleration)[3]
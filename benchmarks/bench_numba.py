@@ -0,0 +1,34 @@
+'''Timings of the array based functions of thermo in pure Python and
+compiled with numba; the numba variants are skipped when numba is not
+installed.'''
+from math import sqrt
+import numpy as np
+import thermo
+from benchmarks.systems import oil, oil_zs
+
+
+class CubicKernel(object):
+    '''The array based cubic TP flash of the 20 component oil.'''
+    params = (['python', 'numba'],)
+    param_names = ['mode']
+
+    def setup(self, mode):
+        if mode == 'numba':
+            try:
+                import thermo.numba as module
+            except ImportError:
+                raise NotImplementedError("numba is not installed")
+            array = np.array
+        else:
+            module = thermo
+            array = list
+        self.cubic_flash_TP_2P = module.cubic_flash_TP_2P
+        eos = oil().gas.eos_mix.to(T=400.0, P=2e6, zs=oil_zs)
+        self.args = (400.0, 2e6, array(oil_zs), array(eos.Tcs), array(eos.Pcs),
+                     array(eos.omegas), array(eos.bs), array(eos.a_alphas_vectorized(400.0)),
+                     array([array(row) for row in eos.kijs]), 1.0 + sqrt(2.0), 1.0 - sqrt(2.0), 2.0, -1.0)
+        # Compile outside of the timings
+        self.cubic_flash_TP_2P(*self.args)
+
+    def time_cubic_flash_TP_2P(self, mode):
+        self.cubic_flash_TP_2P(*self.args)
@@ -0,0 +1,91 @@
+'''Timings of phase and property calls, and of package construction.'''
+from thermo import ChemicalConstantsPackage
+from benchmarks.systems import (natural_gas, natural_gas_zs, oil_zs, oil,
+                                water_ethanol, water_ethanol_zs, steam,
+                                natural_gas_IDs, packages, UNIFAC_liquid,
+                                cubic_flasher)
+
+
+class CubicPhases(object):
+    '''Phases of the Peng-Robinson equation of state.'''
+    params = (['natural gas', 'oil'],)
+    param_names = ['system']
+
+    def setup(self, system):
+        if system == 'natural gas':
+            flasher, self.zs = natural_gas(), natural_gas_zs
+        else:
+            flasher, self.zs = oil(), oil_zs
+        self.gas = flasher.gas.to(T=300.0, P=1e6, zs=self.zs)
+        self.liquid = flasher.liquid.to(T=300.0, P=1e6, zs=self.zs)
+        self.Ps = [1e5*(i + 1) for i in range(100)]
+
+    def time_to_TP_zs(self, system):
+        self.gas.to_TP_zs(T=301.0, P=1e6, zs=self.zs)
+
+    def time_lnphis(self, system):
+        self.gas.to_TP_zs(T=301.0, P=1e6, zs=self.zs).lnphis()
+
+    def time_lnphis_at_zs(self, system):
+        self.liquid.lnphis_at_zs(self.zs)
+
+    def time_properties(self, system):
+        phase = self.gas.to_TP_zs(T=301.0, P=1e6, zs=self.zs)
+        phase.H(), phase.S(), phase.Cp(), phase.dP_dT(), phase.dP_dV()
+
+    def time_evaluate_many(self, system):
+        # 100 pressures at one temperature
+        self.gas.evaluate_many(301.0, self.Ps, self.zs)
+
+
+class GibbsExcessPhases(object):
+    '''Water and ethanol with UNIFAC.'''
+    def setup(self):
+        flasher = water_ethanol()
+        self.liquid = flasher.liquid.to(T=330.0, P=1e5, zs=water_ethanol_zs)
+        self.GE = self.liquid.GibbsExcessModel
+
+    def time_to_TP_zs(self):
+        self.liquid.to_TP_zs(T=331.0, P=1e5, zs=water_ethanol_zs)
+
+    def time_lnphis(self):
+        self.liquid.to_TP_zs(T=331.0, P=1e5, zs=water_ethanol_zs).lnphis()
+
+    def time_UNIFAC_to_T_xs_gammas(self):
+        self.GE.to_T_xs(T=331.0, xs=water_ethanol_zs).gammas()
+
+    def time_properties(self):
+        phase = self.liquid.to_TP_zs(T=331.0, P=1e5, zs=water_ethanol_zs)
+        phase.H(), phase.S(), phase.G(), phase.V()
+
+
+class IAPWS95Phases(object):
+    '''Water with IAPWS-95.'''
+    def setup(self):
+        self.gas = steam().gas.to(T=500.0, P=1e6, zs=[1.0])
+
+    def time_to_TP_zs(self):
+        self.gas.to_TP_zs(T=501.0, P=1e6, zs=[1.0])
+
+    def time_properties(self):
+        phase = self.gas.to_TP_zs(T=501.0, P=1e6, zs=[1.0])
+        phase.H(), phase.S(), phase.Cp(), phase.dP_dT(), phase.dP_dV()
+
+
+class Construction(object):
+    '''Construction of packages, phases and flashers.'''
+    def setup(self):
+        self.constants, self.correlations = packages(tuple(natural_gas_IDs))
+        self.water_ethanol = packages(('water', 'ethanol'))
+
+    def time_constants_from_IDs(self):
+        ChemicalConstantsPackage.constants_from_IDs(natural_gas_IDs)
+
+    def time_cubic_flasher(self):
+        cubic_flasher(natural_gas_IDs)
+
+    def time_UNIFAC_liquid(self):
+        UNIFAC_liquid(*self.water_ethanol)
+
+    def time_flash_result(self):
+        natural_gas().flash(T=300.0, P=5e6, zs=natural_gas_zs).bulk.Cp()
@@ -0,0 +1,84 @@
+'''Systems shared by the benchmarks. Each is built once per process.'''
+from functools import lru_cache
+
+from thermo import (ChemicalConstantsPackage, PropertyCorrelationsPackage,
+                    CEOSGas, CEOSLiquid, PRMIX, IGMIX, GibbsExcessLiquid,
+                    IAPWS95Gas, IAPWS95Liquid, FlashVL, FlashVLN, FlashPureVLS)
+from thermo.chemical_package import iapws_constants, iapws_correlations
+from thermo.unifac import UNIFAC
+
+natural_gas_IDs = ['methane', 'ethane', 'propane', 'n-butane', 'nitrogen', 'carbon dioxide']
+natural_gas_zs = [0.85, 0.06, 0.03, 0.01, 0.03, 0.02]
+
+water_ethanol_IDs = ['water', 'ethanol']
+water_ethanol_zs = [0.6, 0.4]
+
+water_methane_octane_IDs = ['water', 'methane', 'octane']
+water_methane_octane_zs = [1.0/3.0, 1.0/3.0, 1.0/3.0]
+
+# n-alkanes from methane to eicosane, by CAS number
+oil_IDs = ['74-82-8', '74-84-0', '74-98-6', '106-97-8', '109-66-0', '110-54-3',
+           '142-82-5', '111-65-9', '111-84-2', '124-18-5', '1120-21-4', '112-40-3',
+           '629-50-5', '629-59-4', '629-62-9', '544-76-3', '629-78-7', '593-45-3',
+           '629-92-5', '112-95-8']
+oil_zs = [0.3, 0.1, 0.08, 0.06, 0.05, 0.05, 0.04, 0.04, 0.03, 0.03,
+          0.03, 0.03, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02, 0.02]
+
+
+@lru_cache(maxsize=None)
+def packages(IDs):
+    return ChemicalConstantsPackage.from_IDs(list(IDs))
+
+
+def cubic_flasher(IDs, eos=PRMIX):
+    constants, correlations = packages(tuple(IDs))
+    eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    gas = CEOSGas(eos, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases)
+    liquid = CEOSLiquid(eos, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases)
+    return FlashVL(constants, correlations, liquid=liquid, gas=gas)
+
+
+@lru_cache(maxsize=None)
+def natural_gas():
+    return cubic_flasher(natural_gas_IDs)
+
+
+@lru_cache(maxsize=None)
+def oil():
+    return cubic_flasher(oil_IDs)
+
+
+@lru_cache(maxsize=None)
+def water_methane_octane():
+    constants, correlations = packages(tuple(water_methane_octane_IDs))
+    kijs = [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0496], [0.0, 0.0496, 0.0]]
+    eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas, kijs=kijs)
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases)
+    liquid = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases)
+    return FlashVLN(constants, correlations, liquids=[liquid, liquid], gas=gas)
+
+
+def UNIFAC_liquid(constants, correlations, T=298.15, xs=None):
+    xs = water_ethanol_zs if xs is None else xs
+    GE = UNIFAC.from_subgroups(T=T, xs=xs, chemgroups=constants.UNIFAC_groups, version=0)
+    return GibbsExcessLiquid(VaporPressures=correlations.VaporPressures,
+                             HeatCapacityGases=correlations.HeatCapacityGases,
+                             VolumeLiquids=correlations.VolumeLiquids,
+                             EnthalpyVaporizations=correlations.EnthalpyVaporizations,
+                             GibbsExcessModel=GE, T=T, P=1e5, zs=xs)
+
+
+@lru_cache(maxsize=None)
+def water_ethanol():
+    constants, correlations = packages(tuple(water_ethanol_IDs))
+    liquid = UNIFAC_liquid(constants, correlations)
+    eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    gas = CEOSGas(IGMIX, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases)
+    return FlashVL(constants, correlations, liquid=liquid, gas=gas)
+
+
+@lru_cache(maxsize=None)
+def steam():
+    liquid = IAPWS95Liquid(T=300.0, P=1e5, zs=[1.0])
+    gas = IAPWS95Gas(T=300.0, P=1e5, zs=[1.0])
+    return FlashPureVLS(iapws_constants, iapws_correlations, gas, [liquid], [])
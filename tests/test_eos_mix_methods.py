@@ -117,4 +117,24 @@ def test_PR_lnphis_fastest():
 
     expect = eos.lnphis_g
     calc = PR_lnphis_fastest(eos.zs, eos.T, eos.P, eos.kijs, False, True, eos.ais, eos.bs, eos.a_alphas, eos.a_alpha_roots, eos.kappas)
-    assert_close(expect, calc, rtol=1e-14)
\ No newline at end of file
+    assert_close(expect, calc, rtol=1e-14)
+
+def test_cubic_lnphis_many():
+    kwargs = dict(Tcs=[190.56400000000002, 305.32, 369.83, 126.2],
+                  Pcs=[4599000.0, 4872000.0, 4248000.0, 3394387.5],
+                  omegas=[0.008, 0.098, 0.152, 0.04],
+                  kijs=[[0.0, -0.0059, 0.0119, 0.0289], [-0.0059, 0.0, 0.0011, 0.0533], [0.0119, 0.0011, 0.0, 0.0878], [0.0289, 0.0533, 0.0878, 0.0]])
+    zs_matrix = [[.1, .2, .3, .4], [.7, .1, .1, .1], [.05, .05, .85, .05]]
+    for eos_class, constants in [(PRMIX, (1.0 + sqrt(2.0), 1.0 - sqrt(2.0), 2.0, -1.0)), (SRKMIX, (1.0, 0.0, 1.0, 0.0))]:
+        eos = eos_class(T=200, P=1e5, zs=zs_matrix[0], **kwargs)
+        a_alpha_ijs = (1.0 - np.array(eos.kijs))*np.outer(eos.a_alpha_roots, eos.a_alpha_roots)
+        calc_l, Vs_l, _ = cubic_lnphis_many(eos.T, eos.P, np.array(zs_matrix), np.array(eos.bs), a_alpha_ijs, *constants, liquid=True)
+        calc_g, Vs_g, _ = cubic_lnphis_many(eos.T, eos.P, np.array(zs_matrix), np.array(eos.bs), a_alpha_ijs, *constants, liquid=False)
+        for i, zs in enumerate(zs_matrix):
+            eos = eos.to(T=200, P=1e5, zs=zs)
+            if hasattr(eos, 'V_l'):
+                assert_close1d(calc_l[i], eos.lnphis_l, rtol=1e-9)
+                assert_close(Vs_l[i], eos.V_l, rtol=1e-12)
+            if hasattr(eos, 'V_g'):
+                assert_close1d(calc_g[i], eos.lnphis_g, rtol=1e-9)
+                assert_close(Vs_g[i], eos.V_g, rtol=1e-12)
@@ -219,3 +219,57 @@ def test_PH_plot():
     assert max_err < 1e-8
 
 #test_PH_plot()
+
+
+def test_iapws95_flash_table_PH(tmpdir):
+    liquid = IAPWS95Liquid(T=300, P=1e5, zs=[1])
+    gas = IAPWS95Gas(T=300, P=1e5, zs=[1])
+    flasher = FlashPureVLS(iapws_constants, iapws_correlations, gas, [liquid], [])
+    ref = FlashPureVLS(iapws_constants, iapws_correlations, gas, [liquid], [])
+    # Spans the critical point, which is not tabulated
+    table = flasher.build_flash_table('P', 'H', 1e5, 3e7, 2000.0, 60000.0,
+                                      fixed_pts=15, spec_pts=15)
+    assert flasher.flash_tables[('P', 'H')] is table
+
+    for P in (1.3e5, 2e6, 9e6, 2.5e7):
+        for H in (4000.0, 25000.0, 48000.0, 55000.0):
+            res = flasher.flash(P=P, H=H)
+            expect = ref.flash(P=P, H=H)
+            assert res.flash_convergence == {'table': True}
+            assert res.phase_count == expect.phase_count
+            assert_close(res.T, expect.T, rtol=2e-3)
+            assert_close(res.H(), H, rtol=2e-2)
+            assert_close(table.value(P, H, 'T'), expect.T, rtol=2e-3)
+            assert_close(table.value(P, H, 'V'), expect.V(), rtol=2e-2)
+            if res.phase_count == 2:
+                assert_close1d(res.betas, expect.betas, atol=5e-3)
+
+    # Near the critical point and outside the table, the flash is solved
+    for P, H in [(2.2e7, 30000.0), (5e4, 30000.0), (1e6, 70000.0)]:
+        assert 'table' not in flasher.flash(P=P, H=H).flash_convergence
+        assert table.state(P, H) is None
+
+    # T-P tables are only for lookups
+    table_TP = flasher.build_flash_table('T', 'P', 300.0, 800.0, 1e5, 1e7,
+                                         fixed_pts=10, spec_pts=10)
+    assert flasher.flash(T=400.0, P=1e6).flash_convergence is None
+    assert_close(table_TP.value(400.0, 1e6, 'H'), ref.flash(T=400.0, P=1e6).H(), rtol=1e-3)
+    assert_close(table_TP.value(600.0, 1e6, 'V'), ref.flash(T=600.0, P=1e6).V(), rtol=1e-3)
+
+    path = str(tmpdir.join('water_PH.npz'))
+    table.save(path)
+    loaded = FlashPureVLS(iapws_constants, iapws_correlations, gas, [liquid], [])
+    loaded_table = loaded.load_flash_table(path)
+    assert_close(loaded_table.value(2e6, 25000.0, 'T'), table.value(2e6, 25000.0, 'T'), rtol=1e-13)
+    assert loaded.flash(P=2e6, H=25000.0).flash_convergence == {'table': True}
+
+    # A table from another model is rejected
+    constants = ChemicalConstantsPackage(Tcs=[647.14], Pcs=[22048320.0], omegas=[0.344], MWs=[18.01528], CASs=['7732-18-5'])
+    correlations = PropertyCorrelationsPackage(constants, skip_missing=True,
+                                               HeatCapacityGases=[HeatCapacityGas(poly_fit=(50.0, 1000.0, [5.543665000518528e-22, -2.403756749600872e-18, 4.2166477594350336e-15, -3.7965208514613565e-12, 1.823547122838406e-09, -4.3747690853614695e-07, 5.437938301211039e-05, -0.003220061088723078, 33.32731489750759]))])
+    eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    other = FlashPureVLS(constants, correlations,
+                         CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases),
+                         [CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases)], [])
+    with pytest.raises(ValueError):
+        other.load_flash_table(path)
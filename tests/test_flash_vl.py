@@ -32,6 +32,27 @@ import os
 import numpy as np
 
 
+def C2_C5_flasher(eos=PRMIX, kijs=None, EnthalpyVaporizations=False):
+    constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0],
+                                         omegas=[0.098, 0.251], MWs=[30.06904, 72.14878],
+                                         CASs=['74-84-0', '109-66-0'])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.115386645067898e-21, -3.2034776773408394e-17, 5.957592282542187e-14, -5.91169369931607e-11, 3.391209091071677e-08, -1.158730780040934e-05, 0.002409311277400987, -0.18906638711444712, 37.94602410497228])),
+                         HeatCapacityGas(poly_fit=(200.0, 1000.0, [7.537198394065234e-22, -4.946850205122326e-18, 1.4223747507170372e-14, -2.3451318313798008e-11, 2.4271676873997662e-08, -1.6055220805830093e-05, 0.006379734000450042, -1.0360272314628292, 141.84695243411866]))]
+    if EnthalpyVaporizations:
+        EnthalpyVaporizations = [EnthalpyVaporization(Tc=Tc, Pc=Pc, omega=omega)
+                                 for Tc, Pc, omega in zip(constants.Tcs, constants.Pcs, constants.omegas)]
+    else:
+        EnthalpyVaporizations = None
+    correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases,
+                                               EnthalpyVaporizations=EnthalpyVaporizations, skip_missing=True)
+    eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    if kijs is not None:
+        eos_kwargs['kijs'] = kijs
+    gas = CEOSGas(eos, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    liq = CEOSLiquid(eos, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    return FlashVL(constants, correlations, liquid=liq, gas=gas)
+
+
 def test_C2_C5_PR():
     T, P = 300, 3e6
     constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0],
@@ -250,3 +271,612 @@ def test_combustion_products():
     res = flasher.flash(T=400.0, P=1e5, zs=zs)
     assert res.phase_count == 1
     assert res.gas is not None
+
+
+def test_grid_flash_workers_same_as_serial():
+    constants = ChemicalConstantsPackage(Tcs=[190.564, 305.32, 126.2], Pcs=[4599000.0, 4872000.0, 3394387.5],
+                                         omegas=[0.008, 0.098, 0.04], MWs=[16.04246, 30.06904, 28.0134],
+                                         CASs=['74-82-8', '74-84-0', '7727-37-9'])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [6.7e-21, -3.0e-17, 5.8e-14, -6.3e-11, 4.2e-08, -1.6e-05, 0.0035, -0.4, 50.0])),
+                         HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.1e-21, -3.3e-17, 6.6e-14, -7.2e-11, 4.5e-08, -1.5e-05, 0.0023, -0.08, 34.0])),
+                         HeatCapacityGas(poly_fit=(50.0, 1000.0, [-6.4e-21, 3.0e-17, -5.9e-14, 6.1e-11, -3.5e-08, 1.1e-05, -0.0017, 0.11, 27.0]))]
+    correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases, skip_missing=True)
+    kijs = [[0.0, -0.0059, 0.0289], [-0.0059, 0.0, 0.0533], [0.0289, 0.0533, 0.0]]
+    eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas, 'kijs': kijs}
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    flasher = FlashVL(constants, correlations, liquid=liq, gas=gas)
+    zs = [0.965, 0.018, 0.017]
+    Ts, Ps = [100.0, 110.0, 120.0, 140.0, 180.0], [1e5, 1e6, 3e6]
+
+    flashes, props = flasher.grid_flash(zs, Ts=Ts, Ps=Ps, props=['H', 'VF'])
+    flashes_par, props_par = flasher.grid_flash(zs, Ts=Ts, Ps=Ps, props=['H', 'VF'], workers=2)
+    assert props == props_par
+    assert len(flashes_par) == len(Ts)
+    for row, row_par in zip(flashes, flashes_par):
+        for state, state_par in zip(row, row_par):
+            assert state_par.flasher is flasher
+            assert state_par.phase_count == state.phase_count
+            assert_close(state_par.H(), state.H(), rtol=1e-13)
+
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+    with ProcessPoolExecutor(2) as executor:
+        Hs = flasher.grid_flash(zs, Ts=Ts, Ps=Ps, props='H', store=False, executor=executor)
+    assert Hs == [[v[0] for v in row] for row in props]
+    # Flashers are not thread-safe
+    with ThreadPoolExecutor(2) as executor:
+        with pytest.raises(ValueError):
+            flasher.grid_flash(zs, Ts=Ts, Ps=Ps, props='H', store=False, executor=executor)
+
+    # Chaining hot starts along each row gives the same answers
+    flashes_hot, props_hot = flasher.grid_flash(zs, Ts=Ts, Ps=Ps, props=['H', 'VF'], hot_start_rows=True)
+    for row, row_hot in zip(props, props_hot):
+        for (H, VF), (H_hot, VF_hot) in zip(row, row_hot):
+            assert_close(H_hot, H, rtol=1e-9)
+            assert_close(VF_hot, VF, atol=1e-9)
+
+def test_flash_batch_PR_same_as_flash():
+    constants = ChemicalConstantsPackage(Tcs=[190.564, 305.32, 126.2], Pcs=[4599000.0, 4872000.0, 3394387.5],
+                                         omegas=[0.008, 0.098, 0.04], MWs=[16.04246, 30.06904, 28.0134],
+                                         CASs=['74-82-8', '74-84-0', '7727-37-9'])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [6.7e-21, -3.0e-17, 5.8e-14, -6.3e-11, 4.2e-08, -1.6e-05, 0.0035, -0.4, 50.0])),
+                         HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.1e-21, -3.3e-17, 6.6e-14, -7.2e-11, 4.5e-08, -1.5e-05, 0.0023, -0.08, 34.0])),
+                         HeatCapacityGas(poly_fit=(50.0, 1000.0, [-6.4e-21, 3.0e-17, -5.9e-14, 6.1e-11, -3.5e-08, 1.1e-05, -0.0017, 0.11, 27.0]))]
+    correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases, skip_missing=True)
+    kijs = [[0.0, -0.0059, 0.0289], [-0.0059, 0.0, 0.0533], [0.0289, 0.0533, 0.0]]
+    eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas, 'kijs': kijs}
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    flasher = FlashVL(constants, correlations, liquid=liq, gas=gas)
+    zs_matrix = np.random.RandomState(0).dirichlet([1.0, 1.0, 1.0], 40)
+    zs_matrix[0] = [0.5, 0.5, 0.0]
+
+    for T, P in [(110.0, 1e5), (150.0, 1e6), (200.0, 3e6), (300.0, 1e5)]:
+        res = flasher.flash_batch(zs_matrix, T=T, P=P)
+        assert res['batched'].all()
+        for i, zs in enumerate(zs_matrix):
+            state = flasher.flash(T=T, P=P, zs=zs.tolist())
+            assert res['phase_count'][i] == state.phase_count
+            if state.gas is None:
+                assert res['gas_beta'][i] == 0.0
+                assert np.isnan(res['gas_zs'][i]).all()
+            else:
+                assert_close(res['gas_beta'][i], state.gas_beta, atol=1e-7)
+                assert_close1d(res['gas_zs'][i], state.gas.zs, atol=1e-7)
+            for j, liquid in enumerate(state.liquids):
+                assert_close(res['liquids_betas'][i, j], state.liquids_betas[j], atol=1e-7)
+                assert_close1d(res['liquids_zs'][i, j], liquid.zs, atol=1e-7)
+            rebuilt = res[i]
+            assert [type(p) for p in rebuilt.phases] == [type(p) for p in state.phases]
+            assert_close(rebuilt.H(), state.H(), rtol=1e-6, atol=1e-6)
+
+    # Feeds the array path does not converge are flashed one at a time
+    flasher.FLASH_BATCH_SS_MAXITER = 0
+    res = flasher.flash_batch(zs_matrix, T=150.0, P=1e6)
+    split = res['phase_count'] == 2
+    assert split.any() and not res['batched'][split].any()
+    for i in np.nonzero(split)[0]:
+        assert res['gas_beta'][i] == flasher.flash(T=150.0, P=1e6, zs=zs_matrix[i].tolist()).gas_beta
+
+
+def test_grid_flash_table():
+    constants = ChemicalConstantsPackage(Tcs=[190.564, 305.32, 126.2], Pcs=[4599000.0, 4872000.0, 3394387.5],
+                                         omegas=[0.008, 0.098, 0.04], MWs=[16.04246, 30.06904, 28.0134],
+                                         CASs=['74-82-8', '74-84-0', '7727-37-9'])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [6.7e-21, -3.0e-17, 5.8e-14, -6.3e-11, 4.2e-08, -1.6e-05, 0.0035, -0.4, 50.0])),
+                         HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.1e-21, -3.3e-17, 6.6e-14, -7.2e-11, 4.5e-08, -1.5e-05, 0.0023, -0.08, 34.0])),
+                         HeatCapacityGas(poly_fit=(50.0, 1000.0, [-6.4e-21, 3.0e-17, -5.9e-14, 6.1e-11, -3.5e-08, 1.1e-05, -0.0017, 0.11, 27.0]))]
+    correlations = PropertyCorrelationsPackage(constants, HeatCapacityGases=HeatCapacityGases, skip_missing=True)
+    eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas}
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    flasher = FlashVL(constants, correlations, liquid=liq, gas=gas)
+    zs = [0.965, 0.018, 0.017]
+    Ts, Ps = [100.0, 120.0, 150.0, 200.0], [1e5, 1e6, 3e6]
+
+    flashes, props = flasher.grid_flash(zs, Ts=Ts, Ps=Ps, props=['H', 'VF'])
+    table = flasher.grid_flash(zs, Ts=Ts, Ps=Ps, props=['H', 'VF'], table=True)
+    assert table.shape == (4, 3)
+    assert len(table) == 12
+    assert_close2d(table['H'], [[v[0] for v in row] for row in props], rtol=1e-13)
+    assert_close2d(table['VF'], [[v[1] for v in row] for row in props], rtol=1e-13)
+    assert table['liquids_zs'].shape == (4, 3, 2, 3)
+    for i, row in enumerate(flashes):
+        for j, state in enumerate(row):
+            rebuilt = table[i, j]
+            assert table[i*3 + j].phase_count == state.phase_count
+            assert rebuilt.flasher is flasher
+            assert rebuilt.phase_count == state.phase_count
+            assert_close(rebuilt.H(), state.H(), rtol=1e-9)
+            assert_close1d(rebuilt.betas, state.betas, rtol=1e-12)
+
+    table_par = flasher.grid_flash(zs, Ts=Ts, Ps=Ps, props=['H', 'VF'], table=True, workers=2)
+    assert np.array_equal(table_par['H'], table['H'])
+    assert np.array_equal(table_par.phase_zs, table.phase_zs, equal_nan=True)
+    assert table_par[3, 0].flasher is flasher
+
+    # Specifications other than T and P are kept as columns
+    table = flasher.grid_flash(zs, Ps=[1e5, 1e6], Hs=[-5000.0, 1000.0], props='T', table=True)
+    assert_close2d(table['H'], [[-5000.0, 1000.0]]*2)
+    assert_close(table[1, 0].H(), -5000.0, rtol=1e-7)
+    assert table[1, 0].flash_specs == {'zs': zs, 'P': 1e6, 'H': -5000.0}
+
+def test_grid_flash_table_same_liquid_twice():
+    constants = ChemicalConstantsPackage(Tcs=[508.1, 536.2, 512.5], Pcs=[4700000.0, 5330000.0, 8084000.0], omegas=[0.309, 0.21600000000000003, 0.5589999999999999],
+                                         MWs=[58.07914, 119.37764000000001, 32.04186], CASs=['67-64-1', '67-66-3', '67-56-1'], names=['acetone', 'chloroform', 'methanol'])
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(200.0, 1000.0, [-1.3320002425347943e-21, 6.4063345232664645e-18, -1.251025808150141e-14, 1.2265314167534311e-11, -5.535306305509636e-09, -4.32538332013644e-08, 0.0010438724775716248, -0.19650919978971002, 63.84239495676709])),
+     HeatCapacityGas(poly_fit=(200.0, 1000.0, [1.5389278550737367e-21, -8.289631533963465e-18, 1.9149760160518977e-14, -2.470836671137373e-11, 1.9355882067011222e-08, -9.265600540761629e-06, 0.0024825718663005762, -0.21617464276832307, 48.149539665907696])),
+     HeatCapacityGas(poly_fit=(50.0, 1000.0, [2.3511458696647882e-21, -9.223721411371584e-18, 1.3574178156001128e-14, -8.311274917169928e-12, 4.601738891380102e-10, 1.78316202142183e-06, -0.0007052056417063217, 0.13263597297874355, 28.44324970462924]))]
+    VolumeLiquids = [VolumeLiquid(poly_fit=(178.51, 498.1, [6.564241965071999e-23, -1.6568522275506375e-19, 1.800261692081815e-16, -1.0988731296761538e-13, 4.118691518070104e-11, -9.701938804617744e-09, 1.4022905458596618e-06, -0.00011362923883050033, 0.0040109650220160956])),
+                    VolumeLiquid(poly_fit=(209.63, 509.5799999999999, [2.034047306563089e-23, -5.45567626310959e-20, 6.331811062990084e-17, -4.149759318710192e-14, 1.6788970104955462e-11, -4.291900093120011e-09, 6.769385838271721e-07, -6.0166473220815445e-05, 0.0023740769479069054])),
+                    VolumeLiquid(poly_fit=(175.7, 502.5, [3.5725079384600736e-23, -9.031033742820083e-20, 9.819637959370411e-17, -5.993173551565636e-14, 2.2442465416964825e-11, -5.27776114586072e-09, 7.610461006178106e-07, -6.148574498547711e-05, 0.00216398089328537])),]
+    VaporPressures = [VaporPressure(poly_fit=(178.51, 508.09000000000003, [-1.3233111115238975e-19, 4.2217134794609376e-16, -5.861832547132719e-13, 4.6488594950801467e-10, -2.3199079844570237e-07, 7.548290741523459e-05, -0.015966705328994194, 2.093003523977292, -125.39006100979816])),
+                      VaporPressure(poly_fit=(207.15, 536.4, [-8.714046553871422e-20, 2.910491615051279e-16, -4.2588796020294357e-13, 3.580003116042944e-10, -1.902612144361103e-07, 6.614096470077095e-05, -0.01494801055978542, 2.079082613726621, -130.24643185169472])),
+                      VaporPressure(poly_fit=(175.7, 512.49, [-1.446088049406911e-19, 4.565038519454878e-16, -6.278051259204248e-13, 4.935674274379539e-10, -2.443464113936029e-07, 7.893819658700523e-05, -0.016615779444332356, 2.1842496316772264, -134.19766175812708]))]
+    liquid = GibbsExcessLiquid(VaporPressures=VaporPressures, VolumeLiquids=VolumeLiquids,
+                               HeatCapacityGases=HeatCapacityGases)
+    correlations = PropertyCorrelationsPackage(constants=constants, skip_missing=True, HeatCapacityGases=HeatCapacityGases,
+                                               VolumeLiquids=VolumeLiquids, VaporPressures=VaporPressures)
+    gas = IdealGas(HeatCapacityGases=HeatCapacityGases)
+    # GibbsExcessLiquid has no model_hash of its own, so the table has to
+    # recognize the shared liquid model by identity
+    flashN = FlashVLN(constants, correlations, liquids=[liquid, liquid], gas=gas)
+    zs = [0.2, 0.3, 0.5]
+    Ts, Ps = [300.0, 340.0, 380.0], [1e4, 1e5]
+
+    flashes = flashN.grid_flash(zs, Ts=Ts, Ps=Ps)
+    table = flashN.grid_flash(zs, Ts=Ts, Ps=Ps, table=True)
+    liquid_points = 0
+    for i, row in enumerate(flashes):
+        for j, state in enumerate(row):
+            rebuilt = table[i, j]
+            assert rebuilt.phase_count == state.phase_count
+            assert_close(rebuilt.H(), state.H(), rtol=1e-9)
+            assert_close1d(rebuilt.betas, state.betas, rtol=1e-12)
+            liquid_points += len(state.liquids)
+    assert liquid_points > 0
+
+
+def test_flash_cache():
+    flasher = C2_C5_flasher()
+    assert flasher.flash_cache_info() == {'hits': 0, 'misses': 0, 'maxsize': 0, 'currsize': 0}
+    res = flasher.flash(T=300.0, P=1e6, zs=[0.5, 0.5])
+    assert flasher.flash(T=300.0, P=1e6, zs=[0.5, 0.5]) is not res
+
+    flasher.FLASH_CACHE_SIZE = 2
+    res = flasher.flash(T=300.0, P=1e6, zs=[0.5, 0.5])
+    # Hits are copies of the cached state sharing its phases, so setting an
+    # attribute on one result does not change the others
+    res.note = 'first'
+    hit = flasher.flash(T=300.0, P=1e6*(1.0 + 1e-14), zs=[0.5, 0.5])
+    assert hit is not res and hit.phases == res.phases
+    assert not hasattr(hit, 'note')
+    hit.note = 'second'
+    assert not hasattr(flasher.flash(T=300.0, P=1e6, zs=[0.5, 0.5]), 'note')
+    assert flasher.flash(T=300.0, P=1e6*(1.0 + 1e-9), zs=[0.5, 0.5]).phases != res.phases
+    assert flasher.flash(T=300.0, P=1e6, zs=[0.5, 0.5], dest=EquilibriumState).phases != res.phases
+    # A PH flash of the same point is a different key
+    res_PH = flasher.flash(H=res.H(), P=1e6, zs=[0.5, 0.5])
+    assert res_PH.phases != res.phases
+    assert_close(res_PH.T, 300.0)
+    assert flasher.flash_cache_info() == {'hits': 2, 'misses': 3, 'maxsize': 2, 'currsize': 2}
+    # The least recently used result was evicted
+    assert flasher.flash(T=300.0, P=1e6, zs=[0.5, 0.5]).phases != res.phases
+
+    flasher.flash_cache_clear()
+    assert flasher.flash_cache_info()['currsize'] == 0
+
+    # Phases without a model hash are keyed by a token which survives pickling
+    import pickle
+    from thermo.flash import Flash
+    ideal = IdealGas(HeatCapacityGases=flasher.gas.HeatCapacityGases)
+    key = Flash._flash_cache_phase_key(ideal)
+    assert Flash._flash_cache_phase_key(pickle.loads(pickle.dumps(ideal))) == key
+    assert Flash._flash_cache_phase_key(IdealGas(HeatCapacityGases=flasher.gas.HeatCapacityGases)) != key
+
+
+def test_FlashTracker_PR():
+    flasher = C2_C5_flasher()
+    zs = [0.5, 0.5]
+
+    # Heat a liquid across the bubble point at constant pressure; the gas
+    # appearing is noticed by the stability test of the tracked liquid, or
+    # by the confirmation flash
+    H0 = flasher.flash(T=250.0, P=1e6, zs=zs).H()
+    for check_stability in (False, True):
+        tracker = FlashTracker(flasher, check_stability=check_stability)
+        for i in range(12):
+            H = H0 + 800.0*i
+            res = tracker.flash('drum', P=1e6, H=H, zs=zs)
+            expect = flasher.flash(P=1e6, H=H, zs=zs)
+            assert res.phase_count == expect.phase_count
+            assert_close(res.T, expect.T, rtol=1e-7)
+            assert_close(res.H(), H, rtol=1e-7)
+            assert_close1d(res.betas, expect.betas, rtol=1e-5)
+        # Only the first flash and the appearance of the gas needed a full flash
+        assert tracker.full_count == 2
+        assert tracker.tracked_count == 10
+        assert res.flash_convergence['tracked']
+        assert res.flash_specs == {'zs': zs, 'P': 1e6, 'H': H}
+
+    # Smaller steps just past the bubble point
+    bubble = flasher.flash(P=1e6, VF=0.0, zs=zs)
+    fine = FlashTracker(flasher)
+    fine.flash('drum', P=1e6, H=bubble.H() - 300.0, zs=zs)
+    res = fine.flash('drum', P=1e6, H=bubble.H() + 100.0, zs=zs)
+    assert res.phase_count == 2
+    assert fine.full_count == 2
+
+    # Without the stability check, two phase states are tracked with no
+    # full flash at all
+    fast = FlashTracker(flasher)
+    assert not fast.check_stability
+    fast.states['drum'] = res
+    flash_calls = []
+    flash = flasher.flash
+    flasher.flash = lambda *args, **kwargs: flash_calls.append(kwargs) or flash(*args, **kwargs)
+    try:
+        fast_res = fast.flash('drum', P=1e6, H=H + 100.0, zs=zs)
+    finally:
+        del flasher.flash
+    assert not flash_calls and fast.tracked_count == 1
+    assert_close(fast_res.T, flasher.flash(P=1e6, H=H + 100.0, zs=zs).T, rtol=1e-7)
+
+    # Tracking starts from any stored state
+    state = flasher.flash(T=400.0, P=1e6, zs=zs)
+    tracker.states['vessel'] = state
+    res = tracker.flash('vessel', V=state.V()*1.01, U=state.U() + 10.0, zs=zs)
+    assert res.flash_convergence['tracked']
+    assert_close(res.V(), state.V()*1.01)
+    assert_close(res.U(), state.U() + 10.0)
+    assert res.gas is not None
+
+    # A composition change is flashed fully
+    tracker.flash('vessel', T=400.0, P=1e6, zs=[0.6, 0.4])
+    assert tracker.full_count == 3
+    tracker.forget('vessel')
+    assert 'vessel' not in tracker.states
+
+
+def test_flash_TP_cubic_kernel_same_as_stability_test():
+    for eos in (PRMIX, SRKMIX):
+        flasher = C2_C5_flasher(eos, kijs=[[0.0, 0.01], [0.01, 0.0]])
+        assert flasher.cubic_kernel_constants is not None
+        # The kernel skips the stability test so it is opt-in
+        assert not flasher.PT_CUBIC_KERNEL
+        flasher.PT_CUBIC_KERNEL = True
+        flasher_ref = C2_C5_flasher(eos, kijs=[[0.0, 0.01], [0.01, 0.0]])
+
+        two_phase = 0
+        for T in linspace(200.0, 400.0, 6):
+            for P in (1e5, 1e6, 3e6):
+                for z in (0.1, 0.5, 0.9):
+                    zs = [z, 1.0 - z]
+                    res = flasher.flash(T=T, P=P, zs=zs)
+                    expect = flasher_ref.flash(T=T, P=P, zs=zs)
+                    assert res.phase_count == expect.phase_count
+                    assert (res.gas is None) == (expect.gas is None)
+                    assert_close(res.G(), expect.G(), rtol=1e-9)
+                    if res.phase_count == 2:
+                        two_phase += 1
+                        # Both are converged to the same sequential substitution tolerance
+                        assert_close1d(res.betas, expect.betas, rtol=1e-5)
+                        assert_close1d(res.gas.zs, expect.gas.zs, rtol=1e-5)
+                        assert res.flash_convergence['stab_info'] is None
+        assert two_phase > 5
+
+    # Other models use the stability test
+    flasher = C2_C5_flasher(PRMIX)
+    liq = C2_C5_flasher(SRKMIX).liquid
+    assert FlashVL(flasher.constants, flasher.correlations, liquid=liq, gas=flasher.gas).cubic_kernel_constants is None
+
+
+def test_build_VF_envelope_PR():
+    flasher = C2_C5_flasher()
+    flasher_ref = C2_C5_flasher()
+    zs = [0.7, 0.3]
+
+    envelope = flasher.build_VF_envelope(zs)
+    assert flasher.VF_envelopes[(0.7, 0.3)] is envelope
+    assert flasher_ref.VF_envelopes is None
+
+    T_max, P_at_T_max = envelope.cricondentherm
+    T_at_P_max, P_max = envelope.cricondenbar
+    assert T_max >= max(envelope.dew_Ts + envelope.bubble_Ts)
+    assert P_max == max(envelope.dew_Ps + envelope.bubble_Ps)
+    assert_close(T_max, 397.64, rtol=1e-3)
+    assert_close(P_at_T_max, 5.63e6, rtol=2e-2)
+
+    for P in (2e5, 1e6, 3e6, 5e6):
+        for VF in (0.0, 1.0):
+            res = flasher.flash(P=P, VF=VF, zs=zs)
+            expect = flasher_ref.flash(P=P, VF=VF, zs=zs)
+            assert_close(res.T, expect.T, rtol=1e-9)
+            assert_close(envelope.T_guess(P, VF)[0], res.T, rtol=1e-3)
+            assert res.flash_convergence['iterations'] <= expect.flash_convergence['iterations']
+
+    for T in (250.0, 300.0, 350.0):
+        for VF in (0.0, 1.0):
+            if envelope.P_guess(T, VF) is None:
+                continue
+            res = flasher.flash(T=T, VF=VF, zs=zs)
+            expect = flasher_ref.flash(T=T, VF=VF, zs=zs)
+            assert_close(res.P, expect.P, rtol=1e-9)
+            assert res.flash_convergence['iterations'] <= expect.flash_convergence['iterations']
+
+    # Outside the traced curves there is nothing to interpolate
+    assert envelope.T_guess(1e3, 1.0) is None
+    assert envelope.T_guess(2e7, 0.0) is None
+    assert envelope.P_guess(500.0, 1.0) is None
+
+
+def test_trace_phase_envelope_PR():
+    flasher = C2_C5_flasher()
+    flasher_ref = C2_C5_flasher()
+    zs = [0.7, 0.3]
+
+    start = flasher_ref.flash(P=1e5, VF=0.0, zs=zs)
+    Ts, Ps, betas, comps, critical_point, cricondenbar, cricondentherm, iterations = phase_envelope_continuation(
+        zs, flasher.liquid, flasher.gas, start.T, 1e5, start.gas.zs)
+    # One pass through the critical point
+    assert betas[0] == 0.0 and betas[-1] == 1.0
+    assert betas == sorted(betas)
+    assert Ps[-1] < 1e5
+    assert iterations < 300
+
+    T_c, P_c = critical_point
+    assert_close(T_c, 388.48, rtol=1e-3)
+    assert_close(P_c, 6.6745e6, rtol=1e-3)
+    T_at_P_max, P_max = cricondenbar
+    T_max, P_at_T_max = cricondentherm
+    assert P_c <= P_max and P_max >= max(Ps)
+    assert T_max >= max(Ts)
+    assert_close(T_max, 397.64, rtol=1e-3)
+    assert_close(P_at_T_max, 5.63e6, rtol=2e-2)
+
+    # Points on the trace are bubble and dew points
+    for i in range(0, len(Ts), 5):
+        if Ps[i] > 6e6:
+            continue
+        res = flasher_ref.flash(P=Ps[i], VF=betas[i], zs=zs)
+        assert_close(res.T, Ts[i], rtol=1e-7)
+
+    envelope = flasher.trace_phase_envelope(zs)
+    assert flasher.VF_envelopes[(0.7, 0.3)] is envelope
+    assert envelope.critical_point == critical_point
+    assert envelope.cricondenbar == cricondenbar
+    assert envelope.cricondentherm == cricondentherm
+    for P in (2e5, 1e6, 3e6, 5e6):
+        for VF in (0.0, 1.0):
+            res = flasher.flash(P=P, VF=VF, zs=zs)
+            expect = flasher_ref.flash(P=P, VF=VF, zs=zs)
+            assert_close(res.T, expect.T, rtol=1e-9)
+            assert_close(envelope.T_guess(P, VF)[0], res.T, rtol=1e-3)
+
+
+def test_flash_TPV_HSGUA_strategy_no_1P_presolve():
+    flasher = C2_C5_flasher()
+    zs = [0.5, 0.5]
+
+    calls = []
+    solve_1P = thermo.flash.solve_PTV_HSGUA_1P
+    def counting_solve_1P(*args, **kwargs):
+        calls.append(args)
+        return solve_1P(*args, **kwargs)
+    thermo.flash.solve_PTV_HSGUA_1P = counting_solve_1P
+    try:
+        for T in (250.0, 300.0, 400.0):
+            state = flasher.flash(T=T, P=1e6, zs=zs)
+            for spec in ('H', 'S'):
+                res = flasher.flash(P=1e6, zs=zs, **{spec: state.value(spec)})
+                assert_close(res.T, T, rtol=1e-6)
+                assert res.flash_convergence['strategy'] == 'bisect'
+        assert calls == []
+
+        # The one phase solutions are only computed when the multiphase solvers fail
+        def fail(*args, **kwargs):
+            raise ValueError("Failed")
+        flasher.solve_PT_HSGUA_NP_guess_bisect = fail
+        flasher.solve_PT_HSGUA_NP_guess_newton_2P = fail
+        state = flasher.flash(T=400.0, P=1e6, zs=zs)
+        res = flasher.flash(P=1e6, H=state.H(), zs=zs)
+        assert res.flash_convergence['strategy'] == '1P'
+        assert len(calls) == len(flasher.unique_phases)
+        assert_close(res.T, 400.0, rtol=1e-6)
+        assert res.gas is not None
+    finally:
+        thermo.flash.solve_PTV_HSGUA_1P = solve_1P
+
+
+def test_flash_strategy_stages():
+    zs = [0.5, 0.5]
+    flasher = C2_C5_flasher(EnthalpyVaporizations=True)
+    flasher.PT_CUBIC_KERNEL = False
+    ref = flasher.flash(T=300.0, P=1e6, zs=zs)
+    assert ref.flash_convergence['strategy'] == thermo.flash.PT_SS
+
+    # Three iterations of SS are not enough; the next stage converges
+    flasher.PT_2P_STAGES = [(thermo.flash.PT_SS, 3, None), (thermo.flash.PT_SS_GDEM3, None, None)]
+    res = flasher.flash(T=300.0, P=1e6, zs=zs)
+    assert res.flash_convergence['strategy'] == thermo.flash.PT_SS_GDEM3
+    assert_close(res.VF, ref.VF, rtol=1e-6)
+    assert_close1d(res.liquid0.zs, ref.liquid0.zs, rtol=1e-6)
+    assert_close1d(res.gas.zs, ref.gas.zs, rtol=1e-6)
+
+    for method in (thermo.flash.PT_SS_MEHRA, thermo.flash.PT_NEWTON_lNKVF):
+        flasher.PT_2P_STAGES = [(method, None, None)]
+        res = flasher.flash(T=300.0, P=1e6, zs=zs)
+        assert res.flash_convergence['strategy'] == method
+        assert_close(res.VF, ref.VF, rtol=1e-5)
+    flasher.PT_2P_STAGES = [(thermo.flash.PT_SS, 3, None)]
+    with pytest.raises(Exception):
+        flasher.flash(T=300.0, P=1e6, zs=zs)
+
+    # Stage order for a specific pair of specifications
+    flasher = C2_C5_flasher(EnthalpyVaporizations=True)
+    flasher.TPV_HSGUA_SPEC_STAGES = {('P', 'H'): [(thermo.flash.HSGUA_NEWTON_2P, None, None)]}
+    res = flasher.flash(P=1e6, H=ref.H(), zs=zs)
+    assert res.flash_convergence['strategy'] == thermo.flash.HSGUA_NEWTON_2P
+    assert_close(res.T, 300.0, rtol=1e-7)
+    assert_close(res.VF, ref.VF, rtol=1e-6)
+    res = flasher.flash(P=1e6, S=ref.S(), zs=zs)
+    assert res.flash_convergence['strategy'] == thermo.flash.HSGUA_BISECT
+    assert_close(res.T, 300.0, rtol=1e-6)
+
+
+def test_flash_statistics_reorder_stages():
+    flasher = C2_C5_flasher()
+    zs = [0.5, 0.5]
+    flasher.PT_CUBIC_KERNEL = False
+    flasher.PT_2P_STAGES = [(thermo.flash.PT_SS, 3, None), (thermo.flash.PT_SS_GDEM3, None, None)]
+    stats = flasher.statistics = FlashStatistics(min_attempts=3)
+
+    region = stats.region(flasher.constants, zs, T=300.0, P=1e6)
+    for i in range(3):
+        res = flasher.flash(T=300.0 + 0.1*i, P=1e6, zs=zs)
+        assert res.flash_convergence['strategy'] == thermo.flash.PT_SS_GDEM3
+    summary = stats.summary()
+    assert summary[('TP', region, thermo.flash.PT_SS)]['success_rate'] == 0.0
+    assert summary[('TP', region, thermo.flash.PT_SS)]['attempts'] == 3
+    assert summary[('TP', region, thermo.flash.PT_SS_GDEM3)]['success_rate'] == 1.0
+    assert summary[('TP', region, thermo.flash.PT_SS_GDEM3)]['iterations'] > 3
+
+    # The failing stage is moved last and not attempted while the other succeeds
+    assert stats.order('TP', region, flasher.PT_2P_STAGES) == [(thermo.flash.PT_SS_GDEM3, None, None),
+                                                                (thermo.flash.PT_SS, 3, None)]
+    res = flasher.flash(T=300.3, P=1e6, zs=zs)
+    assert res.flash_convergence['strategy'] == thermo.flash.PT_SS_GDEM3
+    assert stats.records[('TP', region, thermo.flash.PT_SS)][0] == 3
+
+    # When the preferred stage fails, the skipped stage is still attempted
+    # and its record updated
+    flasher.PT_2P_STAGES = [(thermo.flash.PT_SS, None, None), (thermo.flash.PT_SS_GDEM3, 1, None)]
+    res = flasher.flash(T=300.4, P=1e6, zs=zs)
+    assert res.flash_convergence['strategy'] == thermo.flash.PT_SS
+    assert stats.records[('TP', region, thermo.flash.PT_SS)][:2] == [4, 1]
+    assert stats.records[('TP', region, thermo.flash.PT_SS_GDEM3)][:2] == [5, 4]
+
+    # Other regions keep the configured order
+    other = stats.region(flasher.constants, zs, T=260.0, P=1e6)
+    assert other != region
+    assert stats.order('TP', other, flasher.PT_2P_STAGES) == flasher.PT_2P_STAGES
+
+    # The faster of two successful stages is moved first
+    stats.records[('PH', (None, 1), 'bisect')] = [5, 5, 50, 0.5]
+    stats.records[('PH', (None, 1), 'newton_2P')] = [5, 5, 25, 0.05]
+    order = stats.order('PH', (None, 1), flasher.TPV_HSGUA_STAGES)
+    assert [stage[0] for stage in order] == ['newton_2P', 'bisect', '1P']
+
+
+def test_flash_profiler(tmpdir):
+    flasher = C2_C5_flasher()
+    flasher.PT_CUBIC_KERNEL = False
+    zs = [0.5, 0.5]
+    original_flash, original_lnphis = thermo.flash.Flash.__dict__['flash'], CEOSGas.__dict__['lnphis_at_zs']
+
+    with FlashProfiler() as profiler:
+        res = flasher.flash(T=300.0, P=1e6, zs=zs)
+        res_PH = flasher.flash(P=1e6, H=res.H(), zs=zs)
+    assert thermo.flash.Flash.__dict__['flash'] is original_flash
+    assert CEOSGas.__dict__['lnphis_at_zs'] is original_lnphis
+    assert thermo.flash.identify_sort_phases is thermo.phase_identification.identify_sort_phases
+
+    # The TP flashes of the PH flash are not reported separately
+    assert len(profiler.flashes) == 2
+    assert profiler.flashes[0]['specs'] == {'T': 300.0, 'P': 1e6}
+    assert profiler.flashes[0]['iterations'] == res.flash_convergence['iterations']
+    assert profiler.flashes[1]['iterations'] == res_PH.flash_convergence['iterations']
+
+    summary = profiler.summary()
+    assert summary['Flash.flash']['calls'] > 2
+    assert summary['FlashVL.stability_test_Michelsen']['calls'] >= 2
+    assert summary['EquilibriumState.__init__']['calls'] == summary['Flash.flash']['calls']
+    assert summary['GCEOS.volume_solutions']['calls'] > 0
+    assert summary['CEOSGas.lnphis_at_zs']['calls'] > 0
+    for name, record in summary.items():
+        assert record['self_time'] <= record['time']
+    total = sum(flash['time'] for flash in profiler.flashes)
+    assert_close(summary['Flash.flash']['time'], total, rtol=1e-9)
+
+    path = os.path.join(str(tmpdir), 'flash.folded')
+    profiler.save(path)
+    lines = open(path).read().splitlines()
+    assert len(lines) == len(profiler.stacks)
+    for line in lines:
+        stack, microseconds = line.rsplit(' ', 1)
+        assert stack.split(';')[0] == 'Flash.flash'
+        int(microseconds)
+    with FlashProfiler() as profiler:
+        pass
+    assert profiler.stacks == {}
+
+    # Nested profilers both record the calls made while they are active,
+    # and the methods are restored only when the outer one exits
+    with FlashProfiler() as outer:
+        flasher.flash(T=300.0, P=1e6, zs=zs)
+        with FlashProfiler() as inner:
+            flasher.flash(T=310.0, P=1e6, zs=zs)
+        assert thermo.flash.Flash.__dict__['flash'] is not original_flash
+    assert thermo.flash.Flash.__dict__['flash'] is original_flash
+    assert len(outer.flashes) == 2 and len(inner.flashes) == 1
+    assert outer.flashes[1]['specs'] == inner.flashes[0]['specs'] == {'T': 310.0, 'P': 1e6}
+
+    # Calls made by other threads are not recorded
+    import threading
+    with FlashProfiler() as profiler:
+        thread = threading.Thread(target=flasher.flash, kwargs={'T': 300.0, 'P': 1e6, 'zs': zs})
+        thread.start()
+        thread.join()
+    assert profiler.flashes == []
+
+    # Memoized phase methods are left alone so their values can be found
+    from thermo.phases import GibbsExcessLiquid
+    original_Psats = GibbsExcessLiquid.__dict__['Psats']
+    FlashProfiler.phase_methods += ('Psats',)
+    try:
+        with FlashProfiler():
+            assert GibbsExcessLiquid.__dict__['Psats'] is original_Psats
+    finally:
+        FlashProfiler.phase_methods = FlashProfiler.phase_methods[:-1]
+
+
+def test_flash_table_TP(tmpdir):
+    flasher = C2_C5_flasher()
+    zs = [0.5, 0.5]
+
+    Ps = np.logspace(5, 6, 8)
+    Ts = np.linspace(420.0, 500.0, 9)
+    table = FlashTable.from_flasher(flasher, zs, 'P', Ps, 'T', Ts)
+    assert table.data.shape == (len(table.props), 8, 9)
+    assert table.props[-2:] == ['beta_gas', 'beta_liquid0']
+    assert table.metadata['CASs'] == ['74-84-0', '109-66-0']
+
+    # Nodes are the flashes themselves
+    res = flasher.flash(T=Ts[3], P=Ps[2], zs=zs)
+    assert_close(table.value('H', Ps[2], Ts[3]), res.H(), rtol=1e-12)
+    assert_close(table.value('rho_mass', Ps[2], Ts[3]), res.rho_mass(), rtol=1e-12)
+    assert table.value('beta_gas', Ps[2], Ts[3]) == 1.0
+
+    # All gas; interpolation between nodes
+    res = flasher.flash(T=455.0, P=3.3e5, zs=zs)
+    assert_close(table.value('H', 3.3e5, 455.0), res.H(), rtol=1e-3)
+    assert_close(table.value('H', 3.3e5, 455.0, method='cubic'), res.H(), rtol=1e-5)
+    assert_close(table.value('S', 3.3e5, 455.0, method='cubic'), res.S(), rtol=1e-5)
+    many = table.value('H', np.array([3.3e5, 3.3e5]), np.array([455.0, 1000.0]))
+    assert_close(many[0], table.value('H', 3.3e5, 455.0), rtol=1e-14)
+    assert np.isnan(many[1])
+    with pytest.raises(ValueError):
+        table.value('k', 3.3e5, 455.0, method='unknown')
+
+    path = os.path.join(str(tmpdir), 'table.npz')
+    table.save(path)
+    for mmap in (False, True):
+        loaded = FlashTable.load(path, mmap=mmap)
+        assert isinstance(loaded.data, np.memmap) == mmap
+        assert np.array_equal(np.asarray(loaded.data), table.data, equal_nan=True)
+        assert loaded.props == table.props
+        assert loaded.metadata == table.metadata
+        assert_close(loaded.value('H', 3.3e5, 455.0), table.value('H', 3.3e5, 455.0), rtol=1e-15)
+
+    parallel = FlashTable.from_flasher(flasher, zs, 'P', Ps[:2], 'T', Ts, workers=2)
+    assert np.array_equal(parallel.data, table.data[:, :2], equal_nan=True)
@@ -156,6 +156,123 @@ def test_water_C1_C8():
 
 
 
+def test_water_C1_C8_newton_NP():
+    T = 298.15
+    P = 101325.0
+    omegas = [0.344, 0.008, 0.394]
+    Tcs = [647.14, 190.564, 568.7]
+    Pcs = [22048320.0, 4599000.0, 2490000.0]
+    kijs=[[0,0, 0],[0,0, 0.0496], [0,0.0496,0]]
+    zs = [1.0/3.0]*3
+
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [5.543665000518528e-22, -2.403756749600872e-18, 4.2166477594350336e-15, -3.7965208514613565e-12, 1.823547122838406e-09, -4.3747690853614695e-07, 5.437938301211039e-05, -0.003220061088723078, 33.32731489750759])),
+                         HeatCapacityGas(poly_fit=(50.0, 1000.0, [6.7703235945157e-22, -2.496905487234175e-18, 3.141019468969792e-15, -8.82689677472949e-13, -1.3709202525543862e-09, 1.232839237674241e-06, -0.0002832018460361874, 0.022944239587055416, 32.67333514157593])),
+                         HeatCapacityGas(poly_fit=(200.0, 1000.0, [-1.069661592422583e-22, -1.2992882995593864e-18, 8.808066659263286e-15, -2.1690080247294972e-11, 2.8519221306107026e-08, -2.187775092823544e-05, 0.009432620102532702, -1.5719488702446165, 217.60587499269303]))]
+    constants = ChemicalConstantsPackage(Tcs=Tcs, Pcs=Pcs, omegas=omegas, MWs=[18.01528, 16.04246, 114.22852],
+                                         CASs=['7732-18-5', '74-82-8', '111-65-9'])
+    properties = PropertyCorrelationsPackage(constants=constants, HeatCapacityGases=HeatCapacityGases)
+    eos_kwargs = dict(Tcs=Tcs, Pcs=Pcs, omegas=omegas, kijs=kijs)
+
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases, T=T, P=P, zs=zs)
+    liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases, T=T, P=P, zs=zs)
+
+    flashN = FlashVLN(constants, properties, liquids=[liq, liq], gas=gas)
+    flashN.NP_NEWTON = False
+    res_SS = flashN.flash(T=T, P=P, zs=zs)
+    flashN.NP_NEWTON = True
+    res = flashN.flash(T=T, P=P, zs=zs)
+    assert res.phase_count == 3
+    assert_close1d(res.betas, res_SS.betas, rtol=1e-7)
+    assert_close1d(res.water_phase.zs, res_SS.water_phase.zs, rtol=1e-7)
+    assert_close1d(res.gas.zs, res_SS.gas.zs, rtol=1e-7)
+    assert res.flash_convergence['iterations'] <= res_SS.flash_convergence['iterations']
+    assert res.flash_convergence['err'] < 1e-15
+
+    # Direct call from a rough guess - the switch to Newton converges quickly
+    comps = [[0.03, 0.95, 0.02], [0.999, 1e-6, 1e-5], [0.01, 0.01, 0.98]]
+    betas, compositions, phases, iterations, err = newton_equilibrium_NP(T, P, zs, comps, [0.35, 0.3, 0.35], [gas, liq, liq])
+    assert err < 1e-15
+    assert_close1d(sorted(betas), sorted(res.betas), rtol=1e-6)
+
+    # Identical phases are detected as the trivial solution
+    with pytest.raises(thermo.flash.TrivialSolutionError):
+        newton_equilibrium_NP(T, P, zs, [zs, zs, zs], [0.3, 0.3, 0.4], [liq, liq, liq])
+
+    # When Newton's method does not converge, sequential substitution is
+    # used and the failure is recorded; other errors are not hidden
+    assert 'NP_newton_abandoned' not in res.flash_convergence
+    flashN.NP_NEWTON_MAXITER = 0
+    try:
+        res_fallback = flashN.flash(T=T, P=P, zs=zs)
+        assert 'NP_newton_abandoned' in res_fallback.flash_convergence
+        assert_close1d(res_fallback.betas, res_SS.betas, rtol=1e-7)
+    finally:
+        del flashN.NP_NEWTON_MAXITER
+    comps, betas = [i.zs for i in res.phases], res.betas
+    with pytest.raises(IndexError):
+        flashN.solve_NP(T, P, zs, comps[:2], betas, res.phases)
+
+
+def test_water_C1_C8_SS_NP_acceleration():
+    omegas = [0.344, 0.008, 0.394]
+    Tcs = [647.14, 190.564, 568.7]
+    Pcs = [22048320.0, 4599000.0, 2490000.0]
+    kijs=[[0,0, 0],[0,0, 0.0496], [0,0.0496,0]]
+    zs = [1.0/3.0]*3
+    eos_kwargs = dict(Tcs=Tcs, Pcs=Pcs, omegas=omegas, kijs=kijs)
+    gas = CEOSGas(PRMIX, eos_kwargs, T=300.0, P=1e5, zs=zs)
+    liq = CEOSLiquid(PRMIX, eos_kwargs, T=300.0, P=1e5, zs=zs)
+    comps = [[0.03, 0.95, 0.02], [0.999, 1e-6, 1e-5], [0.01, 0.01, 0.98]]
+
+    # Close to where the gas disappears, plain SS is slow
+    T, P = 400.0, 1.5e7
+    sln = sequential_substitution_NP(T, P, zs, [list(c) for c in comps], [0.35, 0.3], [gas, liq, liq])
+    for acceleration in ('DEM', 'GDEM'):
+        sln_acc = sequential_substitution_NP(T, P, zs, [list(c) for c in comps], [0.35, 0.3], [gas, liq, liq],
+                                             acceleration=acceleration, acc_frequency=3, acc_delay=2)
+        assert_close1d(sln_acc[0], sln[0], rtol=1e-5)
+        assert_close2d(sln_acc[1], sln[1], rtol=1e-5)
+    sln_DEM = sequential_substitution_NP(T, P, zs, [list(c) for c in comps], [0.35, 0.3], [gas, liq, liq],
+                                         acceleration='DEM', acc_frequency=3, acc_delay=2)
+    assert sln_DEM[3] < 0.75*sln[3]
+
+    with pytest.raises(ValueError):
+        sequential_substitution_NP(T, P, zs, [list(c) for c in comps], [0.35, 0.3], [gas, liq, liq],
+                                   acceleration='Anderson')
+
+
+def test_grid_flash_hot_start_water_C1_C8():
+    omegas = [0.344, 0.008, 0.394]
+    Tcs = [647.14, 190.564, 568.7]
+    Pcs = [22048320.0, 4599000.0, 2490000.0]
+    kijs=[[0,0, 0],[0,0, 0.0496], [0,0.0496,0]]
+    zs = [1.0/3.0]*3
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [5.543665000518528e-22, -2.403756749600872e-18, 4.2166477594350336e-15, -3.7965208514613565e-12, 1.823547122838406e-09, -4.3747690853614695e-07, 5.437938301211039e-05, -0.003220061088723078, 33.32731489750759])),
+                         HeatCapacityGas(poly_fit=(50.0, 1000.0, [6.7703235945157e-22, -2.496905487234175e-18, 3.141019468969792e-15, -8.82689677472949e-13, -1.3709202525543862e-09, 1.232839237674241e-06, -0.0002832018460361874, 0.022944239587055416, 32.67333514157593])),
+                         HeatCapacityGas(poly_fit=(200.0, 1000.0, [-1.069661592422583e-22, -1.2992882995593864e-18, 8.808066659263286e-15, -2.1690080247294972e-11, 2.8519221306107026e-08, -2.187775092823544e-05, 0.009432620102532702, -1.5719488702446165, 217.60587499269303]))]
+    constants = ChemicalConstantsPackage(Tcs=Tcs, Pcs=Pcs, omegas=omegas, MWs=[18.01528, 16.04246, 114.22852],
+                                         CASs=['7732-18-5', '74-82-8', '111-65-9'])
+    properties = PropertyCorrelationsPackage(constants=constants, HeatCapacityGases=HeatCapacityGases)
+    eos_kwargs = dict(Tcs=Tcs, Pcs=Pcs, omegas=omegas, kijs=kijs)
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    flashN = FlashVLN(constants, properties, liquids=[liq, liq], gas=gas)
+
+    # Rows cross from two to three phases; a hot start from a two phase
+    # point converges the two phases again unless the third is looked for
+    Ts = linspace(300.0, 560.0, 27)
+    Ps = [1e5, 1e6, 5e6]
+    cold = flashN.grid_flash(zs, Ts=Ts, Ps=Ps)
+    hot = flashN.grid_flash(zs, Ts=Ts, Ps=Ps, hot_start_rows=True)
+    phase_counts = set()
+    for row_cold, row_hot in zip(cold, hot):
+        for res_cold, res_hot in zip(row_cold, row_hot):
+            phase_counts.add(res_cold.phase_count)
+            assert res_hot.phase_count == res_cold.phase_count
+            assert_close(res_hot.G(), res_cold.G(), rtol=1e-6)
+    assert 2 in phase_counts and 3 in phase_counts
+
+
 def test_C1_to_C5_water_gas():
     zs = normalize([.65, .13, .09, .05, .03, .03, .02, .003, 1e-6])
 #
@@ -1427,3 +1544,85 @@ def test_PH_TODO():
     flashN.flash(H=-1e4, P=2e5, zs=[.5, .5]).H()
 
     '''
+
+
+def test_water_C1_C8_stability_warm_start():
+    T = 298.15
+    P = 101325.0
+    omegas = [0.344, 0.008, 0.394]
+    Tcs = [647.14, 190.564, 568.7]
+    Pcs = [22048320.0, 4599000.0, 2490000.0]
+    kijs=[[0,0, 0],[0,0, 0.0496], [0,0.0496,0]]
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [5.543665000518528e-22, -2.403756749600872e-18, 4.2166477594350336e-15, -3.7965208514613565e-12, 1.823547122838406e-09, -4.3747690853614695e-07, 5.437938301211039e-05, -0.003220061088723078, 33.32731489750759])),
+                         HeatCapacityGas(poly_fit=(50.0, 1000.0, [6.7703235945157e-22, -2.496905487234175e-18, 3.141019468969792e-15, -8.82689677472949e-13, -1.3709202525543862e-09, 1.232839237674241e-06, -0.0002832018460361874, 0.022944239587055416, 32.67333514157593])),
+                         HeatCapacityGas(poly_fit=(200.0, 1000.0, [-1.069661592422583e-22, -1.2992882995593864e-18, 8.808066659263286e-15, -2.1690080247294972e-11, 2.8519221306107026e-08, -2.187775092823544e-05, 0.009432620102532702, -1.5719488702446165, 217.60587499269303]))]
+    constants = ChemicalConstantsPackage(Tcs=Tcs, Pcs=Pcs, omegas=omegas, MWs=[18.01528, 16.04246, 114.22852],
+                                         CASs=['7732-18-5', '74-82-8', '111-65-9'])
+    properties = PropertyCorrelationsPackage(constants=constants, HeatCapacityGases=HeatCapacityGases)
+    eos_kwargs = dict(Tcs=Tcs, Pcs=Pcs, omegas=omegas, kijs=kijs)
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    points = [(T + dT, P*(1.0 + dP), [1.0/3.0 + dz, 1.0/3.0 - dz, 1.0/3.0])
+              for dT in (0.0, 1.0, 3.0) for dP in (0.0, 0.01) for dz in (0.0, 0.01)]
+
+    flashN = FlashVLN(constants, properties, liquids=[liq, liq], gas=gas)
+    cold = [flashN.flash(T=T, P=P, zs=zs) for T, P, zs in points]
+    assert not any('warm' in str(res.flash_convergence.get('stab_guess_name')) for res in cold)
+
+    flashN = FlashVLN(constants, properties, liquids=[liq, liq], gas=gas)
+    flashN.STAB_WARM_START_SIZE = 4
+    warm = [flashN.flash(T=T, P=P, zs=zs) for T, P, zs in points]
+    assert warm[0].flash_convergence['stab_guess_name'] == cold[0].flash_convergence['stab_guess_name']
+    assert all(res.flash_convergence['stab_guess_name'].startswith('warm start') for res in warm[1:])
+    assert len(flashN._stab_warm_start_history) <= 4
+    for res_cold, res_warm in zip(cold, warm):
+        assert res_warm.phase_count == res_cold.phase_count == 3
+        assert_close(res_warm.G(), res_cold.G(), rtol=1e-9)
+        assert_close1d(res_warm.betas, res_cold.betas, rtol=1e-6)
+
+    # A distant condition does not use the stored results
+    res = flashN.flash(T=350.0, P=P, zs=[1.0/3.0]*3)
+    assert not res.flash_convergence['stab_guess_name'].startswith('warm start')
+
+
+def test_water_C1_C8_stability_TPD_screen():
+    omegas = [0.344, 0.008, 0.394]
+    Tcs = [647.14, 190.564, 568.7]
+    Pcs = [22048320.0, 4599000.0, 2490000.0]
+    kijs=[[0,0, 0],[0,0, 0.0496], [0,0.0496,0]]
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(50.0, 1000.0, [5.543665000518528e-22, -2.403756749600872e-18, 4.2166477594350336e-15, -3.7965208514613565e-12, 1.823547122838406e-09, -4.3747690853614695e-07, 5.437938301211039e-05, -0.003220061088723078, 33.32731489750759])),
+                         HeatCapacityGas(poly_fit=(50.0, 1000.0, [6.7703235945157e-22, -2.496905487234175e-18, 3.141019468969792e-15, -8.82689677472949e-13, -1.3709202525543862e-09, 1.232839237674241e-06, -0.0002832018460361874, 0.022944239587055416, 32.67333514157593])),
+                         HeatCapacityGas(poly_fit=(200.0, 1000.0, [-1.069661592422583e-22, -1.2992882995593864e-18, 8.808066659263286e-15, -2.1690080247294972e-11, 2.8519221306107026e-08, -2.187775092823544e-05, 0.009432620102532702, -1.5719488702446165, 217.60587499269303]))]
+    constants = ChemicalConstantsPackage(Tcs=Tcs, Pcs=Pcs, omegas=omegas, MWs=[18.01528, 16.04246, 114.22852],
+                                         CASs=['7732-18-5', '74-82-8', '111-65-9'])
+    properties = PropertyCorrelationsPackage(constants=constants, HeatCapacityGases=HeatCapacityGases)
+    eos_kwargs = dict(Tcs=Tcs, Pcs=Pcs, omegas=omegas, kijs=kijs)
+    gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    liq = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases)
+    points = [(298.15, 101325.0, [1.0/3.0]*3), (298.15, 101325.0, [0.999, 0.0005, 0.0005]),
+              (298.15, 1e6, [0.2, 0.1, 0.7]), (400.0, 101325.0, [0.1, 0.1, 0.8]),
+              (298.15, 1e5, [1.0, 0.0, 0.0])]
+
+    flashN = FlashVLN(constants, properties, liquids=[liq, liq], gas=gas)
+    full = [flashN.flash(T=T, P=P, zs=zs) for T, P, zs in points]
+    assert flashN.stab_trials_screened == flashN.stab_trials_pruned == 0
+
+    flashN.STAB_TPD_SCREEN = True
+    screened = [flashN.flash(T=T, P=P, zs=zs) for T, P, zs in points]
+    assert flashN.stab_trials_pruned > 0
+    assert flashN.stab_trials_screened > flashN.stab_trials_pruned
+    # The heuristic cut is off unless asked for
+    assert flashN.stab_trials_pruned_TPD_max == 0
+    for res_full, res in zip(full, screened):
+        assert res.phase_count == res_full.phase_count
+        assert_close(res.G(), res_full.G(), rtol=1e-9)
+        assert_close1d(res.betas, res_full.betas, rtol=1e-6, atol=1e-12)
+
+    flashN.STAB_TPD_SCREEN_MAX = 2.0
+    pruned = flashN.stab_trials_pruned
+    screened = [flashN.flash(T=T, P=P, zs=zs) for T, P, zs in points]
+    assert flashN.stab_trials_pruned_TPD_max > 0
+    assert flashN.stab_trials_pruned > pruned
+    for res_full, res in zip(full, screened):
+        assert res.phase_count == res_full.phase_count
+        assert_close(res.G(), res_full.G(), rtol=1e-9)
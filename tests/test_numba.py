@@ -277,4 +277,18 @@ def test_RegularSolution_numba():
     GE.gammas()
     GE.to_T_xs(T=T+1.0, xs=xs2np).gammas()
 
-    assert_close1d(GE.d2GE_dTdxs(), [0.0]*N, atol=0)
\ No newline at end of file
+    assert_close1d(GE.d2GE_dTdxs(), [0.0]*N, atol=0)
+
+@mark_as_numba
+def test_cubic_flash_TP_2P_numba():
+    assert isinstance(thermo.numba.flash.cubic_flash_TP_2P, numba.core.registry.CPUDispatcher)
+    eos = PRMIX(T=300.0, P=1e6, zs=[0.5, 0.5], Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0], omegas=[0.098, 0.251])
+    args = (300.0, 1e6, [0.5, 0.5], eos.Tcs, eos.Pcs, eos.omegas, eos.bs, eos.a_alphas, eos.kijs,
+            1.0 + sqrt(2.0), 1.0 - sqrt(2.0), 2.0, -1.0)
+    expect = thermo.flash.cubic_flash_TP_2P(*args)
+    args_np = tuple(np.array(v) if isinstance(v, list) else v for v in args)
+    calc = thermo.numba.flash.cubic_flash_TP_2P(*args_np)
+    assert calc[0] == expect[0]
+    assert_close(calc[1], expect[1], rtol=1e-12)
+    assert_close1d(calc[2], expect[2], rtol=1e-12)
+    assert_close1d(calc[3], expect[3], rtol=1e-12)
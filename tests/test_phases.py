@@ -763,6 +763,213 @@ def test_GibbsExcessLiquid_at_methods():
 
 
 
+def test_GibbsExcessLiquid_shared_model():
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(200.0, 1000.0, [-1.3320002425347943e-21, 6.4063345232664645e-18, -1.251025808150141e-14, 1.2265314167534311e-11, -5.535306305509636e-09, -4.32538332013644e-08, 0.0010438724775716248, -0.19650919978971002, 63.84239495676709])),
+     HeatCapacityGas(poly_fit=(50.0, 1000.0, [2.3511458696647882e-21, -9.223721411371584e-18, 1.3574178156001128e-14, -8.311274917169928e-12, 4.601738891380102e-10, 1.78316202142183e-06, -0.0007052056417063217, 0.13263597297874355, 28.44324970462924]))]
+    VolumeLiquids = [VolumeLiquid(poly_fit=(178.51, 498.1, [6.564241965071999e-23, -1.6568522275506375e-19, 1.800261692081815e-16, -1.0988731296761538e-13, 4.118691518070104e-11, -9.701938804617744e-09, 1.4022905458596618e-06, -0.00011362923883050033, 0.0040109650220160956])),
+                    VolumeLiquid(poly_fit=(175.7, 502.5, [3.5725079384600736e-23, -9.031033742820083e-20, 9.819637959370411e-17, -5.993173551565636e-14, 2.2442465416964825e-11, -5.27776114586072e-09, 7.610461006178106e-07, -6.148574498547711e-05, 0.00216398089328537])),]
+    VaporPressures = [VaporPressure(poly_fit=(178.51, 508.09000000000003, [-1.3233111115238975e-19, 4.2217134794609376e-16, -5.861832547132719e-13, 4.6488594950801467e-10, -2.3199079844570237e-07, 7.548290741523459e-05, -0.015966705328994194, 2.093003523977292, -125.39006100979816])),
+                      VaporPressure(poly_fit=(175.7, 512.49, [-1.446088049406911e-19, 4.565038519454878e-16, -6.278051259204248e-13, 4.935674274379539e-10, -2.443464113936029e-07, 7.893819658700523e-05, -0.016615779444332356, 2.1842496316772264, -134.19766175812708]))]
+    liquid = GibbsExcessLiquid(VaporPressures=VaporPressures, VolumeLiquids=VolumeLiquids,
+                               HeatCapacityGases=HeatCapacityGases, use_Poynting=True,
+                               T=300.0, P=1e5, zs=[0.4, 0.6])
+
+    liq2 = liquid.to_TP_zs(T=310.0, P=2e5, zs=[0.3, 0.7])
+    liq3 = liq2.to(T=320.0, P=3e5, zs=[0.5, 0.5])
+    # Every clone shares one model dictionary and the model data in it
+    assert liq2._model is liquid._model
+    assert liq3._model is liquid._model
+    assert liq3._Psats_data is liquid._Psats_data
+    assert liq3.VolumeLiquids is liquid.VolumeLiquids
+    assert (liq3.T, liq3.P, liq3.zs) == (320.0, 3e5, [0.5, 0.5])
+    assert (liquid.T, liquid.P, liquid.zs) == (300.0, 1e5, [0.4, 0.6])
+
+    # The model is gathered in the constructor; later changes are not cloned
+    unfrozen = GibbsExcessLiquid(VaporPressures=VaporPressures, VolumeLiquids=VolumeLiquids,
+                                 HeatCapacityGases=HeatCapacityGases, use_Poynting=True)
+    unfrozen.use_Poynting = False
+    assert unfrozen.to_TP_zs(T=310.0, P=2e5, zs=[0.3, 0.7]).use_Poynting
+
+    # Clones must not pick up state-dependent cached values from the model
+    fresh = GibbsExcessLiquid(VaporPressures=VaporPressures, VolumeLiquids=VolumeLiquids,
+                              HeatCapacityGases=HeatCapacityGases, use_Poynting=True,
+                              T=320.0, P=3e5, zs=[0.5, 0.5])
+    for name in ('H', 'S', 'Cp', 'V'):
+        assert_close(getattr(liq3, name)(), getattr(fresh, name)(), rtol=1e-13)
+    for name in ('Psats', 'Poyntings', 'lnphis'):
+        assert_close1d(getattr(liq3, name)(), getattr(fresh, name)(), rtol=1e-13)
+
+
+def test_GibbsExcessLiquid_memoize_state():
+    from thermo.phases import memoize_state
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(200.0, 1000.0, [-1.3320002425347943e-21, 6.4063345232664645e-18, -1.251025808150141e-14, 1.2265314167534311e-11, -5.535306305509636e-09, -4.32538332013644e-08, 0.0010438724775716248, -0.19650919978971002, 63.84239495676709])),
+     HeatCapacityGas(poly_fit=(50.0, 1000.0, [2.3511458696647882e-21, -9.223721411371584e-18, 1.3574178156001128e-14, -8.311274917169928e-12, 4.601738891380102e-10, 1.78316202142183e-06, -0.0007052056417063217, 0.13263597297874355, 28.44324970462924]))]
+    VolumeLiquids = [VolumeLiquid(poly_fit=(178.51, 498.1, [6.564241965071999e-23, -1.6568522275506375e-19, 1.800261692081815e-16, -1.0988731296761538e-13, 4.118691518070104e-11, -9.701938804617744e-09, 1.4022905458596618e-06, -0.00011362923883050033, 0.0040109650220160956])),
+                    VolumeLiquid(poly_fit=(175.7, 502.5, [3.5725079384600736e-23, -9.031033742820083e-20, 9.819637959370411e-17, -5.993173551565636e-14, 2.2442465416964825e-11, -5.27776114586072e-09, 7.610461006178106e-07, -6.148574498547711e-05, 0.00216398089328537])),]
+    VaporPressures = [VaporPressure(poly_fit=(178.51, 508.09000000000003, [-1.3233111115238975e-19, 4.2217134794609376e-16, -5.861832547132719e-13, 4.6488594950801467e-10, -2.3199079844570237e-07, 7.548290741523459e-05, -0.015966705328994194, 2.093003523977292, -125.39006100979816])),
+                      VaporPressure(poly_fit=(175.7, 512.49, [-1.446088049406911e-19, 4.565038519454878e-16, -6.278051259204248e-13, 4.935674274379539e-10, -2.443464113936029e-07, 7.893819658700523e-05, -0.016615779444332356, 2.1842496316772264, -134.19766175812708]))]
+    liquid = GibbsExcessLiquid(VaporPressures=VaporPressures, VolumeLiquids=VolumeLiquids,
+                               HeatCapacityGases=HeatCapacityGases, use_Poynting=True,
+                               T=300.0, P=1e5, zs=[0.4, 0.6])
+
+    # Dependencies on other memoized methods resolve to state variables
+    assert GibbsExcessLiquid.state_dependencies('Psats') == ('T',)
+    assert GibbsExcessLiquid.state_dependencies('Poyntings') == ('T', 'P')
+    assert GibbsExcessLiquid.state_dependencies('dPoyntings_dP') == ('T', 'P')
+    assert GibbsExcessLiquid.state_dependencies('Cpig_integrals_pure') == ('T',)
+    with pytest.raises(ValueError):
+        GibbsExcessLiquid.state_dependencies('gammas')
+
+    Psats, Poyntings, H = liquid.Psats(), liquid.Poyntings(), liquid.H()
+    assert liquid.Psats() is Psats
+    assert liquid.Poyntings() is Poyntings
+
+    # Same T, new P - only the temperature-only values are carried over
+    liq2 = liquid.to_TP_zs(T=300.0, P=2e5, zs=[0.3, 0.7])
+    assert liq2.Psats() is Psats
+    assert liq2.Cpig_integrals_pure() is liquid.Cpig_integrals_pure()
+    assert liq2.Poyntings() is not Poyntings
+    assert_close1d(liq2.Poyntings(), liquid.Poyntings_at(300.0, 2e5), rtol=1e-13)
+
+    # Same T and P - the Poynting factors are reused as well
+    liq3 = liquid.to(T=300.0, P=1e5, zs=[0.3, 0.7])
+    assert liq3.Poyntings() is Poyntings
+
+    # New T - nothing is carried over
+    liq4 = liquid.to_TP_zs(T=310.0, P=1e5, zs=[0.4, 0.6])
+    assert liq4.Psats() is not Psats
+    assert_close1d(liq4.Psats(), liquid.Psats_at(310.0), rtol=1e-13)
+
+    # Opting out recomputes the values on every call without storing them
+    try:
+        GibbsExcessLiquid.MEMOIZE_STATE = False
+        liq5 = liquid.to_TP_zs(T=320.0, P=1e5, zs=[0.4, 0.6])
+        assert liq5.Psats() is not liq5.Psats()
+        assert_close1d(liq5.Psats(), liquid.Psats_at(320.0), rtol=1e-13)
+        assert '_Psats' not in liq5.__dict__
+    finally:
+        del GibbsExcessLiquid.MEMOIZE_STATE
+    assert liq5.Psats() is liq5.Psats()
+
+    class LinearPsatLiquid(GibbsExcessLiquid):
+        @memoize_state('T', 'Vms_sat')
+        def Psats(self):
+            return [1e5*self.T/300.0]*self.N
+    assert LinearPsatLiquid.state_dependencies('Psats') == ('T',)
+    assert LinearPsatLiquid.state_dependencies('Poyntings') == ('T', 'P')
+
+
+def test_GibbsExcessLiquid_T_cache():
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(200.0, 1000.0, [-1.3320002425347943e-21, 6.4063345232664645e-18, -1.251025808150141e-14, 1.2265314167534311e-11, -5.535306305509636e-09, -4.32538332013644e-08, 0.0010438724775716248, -0.19650919978971002, 63.84239495676709])),
+     HeatCapacityGas(poly_fit=(50.0, 1000.0, [2.3511458696647882e-21, -9.223721411371584e-18, 1.3574178156001128e-14, -8.311274917169928e-12, 4.601738891380102e-10, 1.78316202142183e-06, -0.0007052056417063217, 0.13263597297874355, 28.44324970462924]))]
+    VolumeLiquids = [VolumeLiquid(poly_fit=(178.51, 498.1, [6.564241965071999e-23, -1.6568522275506375e-19, 1.800261692081815e-16, -1.0988731296761538e-13, 4.118691518070104e-11, -9.701938804617744e-09, 1.4022905458596618e-06, -0.00011362923883050033, 0.0040109650220160956])),
+                    VolumeLiquid(poly_fit=(175.7, 502.5, [3.5725079384600736e-23, -9.031033742820083e-20, 9.819637959370411e-17, -5.993173551565636e-14, 2.2442465416964825e-11, -5.27776114586072e-09, 7.610461006178106e-07, -6.148574498547711e-05, 0.00216398089328537])),]
+    VaporPressures = [VaporPressure(poly_fit=(178.51, 508.09000000000003, [-1.3233111115238975e-19, 4.2217134794609376e-16, -5.861832547132719e-13, 4.6488594950801467e-10, -2.3199079844570237e-07, 7.548290741523459e-05, -0.015966705328994194, 2.093003523977292, -125.39006100979816])),
+                      VaporPressure(poly_fit=(175.7, 512.49, [-1.446088049406911e-19, 4.565038519454878e-16, -6.278051259204248e-13, 4.935674274379539e-10, -2.443464113936029e-07, 7.893819658700523e-05, -0.016615779444332356, 2.1842496316772264, -134.19766175812708]))]
+    liquid = GibbsExcessLiquid(VaporPressures=VaporPressures, VolumeLiquids=VolumeLiquids,
+                               HeatCapacityGases=HeatCapacityGases, use_Poynting=True,
+                               T=300.0, P=1e5, zs=[0.4, 0.6])
+    H, Psats, dPsats_dT = liquid.H(), liquid.Psats(), liquid.dPsats_dT()
+
+    # Stepping away and back to a temperature reuses the pure component values,
+    # whichever clone the phase at the old temperature is created from
+    liq2 = liquid.to_TP_zs(T=310.0, P=2e5, zs=[0.3, 0.7])
+    liq2.Psats()
+    liq3 = liq2.to_TP_zs(T=300.0, P=3e5, zs=[0.5, 0.5])
+    assert liq3.Psats() is Psats
+    assert liq3.dPsats_dT() is dPsats_dT
+    assert liq3.Cpig_integrals_pure() is liquid.Cpig_integrals_pure()
+    assert liq2.to(T=310.0, P=1e5, zs=[0.5, 0.5]).Psats() is liq2.Psats()
+    assert liq3.to_TP_zs(T=310.0, P=1e5, zs=[0.5, 0.5]).Psats() is liq2.Psats()
+    assert '_Poyntings' not in liq3.__dict__
+    fresh = GibbsExcessLiquid(VaporPressures=VaporPressures, VolumeLiquids=VolumeLiquids,
+                              HeatCapacityGases=HeatCapacityGases, use_Poynting=True,
+                              T=300.0, P=3e5, zs=[0.5, 0.5])
+    for name in ('H', 'S', 'Cp', 'V'):
+        assert_close(getattr(liq3, name)(), getattr(fresh, name)(), rtol=1e-13)
+
+    # The cache is bounded, dropping the least recently used temperatures first
+    phase = liquid
+    for i in range(2*GibbsExcessLiquid.T_CACHE_SIZE):
+        phase = phase.to_TP_zs(T=320.0 + i, P=1e5, zs=[0.5, 0.5])
+        phase.Psats()
+    assert len(liquid._T_cache) == GibbsExcessLiquid.T_CACHE_SIZE
+    assert 300.0 not in liquid._T_cache
+
+    # Disabling the cache
+    T_CACHE_SIZE = GibbsExcessLiquid.T_CACHE_SIZE
+    try:
+        GibbsExcessLiquid.T_CACHE_SIZE = 0
+        liq4 = liq3.to_TP_zs(T=310.0, P=1e5, zs=[0.5, 0.5])
+        assert '_Psats' not in liq4.__dict__
+    finally:
+        GibbsExcessLiquid.T_CACHE_SIZE = T_CACHE_SIZE
+
+
+def test_Phase_evaluate_many():
+    HeatCapacityGases = [HeatCapacityGas(poly_fit=(200.0, 1000.0, [-1.3320002425347943e-21, 6.4063345232664645e-18, -1.251025808150141e-14, 1.2265314167534311e-11, -5.535306305509636e-09, -4.32538332013644e-08, 0.0010438724775716248, -0.19650919978971002, 63.84239495676709])),
+     HeatCapacityGas(poly_fit=(50.0, 1000.0, [2.3511458696647882e-21, -9.223721411371584e-18, 1.3574178156001128e-14, -8.311274917169928e-12, 4.601738891380102e-10, 1.78316202142183e-06, -0.0007052056417063217, 0.13263597297874355, 28.44324970462924]))]
+    VolumeLiquids = [VolumeLiquid(poly_fit=(178.51, 498.1, [6.564241965071999e-23, -1.6568522275506375e-19, 1.800261692081815e-16, -1.0988731296761538e-13, 4.118691518070104e-11, -9.701938804617744e-09, 1.4022905458596618e-06, -0.00011362923883050033, 0.0040109650220160956])),
+                    VolumeLiquid(poly_fit=(175.7, 502.5, [3.5725079384600736e-23, -9.031033742820083e-20, 9.819637959370411e-17, -5.993173551565636e-14, 2.2442465416964825e-11, -5.27776114586072e-09, 7.610461006178106e-07, -6.148574498547711e-05, 0.00216398089328537])),]
+    VaporPressures = [VaporPressure(poly_fit=(178.51, 508.09000000000003, [-1.3233111115238975e-19, 4.2217134794609376e-16, -5.861832547132719e-13, 4.6488594950801467e-10, -2.3199079844570237e-07, 7.548290741523459e-05, -0.015966705328994194, 2.093003523977292, -125.39006100979816])),
+                      VaporPressure(poly_fit=(175.7, 512.49, [-1.446088049406911e-19, 4.565038519454878e-16, -6.278051259204248e-13, 4.935674274379539e-10, -2.443464113936029e-07, 7.893819658700523e-05, -0.016615779444332356, 2.1842496316772264, -134.19766175812708]))]
+    eos_kwargs = {'Pcs': [4872000.0, 3370000.0], 'Tcs': [305.32, 469.7], 'omegas': [0.098, 0.251],
+                  'kijs': [[0.0, 0.0078], [0.0078, 0.0]]}
+    GE = UNIFAC.from_subgroups(T=300.0, xs=[0.4, 0.6], chemgroups=[{1: 2}, {1: 2, 2: 3}], version=0)
+    phases = [CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases, T=300.0, P=1e5, zs=[0.4, 0.6]),
+              CEOSLiquid(SRKMIX, eos_kwargs, HeatCapacityGases=HeatCapacityGases, T=300.0, P=1e5, zs=[0.4, 0.6]),
+              IdealGas(HeatCapacityGases=HeatCapacityGases, T=300.0, P=1e5, zs=[0.4, 0.6]),
+              GibbsExcessLiquid(VaporPressures=VaporPressures, VolumeLiquids=VolumeLiquids,
+                                HeatCapacityGases=HeatCapacityGases, GibbsExcessModel=GE,
+                                use_Poynting=True, T=300.0, P=1e5, zs=[0.4, 0.6])]
+
+    Ts = [250.0, 300.0, 250.0, 350.0, 300.0]
+    Ps = [1e5, 2e6, 5e6, 3e5, 1e7]
+    zs = [[0.4, 0.6], [0.1, 0.9], [0.8, 0.2], [1.0, 0.0], [0.5, 0.5]]
+    props = ('V', 'H', 'S', 'G', 'lnphis', 'phis', 'Cp')
+    for phase in phases:
+        values = phase.evaluate_many(Ts, Ps, zs, props)
+        assert list(values) == list(props)
+        for i in range(len(Ts)):
+            new = phase.to_TP_zs(T=Ts[i], P=Ps[i], zs=zs[i])
+            for name in ('V', 'H', 'S', 'G', 'Cp'):
+                assert_close(values[name][i], getattr(new, name)(), rtol=1e-10)
+            assert_close1d(values['lnphis'][i], new.lnphis(), rtol=1e-10)
+            assert_close1d(values['phis'][i], new.phis(), rtol=1e-10)
+
+    # Scalar conditions broadcast against many compositions; a single property name is accepted
+    Vs = phases[0].evaluate_many(300.0, 1e6, zs, 'V')['V']
+    assert Vs.shape == (5,)
+    assert_close(Vs[1], phases[0].to_TP_zs(T=300.0, P=1e6, zs=zs[1]).V(), rtol=1e-10)
+
+
+def test_CEOSPhase_with_zs_lnphis_at_zs():
+    eos_kwargs = {'Pcs': [4872000.0, 3370000.0, 4599000.0], 'Tcs': [305.32, 469.7, 190.56],
+                  'omegas': [0.098, 0.251, 0.008], 'kijs': [[0.0, 0.0078, 0.0], [0.0078, 0.0, 0.02], [0.0, 0.02, 0.0]]}
+    zs, zs2 = [0.2, 0.5, 0.3], [0.6, 0.1, 0.3]
+    for eos in (PRMIX, SRKMIX, RKMIX, VDWMIX):
+        for cls in (CEOSGas, CEOSLiquid):
+            phase = cls(eos, eos_kwargs, T=250.0, P=3e6, zs=zs)
+            expect = phase.to_TP_zs(T=250.0, P=3e6, zs=zs2).lnphis()
+            assert_close1d(phase.lnphis_at_zs(zs2), expect, rtol=1e-10)
+            new = phase.with_zs(zs2)
+            assert (new.T, new.P, new.zs) == (250.0, 3e6, zs2)
+            assert_close1d(new.lnphis(), expect, rtol=1e-13)
+            if eos is VDWMIX:
+                assert phase._lnphis_kernel_args() is None
+            else:
+                # The EOS object is only created when another property needs it
+                chained = new.with_zs(zs)
+                assert 'eos_mix' not in new.__dict__ and 'eos_mix' not in chained.__dict__
+                assert_close1d(chained.lnphis(), phase.lnphis(), rtol=1e-13)
+                assert_close(new.V(), phase.to_TP_zs(T=250.0, P=3e6, zs=zs2).V(), rtol=1e-13)
+                assert new.eos_mix.a_alphas is phase.eos_mix.a_alphas
+                # The temperature-only kernel inputs are shared at the same T
+                assert new._lnphis_kernel_args() is phase._lnphis_kernel_args()
+                other = phase.to_TP_zs(T=251.0, P=3e6, zs=zs2)
+                assert other._lnphis_kernel_args() is not phase._lnphis_kernel_args()
+
+
 def test_EOSGas_phis():
     # Acetone, chloroform, methanol
     T = 331.42
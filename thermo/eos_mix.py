@@ -185,6 +185,7 @@ Lists of Equations of State
 ===========================
 .. autodata:: thermo.eos_mix.eos_mix_list
 .. autodata:: thermo.eos_mix.eos_mix_no_coeffs_list
+.. autodata:: thermo.eos_mix.batch_cubic_eos_constants
 
 '''
 from __future__ import division
@@ -194,7 +195,8 @@ __all__ = ['GCEOSMIX', 'PRMIX', 'SRKMIX', 'PR78MIX', 'VDWMIX', 'PRSVMIX',
 'PRSV2MIX', 'TWUPRMIX', 'TWUSRKMIX', 'APISRKMIX', 'IGMIX', 'RKMIX',
 'PRMIXTranslatedConsistent', 'PRMIXTranslatedPPJP', 'PRMIXTranslated',
 'SRKMIXTranslatedConsistent', 'PSRK', 'MSRKMIXTranslated',
-'eos_mix_list', 'eos_mix_no_coeffs_list', 'SRKMIXTranslated']
+'eos_mix_list', 'eos_mix_no_coeffs_list', 'SRKMIXTranslated',
+'batch_cubic_eos_constants']
 
 import sys
 from cmath import log as clog, atanh as catanh
@@ -11389,3 +11391,24 @@ or can fill in their special parameters from other specified parameters.
 eos_mix_dict = {c.__name__: c for c in eos_mix_list}
 '''dict : Dict of all cubic mixture equation of state classes, indexed by their class name.
 '''
+
+_PR_batch_constants = (1.0 + root_two, 1.0 - root_two, 2.0, -1.0)
+_SRK_batch_constants = (1.0, 0.0, 1.0, 0.0)
+batch_cubic_eos_constants = {PRMIX: _PR_batch_constants,
+                             PR78MIX: _PR_batch_constants,
+                             PRSVMIX: _PR_batch_constants,
+                             PRSV2MIX: _PR_batch_constants,
+                             TWUPRMIX: _PR_batch_constants,
+                             SRKMIX: _SRK_batch_constants,
+                             TWUSRKMIX: _SRK_batch_constants,
+                             APISRKMIX: _SRK_batch_constants,
+                             RKMIX: _SRK_batch_constants}
+r'''dict : The constants :math:`(\sigma, \epsilon, \delta/b, \epsilon_{EOS}/b^2)`
+of the cubic EOS classes which use the van der Waals mixing rules without
+volume translation, indexed by class. For these, the EOS parameters are
+:math:`\delta = (\sigma + \epsilon)b` and
+:math:`\epsilon_{EOS} = \sigma\epsilon b^2`, so many states can be solved at
+once with array operations. The last two constants are stored exactly (2 and
+-1 for Peng-Robinson) rather than computed from :math:`\sigma` and
+:math:`\epsilon`, so the volumes match those of the EOS objects.
+'''
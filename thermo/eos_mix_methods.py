@@ -61,6 +61,15 @@ implemented
 
 .. autofunction:: PR_lnphis
 .. autofunction:: PR_lnphis_fastest
+.. autofunction:: cubic_lnphis_fastest
+
+Many-state fugacity calls
+-------------------------
+When a large number of compositions need their fugacities evaluated at the
+same temperature, the composition-independent parts of the calculation
+can be done once and the rest as NumPy array operations.
+
+.. autofunction:: cubic_lnphis_many
 
 
 '''
@@ -73,7 +82,8 @@ from thermo.eos_volume import volume_solutions_halley
 __all__ = ['a_alpha_aijs_composition_independent',
            'a_alpha_and_derivatives', 'a_alpha_and_derivatives_full',
            'a_alpha_quadratic_terms', 'a_alpha_and_derivatives_quadratic_terms',
-           'PR_lnphis', 'PR_lnphis_fastest']
+           'PR_lnphis', 'PR_lnphis_fastest', 'cubic_lnphis_fastest',
+           'cubic_lnphis_many']
 
 R2 = R*R
 R_inv = 1.0/R
@@ -742,3 +752,166 @@ def PR_lnphis_fastest(zs, T, P, kijs, l, g, ais, bs, a_alphas, a_alpha_roots, ka
         raise ValueError("Root must be specified")
     Z = Z = P*V0/(R*T)
     return PR_lnphis(T, P, Z, b, a_alpha, zs, bs, a_alpha_j_rows)
+
+
+def cubic_lnphis_fastest(T, P, zs, bs, a_alpha_ijs, sigma, epsilon, delta_coeff,
+                         epsilon_coeff, liquid):
+    r'''Calculates the log fugacity coefficients of a cubic equation of state
+    with the van der Waals mixing rules and no volume translation, from
+    the precomputed matrix :math:`(a\alpha)_{ij}`. This is the single
+    composition version of :obj:`cubic_lnphis_many`, written with plain
+    loops so it can be compiled with numba.
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    P : float
+        Pressure, [Pa]
+    zs : list[float]
+        Mole fractions, [-]
+    bs : list[float]
+        Pure component `b` coefficients, [m^3/mol]
+    a_alpha_ijs : list[list[float]]
+        Matrix of :math:`(a\alpha)_{ij}` at `T`, [J^2/mol^2/Pa]
+    sigma : float
+        EOS constant; :math:`1+\sqrt{2}` for Peng-Robinson and 1 for SRK, [-]
+    epsilon : float
+        EOS constant; :math:`1-\sqrt{2}` for Peng-Robinson and 0 for SRK, [-]
+    delta_coeff : float
+        :math:`\delta/b`, equal to :math:`\sigma + \epsilon`; 2 for
+        Peng-Robinson and 1 for SRK, [-]
+    epsilon_coeff : float
+        :math:`\epsilon_{EOS}/b^2`, equal to :math:`\sigma\epsilon`; -1 for
+        Peng-Robinson and 0 for SRK, [-]
+    liquid : bool
+        Whether to use the smallest (True) or largest (False) volume root when
+        three roots exist, [-]
+
+    Returns
+    -------
+    lnphis : list[float]
+        Log fugacity coefficients, [-]
+    V : float
+        Molar volume, [m^3/mol]
+
+    Examples
+    --------
+    >>> from thermo.eos_mix import PRMIX
+    >>> eos = PRMIX(T=300.0, P=1e6, zs=[0.5, 0.5], Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0], omegas=[0.098, 0.251])
+    >>> a_alpha_ijs = a_alpha_aijs_composition_independent(eos.a_alphas, eos.kijs)[0]
+    >>> lnphis, V = cubic_lnphis_fastest(300.0, 1e6, [0.5, 0.5], eos.bs, a_alpha_ijs, 1.0 + 2**0.5, 1.0 - 2**0.5, 2.0, -1.0, True)
+    >>> [round(v, 8) for v in lnphis], round(V/eos.V_l, 12)
+    ([1.06047266, -2.57151548], 1.0)
+    '''
+    N = len(zs)
+    b = 0.0
+    for i in range(N):
+        b += bs[i]*zs[i]
+    a_alpha = 0.0
+    a_alpha_j_rows = [0.0]*N
+    for i in range(N):
+        a_alpha_ijs_i = a_alpha_ijs[i]
+        t = 0.0
+        for j in range(N):
+            t += zs[j]*a_alpha_ijs_i[j]
+        a_alpha_j_rows[i] = t
+        a_alpha += zs[i]*t
+
+    V0, V1, V2 = volume_solutions_halley(T, P, b, delta_coeff*b, epsilon_coeff*b*b, a_alpha)
+    # Imaginary roots are returned as zero
+    if liquid:
+        if V1 != 0.0:
+            if V0 > V1 and V1 > b:
+                V0 = V1
+            if V0 > V2 and V2 > b:
+                V0 = V2
+    else:
+        if V1 != 0.0:
+            if V0 < V1 and V1 > b:
+                V0 = V1
+            if V0 < V2 and V2 > b:
+                V0 = V2
+    RT_inv = R_inv/T
+    Z = P*V0*RT_inv
+    B = b*P*RT_inv
+    A = a_alpha*P*RT_inv*RT_inv
+    x0 = log(Z - B)
+    log_term = A/(B*(sigma - epsilon))*log((Z + sigma*B)/(Z + epsilon*B))
+    a_alpha_inv_2 = 2.0/a_alpha
+    b_inv = 1.0/b
+    lnphis = [0.0]*N
+    for i in range(N):
+        b_ratio = bs[i]*b_inv
+        lnphis[i] = b_ratio*(Z - 1.0) - x0 - log_term*(a_alpha_j_rows[i]*a_alpha_inv_2 - b_ratio)
+    return lnphis, V0
+
+
+def cubic_lnphis_many(T, P, zs, bs, a_alpha_ijs, sigma, epsilon, delta_coeff,
+                      epsilon_coeff, liquid):
+    r'''Calculates the log fugacity coefficients of many compositions at once
+    for a cubic equation of state with the van der Waals mixing rules, no
+    volume translation, and :math:`\delta = (\sigma + \epsilon)b` and
+    :math:`\epsilon = \sigma\epsilon b^2`. All compositions are at the same
+    temperature, so `a_alpha_ijs` is shared between them.
+
+    .. math::
+        \ln \phi_i = \frac{b_i}{b}(Z-1) - \ln(Z - B) - \frac{A}{B(\sigma
+        - \epsilon)}\left(\frac{2\sum_j z_j (a\alpha)_{ij}}{a\alpha}
+        - \frac{b_i}{b}\right)\ln\left(\frac{Z + \sigma B}{Z + \epsilon B}
+        \right)
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    P : float or ndarray
+        Pressure, scalar or one value per composition, [Pa]
+    zs : ndarray
+        Mole fractions, shape (n, N), [-]
+    bs : ndarray
+        Pure component `b` coefficients, [m^3/mol]
+    a_alpha_ijs : ndarray
+        Matrix of :math:`(a\alpha)_{ij}` at `T`, [J^2/mol^2/Pa]
+    sigma : float
+        EOS constant; :math:`1+\sqrt{2}` for Peng-Robinson and 1 for SRK, [-]
+    epsilon : float
+        EOS constant; :math:`1-\sqrt{2}` for Peng-Robinson and 0 for SRK, [-]
+    delta_coeff : float
+        :math:`\delta/b`, equal to :math:`\sigma + \epsilon`; 2 for
+        Peng-Robinson and 1 for SRK, [-]
+    epsilon_coeff : float
+        :math:`\epsilon_{EOS}/b^2`, equal to :math:`\sigma\epsilon`; -1 for
+        Peng-Robinson and 0 for SRK, [-]
+    liquid : bool
+        Whether to use the smallest (True) or largest (False) volume root when
+        three roots exist, [-]
+
+    Returns
+    -------
+    lnphis : ndarray
+        Log fugacity coefficients, shape (n, N), [-]
+    Vs : ndarray
+        Molar volumes of each composition, shape (n,), [m^3/mol]
+    a_alpha_j_rows : ndarray
+        :math:`\sum_j z_j (a\alpha)_{ij}` for each composition, shape (n, N),
+        [J^2/mol^2/Pa]
+    '''
+    from thermo.eos_volume import volume_solutions_many
+    b = zs.dot(bs)
+    a_alpha_j_rows = zs.dot(a_alpha_ijs)
+    a_alpha = np.einsum('ij,ij->i', zs, a_alpha_j_rows)
+    Vs = volume_solutions_many(T, P, b, delta_coeff*b, epsilon_coeff*b*b, a_alpha)
+    if liquid:
+        V = Vs[:, 0]
+    else:
+        V = np.nanmax(Vs, axis=1)
+    RT_inv = R_inv/T
+    Z = P*V*RT_inv
+    B = b*P*RT_inv
+    A = a_alpha*P*RT_inv*RT_inv
+    b_ratios = bs[None, :]/b[:, None]
+    log_term = (A/(B*(sigma - epsilon))*np.log((Z + sigma*B)/(Z + epsilon*B)))[:, None]
+    lnphis = (b_ratios*(Z - 1.0)[:, None] - np.log(Z - B)[:, None]
+              - log_term*(2.0*a_alpha_j_rows/a_alpha[:, None] - b_ratios))
+    return lnphis, V, a_alpha_j_rows
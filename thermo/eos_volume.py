@@ -60,6 +60,10 @@ Analytical Solvers
 .. autofunction:: volume_solutions_numpy
 .. autofunction:: volume_solutions_ideal
 
+Many-State Solvers
+------------------
+.. autofunction:: volume_solutions_many
+
 Numerical Solvers
 -----------------
 .. autofunction:: volume_solutions_halley
@@ -77,7 +81,8 @@ from __future__ import division, print_function
 __all__ = ['volume_solutions_mpmath', 'volume_solutions_mpmath_float',
            'volume_solutions_NR', 'volume_solutions_NR_low_P', 'volume_solutions_halley',
            'volume_solutions_fast', 'volume_solutions_Cardano', 'volume_solutions_a1',
-           'volume_solutions_a2', 'volume_solutions_numpy', 'volume_solutions_ideal']
+           'volume_solutions_a2', 'volume_solutions_numpy', 'volume_solutions_ideal',
+           'volume_solutions_many']
 
 
 from cmath import sqrt as csqrt
@@ -1075,6 +1080,82 @@ def volume_solutions_numpy(T, P, b, delta, epsilon, a_alpha):
     RT_P = R*T/P
     return [V*RT_P for V in roots]
 
+def volume_solutions_many(T, P, b, delta, epsilon, a_alpha):
+    r'''Calculate the physical molar volume solutions to a cubic equation of
+    state for many states at once. Each argument may be a scalar or a NumPy
+    array, and all arrays must have the same shape. The roots of the
+    polynomial in `Z` are found as the eigenvalues of a stack of companion
+    matrices, and then polished with two Newton steps.
+
+    Parameters
+    ----------
+    T : float or ndarray
+        Temperature, [K]
+    P : float or ndarray
+        Pressure, [Pa]
+    b : float or ndarray
+        Coefficient calculated by EOS-specific method, [m^3/mol]
+    delta : float or ndarray
+        Coefficient calculated by EOS-specific method, [m^3/mol]
+    epsilon : float or ndarray
+        Coefficient calculated by EOS-specific method, [m^6/mol^2]
+    a_alpha : float or ndarray
+        Coefficient calculated by EOS-specific method, [J^2/mol^2/Pa]
+
+    Returns
+    -------
+    Vs : ndarray
+        Array of shape (n, 3) holding the real molar volumes larger than `b`
+        in increasing order; missing roots are `nan`, [m^3/mol]
+
+    Notes
+    -----
+    This is intended to be used when a great many states need to be solved
+    and the overhead of calling a scalar solver for each is too high.
+
+    Examples
+    --------
+    >>> Vs = volume_solutions_many(T=300.0, P=1e6, b=2.6e-05, delta=5.2e-05,
+    ...                            epsilon=-6.76e-10, a_alpha=0.25)
+    >>> Vs.shape
+    (1, 3)
+    '''
+    T, P, b, delta, epsilon, a_alpha = np.broadcast_arrays(*[np.atleast_1d(np.asarray(v, dtype=float))
+                                                          for v in (T, P, b, delta, epsilon, a_alpha)])
+    n = T.size
+    RT_inv = R_inv/T
+    P_RT_inv = P*RT_inv
+    B = b*P_RT_inv
+    deltas = delta*P_RT_inv
+    thetas = a_alpha*P_RT_inv*RT_inv
+    epsilons = epsilon*P_RT_inv*P_RT_inv
+
+    c2 = deltas - B - 1.0
+    c1 = thetas + epsilons - deltas*(B + 1.0)
+    c0 = -(epsilons*(B + 1.0) + thetas*B)
+
+    companion = np.zeros((n, 3, 3))
+    companion[:, 0, 0] = -c2
+    companion[:, 0, 1] = -c1
+    companion[:, 0, 2] = -c0
+    companion[:, 1, 0] = 1.0
+    companion[:, 2, 1] = 1.0
+    roots = np.linalg.eigvals(companion)
+
+    real = np.abs(roots.imag) <= 1e-7*np.abs(roots.real)
+    Zs = np.where(real, roots.real, np.nan)
+    c2, c1, c0 = c2[:, None], c1[:, None], c0[:, None]
+    for _ in range(2):
+        f = ((Zs + c2)*Zs + c1)*Zs + c0
+        df = (3.0*Zs + 2.0*c2)*Zs + c1
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step = np.where(df != 0.0, f/df, 0.0)
+        Zs = Zs - step
+    Vs = Zs/P_RT_inv[:, None]
+    Vs[~(Vs > b[:, None])] = np.nan
+    Vs.sort(axis=1)
+    return Vs
+
 def volume_solutions_ideal(T, P, b=0.0, delta=0.0, epsilon=0.0, a_alpha=0.0):
     r'''Calculate the ideal-gas molar volume in a format compatible with the
     other cubic EOS solvers. The ideal gas volume is the first element; and the
@@ -36,10 +36,17 @@ EquilibriumState
     :members:
     :undoc-members:
     :exclude-members:
+
+FlashResultTable
+================
+.. autoclass:: FlashResultTable
+    :members:
+    :undoc-members:
+    :exclude-members:
 '''
 
 from __future__ import division
-__all__ = ['EquilibriumState']
+__all__ = ['EquilibriumState', 'FlashResultTable']
 
 from fluids.constants import R, R_inv
 from fluids.core import thermal_diffusivity
@@ -49,6 +56,7 @@ from chemicals.elements import atom_fractions, mass_fractions, simple_formula_pa
 from thermo.phases import gas_phases, liquid_phases, solid_phases, Phase, derivatives_thermodynamic, derivatives_thermodynamic_mass, derivatives_jacobian
 from thermo.chemical_package import ChemicalConstantsPackage, PropertyCorrelationsPackage, constants_docstrings
 from thermo.bulk import Bulk, BulkSettings, default_settings
+from fluids.numerics import numpy as np
 
 all_phases = gas_phases + liquid_phases + solid_phases
 
@@ -2471,4 +2479,331 @@ try:
     EquilibriumState.__doc__ = EquilibriumState.__doc__ +'\n    ' + '\n    '.join(_add_attrs_doc)
 except:
     pass
-del _add_attrs_doc
\ No newline at end of file
+del _add_attrs_doc
+
+class FlashResultTable(object):
+    r'''Class to store the results of many flashes in contiguous arrays,
+    as returned by :obj:`Flash.grid_flash <thermo.flash.Flash.grid_flash>`
+    and :obj:`FlashVL.flash_batch <thermo.flash.FlashVL.flash_batch>`.
+    Only the temperature, pressure, phase fractions, phase compositions and
+    the model of each phase are kept for every point; an
+    :obj:`EquilibriumState` is built for a point only when it is indexed.
+
+    Indexing with a string returns a column, reshaped to :obj:`shape`;
+    indexing with an integer (a flat index) or a tuple of integers (an index
+    into :obj:`shape`) returns the :obj:`EquilibriumState` of that point, or
+    None if the point failed to flash.
+
+    Parameters
+    ----------
+    flasher : :obj:`Flash <thermo.flash.Flash>`
+        The flasher the results were calculated with; its `phases` are the
+        models the phases of each point are rebuilt from, [-]
+    size : int
+        Number of points in the table, [-]
+    zs : list[float] or ndarray
+        Overall mole fractions of all species, either shared by every point
+        or with one row per point, [-]
+    spec_keys : tuple[str], optional
+        Names of the two specifications of the flashes; specifications other
+        than `T` and `P` are stored as columns, [-]
+    props : list[str], optional
+        Properties to calculate with :obj:`EquilibriumState.value` and store
+        as columns as each point is added, [-]
+    shape : tuple[int], optional
+        Shape of the grid of points; defaults to (`size`,), [-]
+
+    Attributes
+    ----------
+    T : ndarray
+        Temperatures of each point, `nan` for failed points, [K]
+    P : ndarray
+        Pressures of each point, `nan` for failed points, [Pa]
+    zs : ndarray
+        Overall mole fractions, [-]
+    gas_count : ndarray
+        Number of gas phases at each point, [-]
+    liquid_count : ndarray
+        Number of liquid phases at each point, [-]
+    solid_count : ndarray
+        Number of solid phases at each point, [-]
+    betas : ndarray
+        Molar phase fractions of each point, in the order of
+        :obj:`EquilibriumState.betas` and padded with zeros, [-]
+    phase_zs : ndarray
+        Mole fractions of each phase of each point, padded with `nan`, [-]
+    phase_models : ndarray
+        Index in the flasher's `phases` of the model of each phase of each
+        point, padded with -1, [-]
+    columns : dict[str : ndarray]
+        Stored specification, property and other columns, [various]
+
+    Notes
+    -----
+    Phase objects are rebuilt with their model's `to` method at the stored
+    `T`, `P` and composition, so the convergence information of each flash is
+    not kept.
+
+    Examples
+    --------
+    >>> from thermo import ChemicalConstantsPackage, PropertyCorrelationsPackage, HeatCapacityGas, CEOSGas, CEOSLiquid, PRMIX, FlashVL
+    >>> constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0], omegas=[0.098, 0.251], MWs=[30.06904, 72.14878], CASs=['74-84-0', '109-66-0'])
+    >>> correlations = PropertyCorrelationsPackage(constants, skip_missing=True, HeatCapacityGases=[HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.1e-21, -3.3e-17, 6.6e-14, -7.2e-11, 4.5e-08, -1.5e-05, 0.0023, -0.08, 34.])), HeatCapacityGas(poly_fit=(200.0, 1000.0, [7.5e-20, -3.7e-16, 7.7e-13, -8.9e-10, 6.2e-07, -2.6e-04, 0.061, -6.9, 455.]))])
+    >>> eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    >>> gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases)
+    >>> liquid = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases)
+    >>> flasher = FlashVL(constants, correlations, liquid=liquid, gas=gas)
+    >>> table = flasher.grid_flash([0.5, 0.5], Ts=[250.0, 300.0], Ps=[1e5, 1e6], props=['VF'], table=True)
+    >>> table['VF'].shape
+    (2, 2)
+    >>> round(float(table['VF'][0, 0]), 4)
+    0.4963
+    >>> table[0, 0].phase_count
+    2
+    '''
+    def __init__(self, flasher, size, zs, spec_keys=('T', 'P'), props=None,
+                 shape=None):
+        self.flasher = flasher
+        self.size = size
+        self.shape = (size,) if shape is None else tuple(shape)
+        self.zs = np.array(zs, dtype=float)
+        self.spec_keys = tuple(spec_keys)
+        self.prop_names = [] if props is None else list(props)
+        self.max_phases = max_phases = max(getattr(flasher, 'max_phases', 1), len(flasher.phases))
+        N = self.zs.shape[-1]
+
+        self.T = np.full(size, np.nan)
+        self.P = np.full(size, np.nan)
+        self.gas_count = np.zeros(size, dtype=np.int8)
+        self.liquid_count = np.zeros(size, dtype=np.int8)
+        self.solid_count = np.zeros(size, dtype=np.int8)
+        self.betas = np.zeros((size, max_phases))
+        self.phase_zs = np.full((size, max_phases, N), np.nan)
+        self.phase_models = np.full((size, max_phases), -1, dtype=np.int8)
+        self.columns = {k: np.full(size, np.nan) for k in self.spec_keys if k not in ('T', 'P')}
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        for i in range(self.size):
+            yield self.state(i)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self.column(key)
+        if isinstance(key, tuple):
+            key = int(np.ravel_multi_index(key, self.shape))
+        return self.state(key)
+
+    @property
+    def phase_count(self):
+        r'''Number of phases at each point, 0 for failed points, [-]'''
+        return (self.gas_count + self.liquid_count + self.solid_count).astype(int)
+
+    @property
+    def gas_beta(self):
+        r'''Molar fraction of gas at each point, [-]'''
+        return np.where(self.gas_count > 0, self.betas[:, 0], 0.0)
+
+    @property
+    def gas_zs(self):
+        r'''Mole fractions of the gas at each point, `nan` without a gas, [-]'''
+        return np.where((self.gas_count > 0)[:, None], self.phase_zs[:, 0], np.nan)
+
+    @property
+    def liquids_betas(self):
+        r'''Molar fractions of each liquid at each point, padded with
+        zeros, [-]'''
+        return self._liquids_slice(self.betas, 0.0)
+
+    @property
+    def liquids_zs(self):
+        r'''Mole fractions of each liquid at each point, padded with
+        `nan`, [-]'''
+        return self._liquids_slice(self.phase_zs, np.nan)
+
+    def _liquids_slice(self, values, fill):
+        slots = np.arange(self.max_phases)
+        idx = np.minimum(self.gas_count[:, None] + slots, self.max_phases - 1)
+        present = slots < self.liquid_count[:, None]
+        if values.ndim == 3:
+            idx, present = idx[:, :, None], present[:, :, None]
+        return np.where(present, np.take_along_axis(values, idx, axis=1), fill)
+
+    def column(self, name):
+        r'''Method to retrieve a column of the table by name, reshaped to
+        :obj:`shape`.
+
+        Parameters
+        ----------
+        name : str
+            Name of a stored column, or one of 'T', 'P', 'zs', 'phase_count',
+            'gas_beta', 'gas_zs', 'liquids_betas', 'liquids_zs', 'betas',
+            'phase_zs', [-]
+
+        Returns
+        -------
+        values : ndarray
+            Column values, [various]
+        '''
+        try:
+            values = self.columns[name]
+        except KeyError:
+            if name not in ('T', 'P', 'zs', 'phase_count', 'gas_beta', 'gas_zs',
+                            'liquids_betas', 'liquids_zs', 'betas', 'phase_zs'):
+                raise KeyError("No column named %s" %(name))
+            values = getattr(self, name)
+            if name == 'zs' and values.ndim == 1:
+                return values
+        return values.reshape(self.shape + values.shape[1:])
+
+    def store(self, i, state):
+        r'''Method to add the result of a flash to the table, and calculate
+        any requested properties from it.
+
+        Parameters
+        ----------
+        i : int
+            Flat index of the point, [-]
+        state : :obj:`EquilibriumState`
+            Result of the flash, [-]
+        '''
+        phases = state.phases
+        if len(phases) > self.max_phases:
+            raise ValueError("%d phases do not fit in the table" %(len(phases)))
+        models = [self._model_index(phase) for phase in phases]
+        self.T[i] = state.T
+        self.P[i] = state.P
+        self.gas_count[i] = state.gas_count
+        self.liquid_count[i] = state.liquid_count
+        self.solid_count[i] = state.solid_count
+        count = len(phases)
+        self.betas[i, :count] = state.betas
+        self.phase_models[i, :count] = models
+        for k, phase in enumerate(phases):
+            self.phase_zs[i, k] = phase.zs
+        flash_specs = state.flash_specs
+        if flash_specs is not None:
+            for k in self.spec_keys:
+                if k not in ('T', 'P'):
+                    self.columns[k][i] = flash_specs[k]
+        for name in self.prop_names:
+            self._store_value(name, i, state.value(name))
+
+    def _store_value(self, name, i, value):
+        column = self.columns.get(name)
+        if column is None:
+            column = self.columns[name] = np.full((self.size,) + np.shape(value), np.nan)
+        try:
+            column[i] = value
+        except (TypeError, ValueError):
+            # Values that are not numbers, or change shape, are kept as objects
+            if column.dtype != object:
+                values = np.empty(self.size, dtype=object)
+                values[:] = list(column) if column.ndim == 1 else [list(v) for v in column]
+                column = self.columns[name] = values
+            column[i] = value
+
+    def _model_index(self, phase):
+        try:
+            by_type = self._models_by_type
+        except AttributeError:
+            by_type = self._models_by_type = {}
+            for k, model in enumerate(self.flasher.phases):
+                by_type.setdefault(type(model), []).append(k)
+        candidates = by_type.get(type(phase), ())
+        if len(candidates) == 1:
+            return candidates[0]
+        models = self.flasher.phases
+        if candidates and all([models[k] is models[candidates[0]] for k in candidates]):
+            # The same model used for several phases, as in two liquids
+            return candidates[0]
+        # Phases cloned from a model share its frozen model dictionary
+        frozen = phase.__dict__.get('_model')
+        if frozen is not None:
+            for k in candidates:
+                if models[k].__dict__.get('_model') is frozen:
+                    return k
+        # The base class model_hash is random; only compare real ones
+        if type(phase).model_hash is not Phase.model_hash:
+            h = phase.model_hash()
+            for k in candidates:
+                if models[k].model_hash() == h:
+                    return k
+        raise ValueError("Phase %s was not made from any model of the flasher" %(phase))
+
+    def state(self, i):
+        r'''Method to build the :obj:`EquilibriumState` of a point in the
+        table.
+
+        Parameters
+        ----------
+        i : int
+            Flat index of the point, [-]
+
+        Returns
+        -------
+        state : :obj:`EquilibriumState`
+            Rebuilt flash result, or None if the point failed to flash, [-]
+        '''
+        if i < 0:
+            i += self.size
+        gas_count, liquid_count = int(self.gas_count[i]), int(self.liquid_count[i])
+        count = gas_count + liquid_count + int(self.solid_count[i])
+        if not count:
+            return None
+        flasher = self.flasher
+        models = flasher.phases
+        T, P = float(self.T[i]), float(self.P[i])
+        zs = (self.zs[i] if self.zs.ndim == 2 else self.zs).tolist()
+        phases = [models[self.phase_models[i, k]].to(T=T, P=P, zs=self.phase_zs[i, k].tolist())
+                  for k in range(count)]
+        flash_specs = {'zs': zs}
+        for k in self.spec_keys:
+            flash_specs[k] = T if k == 'T' else (P if k == 'P' else float(self.columns[k][i]))
+        return EquilibriumState(T, P, zs, gas=phases[0] if gas_count else None,
+                                liquids=phases[gas_count:gas_count+liquid_count],
+                                solids=phases[gas_count+liquid_count:],
+                                betas=self.betas[i, :count].tolist(),
+                                flash_specs=flash_specs, constants=flasher.constants,
+                                correlations=flasher.correlations, flasher=flasher)
+
+    @staticmethod
+    def concatenate(flasher, tables, shape=None):
+        r'''Method to join tables of consecutive points into one table.
+
+        Parameters
+        ----------
+        flasher : :obj:`Flash <thermo.flash.Flash>`
+            Flasher the joined table refers to; the tables must have been
+            made by it or an identical copy of it, [-]
+        tables : list[:obj:`FlashResultTable`]
+            Tables to join, in order, [-]
+        shape : tuple[int], optional
+            Shape of the joined table, [-]
+
+        Returns
+        -------
+        table : :obj:`FlashResultTable`
+            Joined table, [-]
+        '''
+        first = tables[0]
+        size = sum(t.size for t in tables)
+        zs = first.zs if first.zs.ndim == 1 else np.concatenate([t.zs for t in tables])
+        new = FlashResultTable(flasher, size, zs, first.spec_keys, first.prop_names, shape)
+        for name in ('T', 'P', 'gas_count', 'liquid_count', 'solid_count', 'betas',
+                     'phase_zs', 'phase_models'):
+            setattr(new, name, np.concatenate([getattr(t, name) for t in tables]))
+        names = set()
+        for t in tables:
+            names.update(t.columns)
+        for name in names:
+            parts = [t.columns.get(name) for t in tables]
+            example = [p for p in parts if p is not None][0]
+            parts = [p if p is not None else np.full((t.size,) + example.shape[1:], np.nan)
+                     for p, t in zip(parts, tables)]
+            if any(p.dtype == object for p in parts):
+                parts = [p.astype(object) for p in parts]
+            new.columns[name] = np.concatenate(parts)
+        return new
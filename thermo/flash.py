@@ -58,6 +58,44 @@ Base Flash Class
    :members: flash
    :exclude-members:
 
+Tracking Flashes
+----------------
+.. autoclass:: FlashTracker
+   :members: flash, forget
+   :exclude-members:
+
+Profiling Flashes
+-----------------
+.. autoclass:: FlashProfiler
+   :members: summary, collapsed, save
+   :exclude-members:
+
+Solver Statistics
+-----------------
+.. autoclass:: FlashStatistics
+   :members: region, record, order, summary
+   :exclude-members:
+
+Phase Envelopes
+---------------
+.. autoclass:: PhaseEnvelope
+   :members: T_guess, P_guess
+   :exclude-members:
+
+.. autofunction:: phase_envelope_continuation
+
+Pure Fluid Tables
+-----------------
+.. autoclass:: PureFlashTable
+   :members: value, state, save, load, region_bounds
+   :exclude-members:
+
+Property Tables
+---------------
+.. autoclass:: FlashTable
+   :members: from_flasher, flash_row, value, save, load
+   :exclude-members:
+
 
 Specific Flash Algorithms
 =========================
@@ -75,7 +113,7 @@ __all__ = ['sequential_substitution_2P', 'sequential_substitution_GDEM3_2P',
            'dew_P_Michelsen_Mollerup',
            'minimize_gibbs_2P_transformed', 'sequential_substitution_Mehra_2P',
            'nonlin_2P', 'nonlin_n_2P', 'sequential_substitution_NP',
-           'minimize_gibbs_NP_transformed', 'FlashVL','FlashVLN', 'FlashPureVLS',
+           'minimize_gibbs_NP_transformed', 'newton_equilibrium_NP', 'FlashVL','FlashVLN', 'FlashPureVLS', 'FlashTracker',
            'TPV_HSGUA_guesses_1P_methods', 'TPV_solve_HSGUA_guesses_1P',
            'sequential_substitution_2P_HSGUAbeta',
            'sequential_substitution_2P_sat', 'TP_solve_VF_guesses',
@@ -88,10 +126,21 @@ __all__ = ['sequential_substitution_2P', 'sequential_substitution_GDEM3_2P',
            'nonlin_spec_NP',
            'TPV_solve_HSGUA_guesses_VL',
            'solve_P_VF_IG_K_composition_independent',
-           'solve_T_VF_IG_K_composition_independent'
+           'solve_T_VF_IG_K_composition_independent',
+           'cubic_flash_TP_2P', 'PhaseEnvelope', 'phase_envelope_continuation',
+           'PureFlashTable',
+           'solve_PT_2P', 'FlashStatistics', 'FlashProfiler', 'FlashTable'
            ]
 
 
+from collections import OrderedDict
+from itertools import chain
+import json
+import threading
+from copy import copy
+from uuid import uuid4
+from time import perf_counter
+from math import isinf
 from fluids.constants import R, R2, R_inv
 from fluids.numerics import (UnconvergedError, trunc_exp, newton,
                              brenth, secant, bisect,
@@ -118,14 +167,16 @@ from chemicals.flash_basic import flash_wilson, flash_Tb_Tc_Pc, flash_ideal
 from chemicals.exceptions import TrivialSolutionError, PhaseCountReducedError, PhaseExistenceImpossible
 from chemicals.iapws import iapws95_Psat, iapws95_Tsat, iapws95_rhog_sat, iapws95_rhol_sat, iapws95_Tc, iapws95_Pc, iapws95_MW, iapws95_T
 
-from thermo.utils import has_matplotlib
-from thermo.equilibrium import EquilibriumState
+from thermo.utils import has_matplotlib, TPD, Stateva_Tsvetkov_TPDF
+from thermo.equilibrium import EquilibriumState, FlashResultTable
 from thermo.phases import Phase, gas_phases, liquid_phases, solid_phases, CEOSLiquid, CEOSGas, CoolPropGas, CoolPropLiquid, CoolPropPhase, GibbsExcessLiquid, IdealGas, IAPWS95Liquid, IAPWS95Gas, IAPWS95
 from thermo.phases import CPPQ_INPUTS, CPQT_INPUTS, CPrhoT_INPUTS, CPunknown, CPiDmolar
 from thermo import phases
 from thermo.phase_identification import identify_sort_phases
 from thermo.bulk import default_settings
-from thermo.eos_mix import VDWMIX, IGMIX
+from thermo.eos_mix import (batch_cubic_eos_constants, VDWMIX, IGMIX, PRMIX, PR78MIX, PRSVMIX, PRSV2MIX,
+                            TWUPRMIX, SRKMIX, TWUSRKMIX, APISRKMIX, RKMIX)
+from thermo.eos_mix_methods import cubic_lnphis_many, cubic_lnphis_fastest, a_alpha_aijs_composition_independent
 from thermo.property_package import StabilityTester
 from thermo.coolprop import CPiP_min
 
@@ -329,10 +380,13 @@ def sequential_substitution_2P(T, P, V, zs, xs_guess, ys_guess, liquid_phase,
 
 def sequential_substitution_NP(T, P, zs, compositions_guesses, betas_guesses,
                                phases, maxiter=1000, tol=1E-13,
-                               trivial_solution_tol=1e-5, ref_phase=2):
+                               trivial_solution_tol=1e-5, ref_phase=2,
+                               acceleration=None, acc_frequency=5, acc_delay=5,
+                               acc_max_step=5.0):
 
     compositions = compositions_guesses
-    cmps = range(len(zs))
+    N = len(zs)
+    cmps = range(N)
     phase_count = len(phases)
     phases_iter = range(phase_count)
     phase_iter_n1 = range(phase_count - 1)
@@ -343,26 +397,71 @@ def sequential_substitution_NP(T, P, zs, compositions_guesses, betas_guesses,
     compositions_K_order = [compositions[i] for i in phases_iter if i != ref_phase]
     compositions_ref = compositions_guesses[ref_phase]
 
+    # Dominant eigenvalue acceleration of the lnKs, Crowe and Nishio (1975)
+    # for DEM and Mehra, Heidemann and Aziz (1983) for GDEM
+    if acceleration == 'GDEM':
+        acc_history = 3
+    elif acceleration == 'DEM':
+        acc_history = 2
+    elif acceleration is None:
+        acc_history = 0
+    else:
+        raise ValueError("Unrecognized acceleration method")
+    all_lnKs = []
+    err_accelerated = None
+
     for iteration in range(maxiter):
         phases = [phases[i].to_TP_zs(T=T, P=P, zs=compositions[i]) for i in phases_iter]
         lnphis = [phases[i].lnphis() for i in phases_iter]
 
-        Ks = []
         lnphis_ref = lnphis[ref_phase]
+        lnKs = []
         for i in phases_iter:
             if i != ref_phase:
                 lnphis_i = lnphis[i]
+                lnKs.extend([lnphis_ref[j] - lnphis_i[j] for j in cmps])
+
+        Ks = []
+        for i in phase_iter_n1:
+            lnKs_i = lnKs[i*N:(i + 1)*N]
+            try:
+                Ks.append([exp(lnK) for lnK in lnKs_i])
+            except OverflowError:
+                Ks.append([trunc_exp(lnK) for lnK in lnKs_i])
+        # The Ks from the fugacities are used for the error; the accelerated
+        # ones only for the next compositions
+        Ks_RR = Ks
+
+        accelerated = False
+        if acc_history:
+            if (not (iteration % acc_frequency) and iteration > acc_delay
+                    and len(all_lnKs) >= acc_history):
                 try:
-                    Ks.append([exp(lnphis_ref[j] - lnphis_i[j]) for j in cmps])
-                except OverflowError:
-                    Ks.append([trunc_exp(lnphis_ref[j] - lnphis_i[j]) for j in cmps])
+                    if acc_history == 3:
+                        dlnKs = gdem(lnKs, all_lnKs[-1], all_lnKs[-2], all_lnKs[-3])
+                    else:
+                        dlnKs = dem(lnKs, all_lnKs[-1], all_lnKs[-2])
+                except ZeroDivisionError:
+                    dlnKs = None
+                # Only take steps which are finite and not too large
+                if dlnKs is not None and all([abs(d) < acc_max_step for d in dlnKs]):
+                    lnKs = [lnK + d for lnK, d in zip(lnKs, dlnKs)]
+                    Ks_RR = [[trunc_exp(lnK) for lnK in lnKs[i*N:(i + 1)*N]] for i in phase_iter_n1]
+                    accelerated = True
+            if accelerated:
+                # The iteration restarts from the extrapolated point
+                all_lnKs = [lnKs]
+            else:
+                all_lnKs.append(lnKs)
+                if len(all_lnKs) > acc_history:
+                    del all_lnKs[0]
 
 
         beta_guesses = [betas[i] for i in phases_iter if i != ref_phase]
 
         #if phase_count == 3:
         #    Rachford_Rice_solution2(zs, Ks[0], Ks[1], beta_y=beta_guesses[0], beta_z=beta_guesses[1])
-        betas_new, compositions_new = Rachford_Rice_solutionN(zs, Ks, beta_guesses)
+        betas_new, compositions_new = Rachford_Rice_solutionN(zs, Ks_RR, beta_guesses)
         # Sort the order back
         beta_ref_new = betas_new[-1]
         betas_new = betas_new[:-1]
@@ -392,6 +491,13 @@ def sequential_substitution_NP(T, P, zs, compositions_guesses, betas_guesses,
                         pass
 #        print(betas, Ks, 'calculated', err)
         # print(err)
+        if err_accelerated is not None:
+            # Stop accelerating if the last accelerated step made things worse
+            if err > err_accelerated:
+                acc_history = 0
+            err_accelerated = None
+        if accelerated:
+            err_accelerated = err
 
         compositions = compositions_new
         compositions_K_order = compositions_K_order_new
@@ -412,6 +518,208 @@ def sequential_substitution_NP(T, P, zs, compositions_guesses, betas_guesses,
 
 
 
+def newton_equilibrium_NP(T, P, zs, compositions_guesses, betas_guesses,
+                          phases, maxiter=100, tol=1E-13,
+                          trivial_solution_tol=1e-5, ss_maxiter=1000,
+                          switch_tol=1e-7, acceleration=None, acc_frequency=5,
+                          acc_delay=5):
+    r'''Solve a multiphase flash at fixed temperature and pressure with a
+    second order method. A few iterations of sequential substitution are
+    done first, until the sum of squared errors of the K values is under
+    `switch_tol`; then the mole numbers of each phase are converged with
+    Newton's method, using the analytical mole number derivatives of the
+    log fugacity coefficients of each phase (`dlnphis_dns`). Each Newton
+    step is limited to keep every mole number positive, and halved until
+    the residual decreases.
+
+    The phase with the largest phase fraction after the sequential
+    substitution is used as the reference phase, whose mole numbers are
+    those of the feed less those of the other phases.
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    P : float
+        Pressure, [Pa]
+    zs : list[float]
+        Overall mole fractions, [-]
+    compositions_guesses : list[list[float]]
+        Mole fraction guesses of each phase, [-]
+    betas_guesses : list[float]
+        Phase fraction guesses; the last may be omitted, [-]
+    phases : list[:obj:`Phase <thermo.phases.Phase>`]
+        Phase models, [-]
+    maxiter : int, optional
+        Maximum number of Newton iterations, [-]
+    tol : float, optional
+        Convergence tolerance, on the same sum of squared K value errors as
+        :obj:`sequential_substitution_NP`, [-]
+    trivial_solution_tol : float, optional
+        Sum of absolute composition differences from the reference phase
+        under which a phase is considered identical to it, [-]
+    ss_maxiter : int, optional
+        Maximum number of sequential substitution iterations, [-]
+    switch_tol : float, optional
+        Error under which Newton's method is started, [-]
+    acceleration : str or None, optional
+        Acceleration of the sequential substitution, 'GDEM' or 'DEM'; see
+        :obj:`sequential_substitution_NP`, [-]
+    acc_frequency : int, optional
+        Number of iterations between accelerated steps, [-]
+    acc_delay : int, optional
+        Number of iterations before the first accelerated step, [-]
+
+    Returns
+    -------
+    betas : list[float]
+        Phase fractions, [-]
+    compositions : list[list[float]]
+        Mole fractions of each phase, [-]
+    phases : list[:obj:`Phase <thermo.phases.Phase>`]
+        Phases at the solution, [-]
+    iterations : int
+        Number of sequential substitution and Newton iterations, [-]
+    err : float
+        Final error, [-]
+    '''
+    N = len(zs)
+    cmps = range(N)
+    phase_count = len(phases)
+    phases_iter = range(phase_count)
+    betas = list(betas_guesses)
+    if len(betas) < phase_count:
+        betas.append(1.0 - sum(betas))
+    compositions = [list(comp) for comp in compositions_guesses]
+
+    # Sequential substitution, with the last phase as the reference
+    betas, compositions, phases, iteration, err = sequential_substitution_NP(
+        T, P, zs, compositions, betas, phases, maxiter=ss_maxiter, tol=switch_tol,
+        ref_phase=phase_count - 1, acceleration=acceleration,
+        acc_frequency=acc_frequency, acc_delay=acc_delay)
+
+    def check_trivial(compositions, iteration, err):
+        for k in phases_iter:
+            for m in range(k):
+                comp_difference = sum([abs(compositions[k][i] - compositions[m][i]) for i in cmps])
+                if comp_difference < trivial_solution_tol:
+                    raise TrivialSolutionError("Converged to trivial condition, compositions of two phases equal",
+                                               comp_difference, iteration, err)
+
+    if err < tol:
+        check_trivial(compositions, iteration, err)
+        return betas, compositions, phases, iteration, err
+
+    ref_phase = max(phases_iter, key=lambda k: betas[k])
+    others = [k for k in phases_iter if k != ref_phase]
+    Nvars = N*len(others)
+    nan = float('nan')
+
+    def evaluate(flows):
+        # flows are the mole numbers of the phases other than the reference
+        ref_flows = list(zs)
+        for k_flows in flows:
+            for i in cmps:
+                ref_flows[i] -= k_flows[i]
+        all_flows = list(flows)
+        all_flows.insert(ref_phase, ref_flows)
+        new_betas, new_comps, new_phases, lnfs, dlnfs = [], [], [], [], []
+        for k in phases_iter:
+            n = all_flows[k]
+            beta = sum(n)
+            xs = [ni/beta for ni in n]
+            phase = phases[k].to_TP_zs(T=T, P=P, zs=xs)
+            lnphis = phase.lnphis()
+            dlnphis_dns = phase.dlnphis_dns()
+            beta_inv = 1.0/beta
+            # Derivatives of the log fugacities with respect to the mole
+            # numbers of the phase
+            dlnf = []
+            for i in cmps:
+                row = [(v - 1.0)*beta_inv for v in dlnphis_dns[i]]
+                row[i] += 1.0/n[i]
+                dlnf.append(row)
+            new_betas.append(beta)
+            new_comps.append(xs)
+            new_phases.append(phase)
+            lnfs.append([log(xs[i]) + lnphis[i] for i in cmps])
+            dlnfs.append(dlnf)
+        lnfs_ref, dlnf_ref = lnfs[ref_phase], dlnfs[ref_phase]
+        gs = []
+        for k in others:
+            lnfs_k = lnfs[k]
+            gs.extend([lnfs_k[i] - lnfs_ref[i] for i in cmps])
+        J = [[0.0]*Nvars for _ in range(Nvars)]
+        for a, k in enumerate(others):
+            dlnf_k = dlnfs[k]
+            for i in cmps:
+                row = J[a*N + i]
+                for b in range(len(others)):
+                    for j in cmps:
+                        row[b*N + j] = dlnf_ref[i][j]
+                for j in cmps:
+                    row[a*N + j] += dlnf_k[i][j]
+        return new_betas, new_comps, new_phases, gs, J
+
+    def K_err(gs):
+        # exp(-g) is the K value of sequential substitution times the
+        # composition ratio, so the errors are comparable
+        err = 0.0
+        for g in gs:
+            e = trunc_exp(-g) - 1.0
+            err += e*e
+        return err
+
+    flows = [[betas[k]*compositions[k][i] for i in cmps] for k in others]
+    try:
+        betas, compositions, phases, gs, J = evaluate(flows)
+    except (ValueError, ZeroDivisionError):
+        raise UnconvergedError("Newton's method could not be started")
+    f = sum([g*g for g in gs])
+    for newton_iter in range(maxiter):
+        iteration += 1
+        err = K_err(gs)
+        if err < tol:
+            break
+        try:
+            d = py_solve(J, [-g for g in gs])
+        except (ValueError, ZeroDivisionError):
+            # numpy's LinAlgError is a ValueError
+            raise UnconvergedError("Singular Jacobian in Newton's method")
+        # Limit the step to keep every mole number positive
+        alpha = 1.0
+        ref_change = [0.0]*N
+        for a in range(len(others)):
+            for i in cmps:
+                di = d[a*N + i]
+                ref_change[i] -= di
+                n = flows[a][i]
+                if n + alpha*di <= 0.0:
+                    alpha = min(alpha, -0.9*n/di)
+        ref_flows = [zs[i] - sum([flows[a][i] for a in range(len(others))]) for i in cmps]
+        for i in cmps:
+            if ref_flows[i] + alpha*ref_change[i] <= 0.0:
+                alpha = min(alpha, -0.9*ref_flows[i]/ref_change[i])
+        for _ in range(30):
+            new_flows = [[flows[a][i] + alpha*d[a*N + i] for i in cmps] for a in range(len(others))]
+            try:
+                sln = evaluate(new_flows)
+                f_new = sum([g*g for g in sln[3]])
+            except (ValueError, ZeroDivisionError, OverflowError):
+                f_new = nan
+            if f_new <= (1.0 - 1e-4*alpha)*f:
+                break
+            alpha *= 0.5
+        else:
+            raise UnconvergedError("Line search failed in Newton's method")
+        flows, f = new_flows, f_new
+        betas, compositions, phases, gs, J = sln
+    else:
+        raise UnconvergedError("End of Newton's method without convergence")
+
+    check_trivial(compositions, iteration, err)
+    return betas, compositions, phases, iteration, err
+
 
 def sequential_substitution_Mehra_2P(T, P, zs, xs_guess, ys_guess, liquid_phase,
                                      gas_phase, maxiter=1000, tol=1E-13,
@@ -553,7 +861,6 @@ def sequential_substitution_GDEM3_2P(T, P, zs, xs_guess, ys_guess, liquid_phase,
         lnKs = [(l - g) for l, g in zip(lnphis_l, lnphis_g)]
         if not (iteration %acc_frequency) and iteration > acc_delay:
             dlnKs = gdem(lnKs, all_lnKs[-1], all_lnKs[-2], all_lnKs[-3])
-            print(dlnKs)
             lnKs = [lnKs[i] + dlnKs[i] for i in cmps]
 
 
@@ -1244,10 +1551,11 @@ def nonlin_2P_newton(T, P, zs, xs_guess, ys_guess, liquid_phase,
 
 
 def gdem(x, x1, x2, x3):
+    # Differences between successive iterations, as in Mehra et al. (1983)
     cmps = range(len(x))
-    dx2 = [x[i] - x3[i] for i in cmps]
-    dx1 = [x[i] - x2[i] for i in cmps]
     dx = [x[i] - x1[i] for i in cmps]
+    dx1 = [x1[i] - x2[i] for i in cmps]
+    dx2 = [x2[i] - x3[i] for i in cmps]
 
     b01, b02, b12, b11, b22 = 0.0, 0.0, 0.0, 0.0, 0.0
 
@@ -1266,6 +1574,24 @@ def gdem(x, x1, x2, x3):
     return [factor*(dx[i] - mu2*dx1[i]) for i in cmps]
 
 
+def dem(x, x1, x2):
+    cmps = range(len(x))
+    dx = [x[i] - x1[i] for i in cmps]
+    dx1 = [x1[i] - x2[i] for i in cmps]
+
+    b01, b11 = 0.0, 0.0
+    for i in cmps:
+        b01 += dx[i]*dx1[i]
+        b11 += dx1[i]*dx1[i]
+    # Dominant eigenvalue of the fixed point iteration; its step is
+    # extrapolated as a geometric series
+    lambda1 = b01/b11
+    if lambda1 >= 1.0 or lambda1 <= 0.0:
+        raise ZeroDivisionError("Eigenvalue unsuitable for acceleration")
+    factor = lambda1/(1.0 - lambda1)
+    return [factor*dx[i] for i in cmps]
+
+
 def minimize_gibbs_2P_transformed(T, P, zs, xs_guess, ys_guess, liquid_phase,
                                   gas_phase, maxiter=1000, tol=1E-13,
                                   trivial_solution_tol=1e-5, V_over_F_guess=None):
@@ -1737,6 +2063,296 @@ def dew_bubble_newton_zs(guess, fixed_val, zs, liquid_phase, gas_phase,
 
 
 
+def phase_envelope_continuation(zs, liquid_phase, gas_phase, T_guess, P_guess,
+                                 comp_guess, P_min=None, P_max=1e9, step=0.1,
+                                max_step=0.15, min_step=1e-4, max_points=500,
+                                maxiter=30, xtol=1e-9, critical_lnK=0.05):
+    r'''Trace the bubble and dew curves of a mixture of fixed composition
+    through its critical point by numerical continuation, as described in
+    [1]_.
+
+    Each point on the envelope solves :math:`N+2` equations in the variables
+    :math:`\ln K_i`, :math:`\ln T`, and :math:`\ln P`: the equality of
+    fugacities, the sum of the incipient phase mole fractions, and a
+    specification of one of the variables. The trace starts at the bubble
+    point (`V_over_F` = 0) at `P_guess` and moves to higher pressures.
+
+    After each point is converged with Newton's method, the derivatives of
+    all variables with respect to the specified variable are obtained from
+    the converged Jacobian. The variable which changes the most is
+    specified at the next point, and the next point is predicted linearly
+    from the derivatives. The changes in `lnK` are measured relative to their
+    magnitude when it is over one. The step is lengthened when Newton's
+    method converges quickly and halved when it fails.
+
+    When all the K values are about to change sign at once, or would all be
+    nearly one, the trace is passing the critical point; the largest `lnK` is specified at the mirror
+    of its current value, and the trace continues on the dew curve with the
+    phase models swapped; the jump is made from where the largest `lnK` is
+    `critical_lnK`. The critical point is interpolated with cubic
+    Hermite polynomials between the two points on either side of it. The
+    trace ends when the pressure falls under `P_min`.
+
+    Parameters
+    ----------
+    zs : list[float]
+        Mole fractions of the mixture, [-]
+    liquid_phase : :obj:`Phase <thermo.phases.Phase>`
+        Liquid phase model; must implement `dlnphis_dT`, `dlnphis_dP`, and
+        `dlnphis_dns`, [-]
+    gas_phase : :obj:`Phase <thermo.phases.Phase>`
+        Gas phase model; must implement `dlnphis_dT`, `dlnphis_dP`, and
+        `dlnphis_dns`, [-]
+    T_guess : float
+        Guess for the bubble temperature at `P_guess`, [K]
+    P_guess : float
+        Pressure of the first bubble point, [Pa]
+    comp_guess : list[float]
+        Guess for the incipient gas composition at the first bubble point,
+        [-]
+    P_min : float, optional
+        Pressure under which the trace ends; defaults to `P_guess`, [Pa]
+    P_max : float, optional
+        Pressure over which the trace ends, [Pa]
+    step : float, optional
+        Initial change in the specified variable between points, [-]
+    max_step : float, optional
+        Largest change in the specified variable between points, [-]
+    min_step : float, optional
+        Change in the specified variable under which the trace ends, [-]
+    max_points : int, optional
+        Maximum number of points on the envelope, [-]
+    maxiter : int, optional
+        Maximum number of Newton iterations for each point, [-]
+    xtol : float, optional
+        Largest change in any variable at which a point is converged, [-]
+    critical_lnK : float, optional
+        Magnitude of the largest `lnK` from which the critical point is
+        jumped over, [-]
+
+    Returns
+    -------
+    Ts : list[float]
+        Temperatures along the envelope, [K]
+    Ps : list[float]
+        Pressures along the envelope, [Pa]
+    betas : list[float]
+        Vapor fraction of each point; 0 on the bubble curve and 1 on the dew
+        curve, [-]
+    comps : list[list[float]]
+        Incipient phase compositions of each point, [-]
+    critical_point : tuple(float, float) or None
+        Temperature and pressure of the critical point, if it was passed,
+        [K, Pa]
+    cricondenbar : tuple(float, float)
+        Temperature and pressure of the highest pressure on the envelope,
+        [K, Pa]
+    cricondentherm : tuple(float, float)
+        Temperature and pressure of the highest temperature on the envelope,
+        [K, Pa]
+    iterations : int
+        Total number of Newton iterations, [-]
+
+    References
+    ----------
+    .. [1] Michelsen, Michael L. "Calculation of Phase Envelopes and Critical
+       Points for Multicomponent Mixtures." Fluid Phase Equilibria 4, no. 1
+       (1980): 1-10. https://doi.org/10.1016/0378-3812(80)80001-X.
+    '''
+    N = len(zs)
+    cmps = range(N)
+    iT, iP = N, N + 1
+    size = N + 2
+    if P_min is None:
+        P_min = P_guess
+    counts = [0]
+
+    def evaluate(X, beta):
+        T, P = exp(X[iT]), exp(X[iP])
+        Ks = [trunc_exp(X[i]) for i in cmps]
+        if beta == 0.0:
+            xs = zs
+            ys = [Ks[i]*zs[i] for i in cmps]
+        else:
+            ys = zs
+            xs = [zs[i]/Ks[i] for i in cmps]
+        Sx, Sy = sum(xs), sum(ys)
+        l = liquid_phase.to_TP_zs(T=T, P=P, zs=[xi/Sx for xi in xs])
+        g = gas_phase.to_TP_zs(T=T, P=P, zs=[yi/Sy for yi in ys])
+        lnphis_l, lnphis_g = l.lnphis(), g.lnphis()
+        dlnphis_dT_l, dlnphis_dT_g = l.dlnphis_dT(), g.dlnphis_dT()
+        dlnphis_dP_l, dlnphis_dP_g = l.dlnphis_dP(), g.dlnphis_dP()
+
+        F = np.zeros(size)
+        J = np.zeros((size, size))
+        for i in cmps:
+            F[i] = X[i] + lnphis_g[i] - lnphis_l[i]
+            J[i, i] = 1.0
+            J[i, iT] = T*(dlnphis_dT_g[i] - dlnphis_dT_l[i])
+            J[i, iP] = P*(dlnphis_dP_g[i] - dlnphis_dP_l[i])
+        F[N] = Sy - Sx
+        # Only the incipient phase changes with the K values; lnphis are
+        # homogeneous of degree zero in the mole numbers
+        if beta == 0.0:
+            dlnphis_dns = g.dlnphis_dns()
+            comp, S = ys, Sy
+        else:
+            dlnphis_dns = l.dlnphis_dns()
+            comp, S = xs, Sx
+        for i in cmps:
+            for j in cmps:
+                J[i, j] += dlnphis_dns[i][j]*comp[j]/S
+        for j in cmps:
+            J[N, j] = comp[j]
+        return F, J, comp, S
+
+    def converge(X, beta, s, S):
+        X = np.array(X, dtype=float)
+        X[s] = S
+        for iteration in range(maxiter):
+            counts[0] += 1
+            F, J, comp, tot = evaluate(X, beta)
+            J[N + 1, s] = 1.0
+            dX = np.linalg.solve(J, -F)
+            # Limit the changes in T and P
+            big = max(abs(dX[iT]), abs(dX[iP]))
+            if big > 0.2:
+                dX *= 0.2/big
+            X += dX
+            if np.max(np.abs(dX)) < xtol:
+                break
+        else:
+            raise UnconvergedError("Phase envelope point did not converge")
+        if np.max(np.abs(X[:N])) < 1e-7:
+            raise ValueError("Converged to the trivial solution")
+        return X, J, iteration + 1, [ci/tot for ci in comp]
+
+    def sensitivity(J, s):
+        # J is the converged Jacobian with variable `s` specified
+        rhs = np.zeros(size)
+        rhs[N + 1] = 1.0
+        return np.linalg.solve(J, rhs)
+
+    X0 = [log(comp_guess[i]/zs[i]) for i in cmps] + [log(T_guess), log(P_guess)]
+    beta = 0.0
+    X, J, _, comp = converge(X0, beta, iP, X0[iP])
+    tangent = sensitivity(J, iP)
+    Xs, betas, comps, tangents = [X], [beta], [comp], [tangent]
+    critical_point = None
+    h = step
+
+    while len(Xs) < max_points:
+        # Specify the variable which changes the most; large lnKs are
+        # allowed to change in proportion to their size
+        weights = np.ones(size)
+        weights[:N] = 1.0/np.maximum(np.abs(X[:N]), 1.0)
+        s = int(np.argmax(np.abs(tangent)*weights))
+        t = tangent/abs(tangent[s])
+        X_pred = X + t*(h/weights[s])
+        lnKs, lnKs_pred = X[:N], X_pred[:N]
+        crossing = (float(np.dot(lnKs, lnKs_pred)) < 0.0
+                    or float(np.max(np.abs(lnKs_pred))) < critical_lnK)
+        if crossing:
+            k = int(np.argmax(np.abs(lnKs)))
+            t_k = t/t[k]
+            if abs(lnKs[k]) > 2.0*critical_lnK:
+                # Approach the critical point before jumping over it
+                crossing = False
+                s = k
+                X_pred = X + t_k*(copysign(critical_lnK, lnKs[k]) - lnKs[k])
+        try:
+            if crossing:
+                X_pred = X + t_k*(-2.0*lnKs[k])
+                # Past the critical point the phases exchange roles
+                X_pred[:N] = -X_pred[:N]
+                beta_new = 1.0 - beta
+                X_new, J_new, iterations, comp = converge(X_pred, beta_new, k, X_pred[k])
+                s = k
+            else:
+                beta_new = beta
+                X_new, J_new, iterations, comp = converge(X_pred, beta, s, X_pred[s])
+        except (UnconvergedError, ValueError, ZeroDivisionError, OverflowError,
+                np.linalg.LinAlgError):
+            h *= 0.5
+            if h < min_step:
+                break
+            continue
+
+        tangent_new = sensitivity(J_new, s)
+        # Keep travelling in the same direction in T and P
+        if crossing:
+            dTP = X_new[iT:] - X[iT:]
+            direction = float(np.dot(tangent_new[iT:], dTP))
+        else:
+            direction = float(np.dot(tangent_new, X_new - X))
+        if direction < 0.0:
+            tangent_new = -tangent_new
+
+        if crossing:
+            # Hermite interpolation in the old lnK of the specified component
+            s_A, s_B = X[k], -X_new[k]
+            dS = s_B - s_A
+            u = (0.0 - s_A)/dS
+            h00, h10 = 2*u**3 - 3*u**2 + 1, u**3 - 2*u**2 + u
+            h01, h11 = -2*u**3 + 3*u**2, u**3 - u**2
+            # Derivatives of lnT and lnP with respect to the old lnK
+            sens_B = -tangent_new*np.sign(tangent_new[k])
+            crit = []
+            for i in (iT, iP):
+                crit.append(exp(h00*X[i] + h10*dS*t_k[i] + h01*X_new[i] + h11*dS*sens_B[i]))
+            critical_point = (crit[0], crit[1])
+        else:
+            if iterations <= 3:
+                h = min(1.5*h, max_step)
+            elif iterations > 6:
+                h *= 0.7
+
+        X, J, tangent, beta = X_new, J_new, tangent_new, beta_new
+        Xs.append(X)
+        betas.append(beta)
+        comps.append(comp)
+        tangents.append(tangent)
+        P = exp(X[iP])
+        if P < P_min or P > P_max:
+            break
+
+    def extremum(var, s):
+        # Highest value of `var`; where the tangent turns between two points
+        # on the same curve, the point where d(var)/d(s) is zero is found
+        i_max = max(range(len(Xs)), key=lambda i: Xs[i][var])
+        best = Xs[i_max]
+        for i in (i_max - 1, i_max):
+            if i < 0 or i + 1 >= len(Xs) or betas[i] != betas[i+1]:
+                continue
+            if tangents[i][var]*tangents[i+1][var] > 0.0:
+                continue
+            X_A, X_B, beta = Xs[i], Xs[i+1], betas[i]
+            found = []
+
+            def to_solve(val):
+                X_guess = X_A + (val - X_A[s])/(X_B[s] - X_A[s])*(X_B - X_A)
+                X_new, J_new, _, _ = converge(X_guess, beta, s, val)
+                found[:] = [X_new]
+                return sensitivity(J_new, s)[var]
+            try:
+                brenth(to_solve, X_A[s], X_B[s], xtol=1e-10)
+            except Exception:
+                continue
+            if found[0][var] >= best[var]:
+                best = found[0]
+        best = (exp(best[iT]), exp(best[iP]))
+        if critical_point is not None and critical_point[var - iT] > best[var - iT]:
+            best = critical_point
+        return best
+
+    cricondenbar = extremum(iP, iT)
+    cricondentherm = extremum(iT, iP)
+
+    Ts = [exp(X[iT]) for X in Xs]
+    Ps = [exp(X[iP]) for X in Xs]
+    return Ts, Ps, betas, comps, critical_point, cricondenbar, cricondentherm, counts[0]
+
+
 l_undefined_T_msg = "Could not calculate liquid conditions at provided temperature %s K (mole fracions %s)"
 g_undefined_T_msg = "Could not calculate vapor conditions at provided temperature %s K (mole fracions %s)"
 l_undefined_P_msg = "Could not calculate liquid conditions at provided pressure %s Pa (mole fracions %s)"
@@ -4189,6 +4805,137 @@ def cm_flash_tol():
     return cm_flash
 
 
+def _grid_flash_rows(flasher, zs, spec_keys, spec0s, spec1s, props=None,
+                    store=True, hot_start_rows=False, table=None):
+    # Flash every combination of `spec0s` (rows) and `spec1s` (columns);
+    # failures are returned rather than raised so a grid always completes.
+    # With a `table`, results are only written into it
+    if table is not None:
+        store, props = False, None
+    do_props = props is not None
+    scalar_props = isinstance(props, str)
+    key0, key1 = spec_keys
+    flashes, calc_props, failures = [], [], []
+    i = 0
+    for spec0 in spec0s:
+        row_flashes, row_props = [], []
+        prev = None
+        for spec1 in spec1s:
+            flash_specs = {'zs': zs, key0: spec0, key1: spec1}
+            state = None
+            if prev is not None:
+                try:
+                    state = flasher.flash(hot_start=prev, **flash_specs)
+                    if ((prev.phase_count > 1 and state.phase_count != prev.phase_count)
+                            or not _grid_flash_hot_stable(flasher, state)):
+                        # Hot starts from a multiphase point can skip the
+                        # stability test; let the full flash decide
+                        state = None
+                except Exception:
+                    state = None
+            if state is None:
+                try:
+                    state = flasher.flash(**flash_specs)
+                except Exception as e:
+                    failures.append((flash_specs, e))
+            if table is not None and state is not None:
+                try:
+                    table.store(i, state)
+                except Exception as e:
+                    failures.append((flash_specs, e))
+            i += 1
+            if hot_start_rows:
+                prev = state
+            if store:
+                row_flashes.append(state)
+            if do_props:
+                if scalar_props:
+                    state_props = state.value(props) if state is not None else None
+                else:
+                    state_props = [state.value(s) for s in props] if state is not None else [None for s in props]
+                row_props.append(state_props)
+        if store:
+            flashes.append(row_flashes)
+        if do_props:
+            calc_props.append(row_props)
+    return flashes, calc_props, failures
+
+def _grid_flash_hot_stable(flasher, state):
+    # Hot starts converge the phases of the previous point without looking
+    # for a new one; the phases are in equilibrium so testing one of them
+    # against each phase model is enough
+    stability_test = getattr(flasher, 'stability_test_Michelsen', None)
+    if stability_test is None or flasher.N == 1:
+        return True
+    if state.phase_count >= getattr(flasher, 'max_phases', 2):
+        return True
+    T, P = state.T, state.P
+    phase = state.phases[0]
+    existing_comps = [p.zs for p in state.phases]
+    for model in flasher.unique_phases:
+        if model is None:
+            continue
+        other = model.to(T=T, P=P, zs=phase.zs)
+        if not stability_test(T, P, phase.zs, phase, other, existing_comps=existing_comps)[0]:
+            return False
+    return True
+
+_grid_flash_worker_flasher = None
+
+def _grid_flash_worker_init(flasher):
+    global _grid_flash_worker_flasher
+    _grid_flash_worker_flasher = flasher
+
+def _grid_flash_check_executor(executor):
+    # Flashers keep mutable state between flashes and cannot be shared by threads
+    from concurrent.futures import ThreadPoolExecutor
+    if isinstance(executor, ThreadPoolExecutor):
+        raise ValueError("Flashers are not thread-safe; use a process based executor")
+
+def _grid_flash_worker_rows(flasher, zs, spec_keys, spec0s, spec1s, props, store,
+                            hot_start_rows, table=False):
+    if table:
+        if flasher is None:
+            flasher = _grid_flash_worker_flasher
+        table = FlashResultTable(flasher, len(spec0s)*len(spec1s), zs, spec_keys, props)
+        _, _, failures = _grid_flash_rows(flasher, zs, spec_keys, spec0s, spec1s,
+                                          hot_start_rows=hot_start_rows, table=table)
+        table.flasher = None
+        table.__dict__.pop('_models_by_type', None)
+        return table, None, [(flash_specs, str(e)) for flash_specs, e in failures]
+    # In a worker process created by grid_flash, the results are private to
+    # the worker; only send back what is needed to rebuild each result in the
+    # parent, and leave the flasher, constants and correlations behind
+    strip = flasher is None
+    if strip:
+        flasher = _grid_flash_worker_flasher
+    flashes, calc_props, failures = _grid_flash_rows(flasher, zs, spec_keys, spec0s,
+                                                    spec1s, props, store, hot_start_rows)
+    stripped = []
+    for row in flashes:
+        stripped_row = []
+        for state in row:
+            if state is None:
+                stripped_row.append((None,)*8)
+                continue
+            if strip:
+                for phase in state.phases:
+                    phase.__dict__.pop('result', None)
+                    phase.__dict__.pop('constants', None)
+                    phase.__dict__.pop('correlations', None)
+            stripped_row.append((state.T, state.P, state.gas, state.liquids, state.solids,
+                                 state.betas, state.flash_specs, state.flash_convergence))
+        stripped.append(stripped_row)
+    failures = [(flash_specs, str(e)) for flash_specs, e in failures]
+    return stripped, calc_props, failures
+
+
+def round_sig(x, sig_figs):
+    # Round to a number of significant figures, for building cache keys
+    if x == 0.0 or x != x or isinf(x):
+        return x
+    return round(x, sig_figs - 1 - int(floor(log10(abs(x)))))
+
 empty_flash_conv = {'iterations': 0, 'err': 0.0, 'stab_guess_name': None}
 one_in_list = [1.0]
 empty_list = []
@@ -4209,6 +4956,13 @@ class Flash(object):
         Absolute minimum pressure to search for a valid flash, [Pa]
     P_MAX_FIXED : float
         Absolute maximum pressure to search for a valid flash, [Pa]
+    FLASH_CACHE_SIZE : int
+        Number of flash results to keep in a least-recently-used cache, and
+        return again when a flash with the same specifications is requested;
+        0 disables the cache, [-]
+    FLASH_CACHE_SIG_FIGS : int
+        Number of significant figures the specifications are rounded to when
+        looking up the flash cache, [-]
     '''
 
     T_MIN_FIXED = Phase.T_MIN_FIXED
@@ -4217,6 +4971,9 @@ class Flash(object):
     P_MIN_FIXED = Phase.P_MIN_FIXED
     P_MAX_FIXED = Phase.P_MAX_FIXED
 
+    FLASH_CACHE_SIZE = 0
+    FLASH_CACHE_SIG_FIGS = 12
+
     def flash(self, zs=None, T=None, P=None, VF=None, SF=None, V=None, H=None,
               S=None, G=None, U=None, A=None, solution=None, hot_start=None,
               retry=False, dest=None):
@@ -4283,6 +5040,11 @@ class Flash(object):
 
         Notes
         -----
+        When :obj:`FLASH_CACHE_SIZE` is set and `dest` is None, results are
+        looked up in the flash cache first; a repeated flash returns a shallow
+        copy of the `EquilibriumState` of the first one, sharing its phases,
+        whose `flash_specs` are those of the first flash. See
+        :obj:`flash_cache_info`.
 
         Examples
         --------
@@ -4292,6 +5054,9 @@ class Flash(object):
                 zs = [1.0]
             else:
                 raise ValueError("Composition missing for flash")
+        if dest is None and self.FLASH_CACHE_SIZE:
+            return self._flash_cached(zs, T, P, VF, SF, V, H, S, G, U, A, solution,
+                                      hot_start, retry)
         constants, correlations = self.constants, self.correlations
         settings = self.settings
         if dest is None:
@@ -4592,80 +5357,216 @@ class Flash(object):
             Vs = logspace(log10(Vmin), log10(Vmax), pts)
         return Vs
 
+    def _flash_cached(self, zs, T, P, VF, SF, V, H, S, G, U, A, solution,
+                      hot_start, retry):
+        try:
+            cache = self._flash_cache
+        except AttributeError:
+            cache = self._flash_cache = OrderedDict()
+            self._flash_cache_hits = self._flash_cache_misses = 0
+            self._flash_cache_model_key = tuple([self._flash_cache_phase_key(phase)
+                                                 for phase in self.phases])
+        sig_figs = self.FLASH_CACHE_SIG_FIGS
+        key = (self._flash_cache_model_key, solution, retry,
+               tuple([round_sig(zi, sig_figs) for zi in zs]),
+               tuple([round_sig(v, sig_figs) if v is not None else None
+                      for v in (T, P, VF, SF, V, H, S, G, U, A)]))
+        try:
+            res = cache[key]
+        except KeyError:
+            pass
+        else:
+            cache.move_to_end(key)
+            self._flash_cache_hits += 1
+            return copy(res)
+        self._flash_cache_misses += 1
+        res = self.flash(zs=zs, T=T, P=P, VF=VF, SF=SF, V=V, H=H, S=S, G=G, U=U, A=A,
+                         solution=solution, hot_start=hot_start, retry=retry,
+                         dest=EquilibriumState)
+        # Callers may set attributes on the result they get; keep a separate one
+        cache[key] = copy(res)
+        while len(cache) > self.FLASH_CACHE_SIZE:
+            cache.popitem(last=False)
+        return res
+
+    @staticmethod
+    def _flash_cache_phase_key(phase):
+        # Phases which can hash their model are keyed by it; others get a
+        # random token which, unlike id(), is never reused by another object
+        # and survives pickling
+        if type(phase).model_hash is not Phase.model_hash:
+            return phase.model_hash()
+        try:
+            return phase.__dict__['_flash_cache_token']
+        except KeyError:
+            token = phase._flash_cache_token = uuid4().hex
+            return token
+
+    def flash_cache_info(self):
+        r'''Method to report the use of the flash cache, enabled by setting
+        :obj:`FLASH_CACHE_SIZE` to a positive number. Flashes are looked up by
+        the model hashes of the flasher's phases (or a unique token for phases
+        without a model hash), the `solution` and `retry` arguments, and the
+        composition and specifications rounded to
+        :obj:`FLASH_CACHE_SIG_FIGS` significant figures. Each hit returns a
+        new shallow copy of the cached result.
+
+        Returns
+        -------
+        info : dict[str : int]
+            Number of `hits` and `misses` of the cache, its `maxsize`, and the
+            number of results it currently holds `currsize`, [-]
+
+        Examples
+        --------
+        >>> from thermo import ChemicalConstantsPackage, CEOSGas, CEOSLiquid, PRMIX, FlashVL, PropertyCorrelationsPackage, HeatCapacityGas
+        >>> constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0], omegas=[0.098, 0.251], MWs=[30.06904, 72.14878], CASs=['74-84-0', '109-66-0'])
+        >>> correlations = PropertyCorrelationsPackage(constants, skip_missing=True, HeatCapacityGases=[HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.1e-21, -3.3e-17, 6.6e-14, -7.2e-11, 4.5e-08, -1.5e-05, 0.0023, -0.08, 34.])), HeatCapacityGas(poly_fit=(200.0, 1000.0, [7.5e-20, -3.7e-16, 7.7e-13, -8.9e-10, 6.2e-07, -2.6e-04, 0.061, -6.9, 455.]))])
+        >>> eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+        >>> gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases)
+        >>> liquid = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases)
+        >>> flasher = FlashVL(constants, correlations, liquid=liquid, gas=gas)
+        >>> flasher.FLASH_CACHE_SIZE = 100
+        >>> res = flasher.flash(T=300.0, P=1e6, zs=[0.5, 0.5])
+        >>> flasher.flash(T=300.0, P=1e6, zs=[0.5, 0.5]).gas is res.gas
+        True
+        >>> flasher.flash_cache_info()
+        {'hits': 1, 'misses': 1, 'maxsize': 100, 'currsize': 1}
+        '''
+        cache = getattr(self, '_flash_cache', None)
+        if cache is None:
+            return {'hits': 0, 'misses': 0, 'maxsize': self.FLASH_CACHE_SIZE, 'currsize': 0}
+        return {'hits': self._flash_cache_hits, 'misses': self._flash_cache_misses,
+                'maxsize': self.FLASH_CACHE_SIZE, 'currsize': len(cache)}
+
+    def flash_cache_clear(self):
+        r'''Method to empty the flash cache and reset its statistics; this
+        should be called if any of the phase models are modified.
+        '''
+        self.__dict__.pop('_flash_cache', None)
+
     def grid_flash(self, zs, Ts=None, Ps=None, Vs=None,
                    VFs=None, SFs=None, Hs=None, Ss=None, Us=None,
-                   props=None, store=True):
+                   props=None, store=True, hot_start_rows=False, workers=None,
+                   executor=None, table=False):
+        r'''Method to perform a grid of flashes at a fixed composition, with
+        the first specified spec varying by row and the second by column.
+        Points which fail to flash are reported and stored as None.
 
-        flashes = []
+        Parameters
+        ----------
+        zs : list[float]
+            Mole fractions of each component, [-]
+        Ts, Ps, Vs, VFs, SFs, Hs, Ss, Us : list[float], optional
+            Values of the two specifications to flash at; exactly two must be
+            provided, [various]
+        props : str or list[str], optional
+            Property or properties to compute from each flash result with
+            :obj:`EquilibriumState.value <thermo.equilibrium.EquilibriumState.value>`, [-]
+        store : bool, optional
+            Whether or not to return the flash results themselves, [-]
+        hot_start_rows : bool, optional
+            If True, each row is walked in order and every flash after the
+            first is started from the previous converged point of the row;
+            a cold flash is done instead whenever the hot start fails, the
+            number of phases differs from that of a multiphase previous
+            point, or a stability test of the hot started result finds a
+            new phase, [-]
+        workers : int, optional
+            Number of processes to split the rows of the grid between; when
+            None or 1 and no `executor` is given, the grid is flashed serially
+            in this process, [-]
+        executor : :obj:`concurrent.futures.Executor`, optional
+            An existing process based executor to distribute the rows of the
+            grid to; it is not shut down afterwards. Flashers are not
+            thread-safe, so a
+            :obj:`ThreadPoolExecutor <concurrent.futures.ThreadPoolExecutor>`
+            is rejected, [-]
+        table : bool, optional
+            If True, the results and any `props` are stored in a
+            :obj:`FlashResultTable <thermo.equilibrium.FlashResultTable>`
+            of shape (rows, columns) which is returned instead, and `store` is
+            ignored, [-]
 
-        T_spec = Ts is not None
-        P_spec = Ps is not None
-        V_spec = Vs is not None
-        H_spec = Hs is not None
-        S_spec = Ss is not None
-        U_spec = Us is not None
-        VF_spec = VFs is not None
-        SF_spec = SFs is not None
+        Returns
+        -------
+        flashes : list[list[:obj:`EquilibriumState <thermo.equilibrium.EquilibriumState>`]]
+            Flash results, returned if `store` is True, [-]
+        calc_props : list[list[float]] or list[list[list[float]]]
+            Calculated properties, returned if `props` is specified, [-]
+        table : :obj:`FlashResultTable <thermo.equilibrium.FlashResultTable>`
+            Flash results and properties, returned instead of the above if
+            `table` is True, [-]
 
-        flash_specs = {'zs': zs}
+        Notes
+        -----
+        When a process pool is created here, the flasher is sent to each
+        worker once as it starts; rows are then sent in contiguous chunks.
+        When an `executor` is provided, the flasher travels with each chunk
+        instead, and the grid is split into `workers` chunks (or one chunk per
+        worker of the executor if `workers` is not given). The flasher must be
+        picklable, unless the `fork` start method is in use for a pool
+        created here.
+
+        The returned :obj:`EquilibriumState <thermo.equilibrium.EquilibriumState>`
+        objects are rebuilt in this process and reference this flasher.
+        '''
         spec_keys = []
         spec_iters = []
-        if T_spec:
+        if Ts is not None:
             spec_keys.append('T')
             spec_iters.append(Ts)
-        if P_spec:
+        if Ps is not None:
             spec_keys.append('P')
             spec_iters.append(Ps)
-        if V_spec:
+        if Vs is not None:
             spec_keys.append('V')
             spec_iters.append(Vs)
-        if H_spec:
+        if Hs is not None:
             spec_keys.append('H')
             spec_iters.append(Hs)
-        if S_spec:
+        if Ss is not None:
             spec_keys.append('S')
             spec_iters.append(Ss)
-        if U_spec:
+        if Us is not None:
             spec_keys.append('U')
             spec_iters.append(Us)
-        if VF_spec:
+        if VFs is not None:
             spec_keys.append('VF')
             spec_iters.append(VFs)
-        if SF_spec:
+        if SFs is not None:
             spec_keys.append('SF')
             spec_iters.append(SFs)
 
         do_props = props is not None
-        scalar_props = isinstance(props, str)
-
-        calc_props = []
-        for n0, spec0 in enumerate(spec_iters[0]):
-            if do_props:
-                row_props = []
-            if store:
-                row_flashes = []
-            for n1, spec1 in enumerate(spec_iters[1]):
-                flash_specs = {'zs': zs, spec_keys[0]: spec0, spec_keys[1]: spec1}
-                try:
-                    state = self.flash(**flash_specs)
-                except Exception as e:
-                    state = None
-                    print('Failed trying to flash %s, with exception %s.'%(flash_specs, e))
-
-                if store:
-                    row_flashes.append(state)
-                if do_props:
-                    if scalar_props:
-                        state_props = state.value(props)if state is not None else None
-                    else:
-                        state_props = [state.value(s) for s in props] if state is not None else [None for s in props]
-
-                    row_props.append(state_props)
-
-            if do_props:
-                calc_props.append(row_props)
-            if store:
-                flashes.append(row_flashes)
+        spec0s, spec1s = list(spec_iters[0]), list(spec_iters[1])
+
+        if table:
+            if isinstance(props, str):
+                props = [props]
+            if executor is None and (workers is None or workers <= 1):
+                table = FlashResultTable(self, len(spec0s)*len(spec1s), zs, spec_keys, props,
+                                         shape=(len(spec0s), len(spec1s)))
+                _, _, failures = _grid_flash_rows(self, zs, spec_keys, spec0s, spec1s,
+                                                  hot_start_rows=hot_start_rows, table=table)
+            else:
+                table, _, failures = self._grid_flash_parallel(zs, spec_keys, spec0s, spec1s,
+                                                               props, False, hot_start_rows,
+                                                               workers, executor, table=True)
+            for flash_specs, e in failures:
+                print('Failed trying to flash %s, with exception %s.'%(flash_specs, e))
+            return table
+
+        if executor is None and (workers is None or workers <= 1):
+            flashes, calc_props, failures = _grid_flash_rows(self, zs, spec_keys, spec0s,
+                                                            spec1s, props, store, hot_start_rows)
+        else:
+            flashes, calc_props, failures = self._grid_flash_parallel(zs, spec_keys, spec0s,
+                                                                      spec1s, props, store,
+                                                                      hot_start_rows, workers,
+                                                                      executor)
+        for flash_specs, e in failures:
+            print('Failed trying to flash %s, with exception %s.'%(flash_specs, e))
 
         if do_props and store:
             return flashes, calc_props
@@ -4675,6 +5576,57 @@ class Flash(object):
             return flashes
         return None
 
+    def _grid_flash_parallel(self, zs, spec_keys, spec0s, spec1s, props, store,
+                             hot_start_rows, workers, executor, table=False):
+        own_executor = executor is None
+        if own_executor:
+            from concurrent.futures import ProcessPoolExecutor
+            executor = ProcessPoolExecutor(max_workers=workers,
+                                           initializer=_grid_flash_worker_init,
+                                           initargs=(self,))
+            # Several chunks per worker to balance rows that flash slowly
+            chunk_count = 4*workers
+            flasher = None
+        else:
+            _grid_flash_check_executor(executor)
+            chunk_count = workers if workers is not None else getattr(executor, '_max_workers', 1)
+            flasher = self
+
+        N0 = len(spec0s)
+        chunk_count = max(1, min(chunk_count, N0))
+        bounds = [N0*i//chunk_count for i in range(chunk_count+1)]
+        try:
+            futures = [executor.submit(_grid_flash_worker_rows, flasher, zs, spec_keys,
+                                       spec0s[bounds[i]:bounds[i+1]], spec1s, props, store,
+                                       hot_start_rows, table)
+                       for i in range(chunk_count)]
+            results = [f.result() for f in futures]
+        finally:
+            if own_executor:
+                executor.shutdown()
+
+        if table:
+            failures = [failure for r in results for failure in r[2]]
+            joined = FlashResultTable.concatenate(self, [r[0] for r in results],
+                                                  shape=(len(spec0s), len(spec1s)))
+            return joined, None, failures
+
+        flashes, calc_props, failures = [], [], []
+        constants, correlations = self.constants, self.correlations
+        for chunk_flashes, chunk_props, chunk_failures in results:
+            if store:
+                for row in chunk_flashes:
+                    flashes.append([EquilibriumState(T, P, zs, gas=g, liquids=ls, solids=ss,
+                                                     betas=betas, flash_specs=flash_specs,
+                                                     flash_convergence=flash_convergence,
+                                                     constants=constants, correlations=correlations,
+                                                     flasher=self)
+                                    if T is not None else None
+                                    for (T, P, g, ls, ss, betas, flash_specs, flash_convergence) in row])
+            calc_props.extend(chunk_props)
+            failures.extend(chunk_failures)
+        return flashes, calc_props, failures
+
     def debug_grid_flash(self, zs, check0, check1, Ts=None, Ps=None, Vs=None,
                          VFs=None, SFs=None, Hs=None, Ss=None, Us=None,
                          retry=False):
@@ -5284,6 +6236,289 @@ PT_SS_MEHRA = 'SS Mehra'
 PT_SS_GDEM3 = 'SS GDEM3'
 PT_NEWTON_lNKVF = 'Newton lnK VF'
 
+HSGUA_BISECT = 'bisect'
+HSGUA_NEWTON_2P = 'newton_2P'
+HSGUA_1P = '1P'
+
+
+def solve_PT_2P(method, T, P, zs, xs_guess, ys_guess, liquid_phase, gas_phase,
+                maxiter=1000, tol=1e-13, V_over_F_guess=None):
+    r'''Solve a two phase flash at fixed temperature and pressure with one
+    of the `PT` methods, returning the results in the same order regardless of
+    the method.
+
+    Parameters
+    ----------
+    method : str
+        One of `PT_SS`, `PT_SS_MEHRA`, `PT_SS_GDEM3`, or `PT_NEWTON_lNKVF`,
+        [-]
+    T : float
+        Temperature, [K]
+    P : float
+        Pressure, [Pa]
+    zs : list[float]
+        Overall mole fractions, [-]
+    xs_guess : list[float]
+        Liquid mole fraction guesses, [-]
+    ys_guess : list[float]
+        Gas mole fraction guesses, [-]
+    liquid_phase : :obj:`Phase <thermo.phases.Phase>`
+        Liquid phase model, [-]
+    gas_phase : :obj:`Phase <thermo.phases.Phase>`
+        Gas phase model, [-]
+    maxiter : int, optional
+        Maximum number of iterations of the method, [-]
+    tol : float, optional
+        Convergence tolerance of the method, in its own measure of the error,
+        [-]
+    V_over_F_guess : float, optional
+        Vapor fraction guess, [-]
+
+    Returns
+    -------
+    V_over_F : float
+        Vapor fraction, [-]
+    xs : list[float]
+        Liquid mole fractions, [-]
+    ys : list[float]
+        Gas mole fractions, [-]
+    l : :obj:`Phase <thermo.phases.Phase>`
+        Liquid phase, [-]
+    g : :obj:`Phase <thermo.phases.Phase>`
+        Gas phase, [-]
+    iterations : int
+        Number of iterations, [-]
+    err : float
+        Final error of the method, [-]
+    '''
+    if method == PT_SS:
+        return sequential_substitution_2P(T=T, P=P, V=None, zs=zs, xs_guess=xs_guess, ys_guess=ys_guess,
+                                          liquid_phase=liquid_phase, gas_phase=gas_phase,
+                                          maxiter=maxiter, tol=tol, V_over_F_guess=V_over_F_guess)
+    elif method == PT_SS_MEHRA:
+        return sequential_substitution_Mehra_2P(T=T, P=P, zs=zs, xs_guess=xs_guess, ys_guess=ys_guess,
+                                                liquid_phase=liquid_phase, gas_phase=gas_phase,
+                                                maxiter=maxiter, tol=tol, V_over_F_guess=V_over_F_guess)
+    elif method == PT_SS_GDEM3:
+        return sequential_substitution_GDEM3_2P(T=T, P=P, zs=zs, xs_guess=xs_guess, ys_guess=ys_guess,
+                                                liquid_phase=liquid_phase, gas_phase=gas_phase,
+                                                maxiter=maxiter, tol=tol, V_over_F_guess=V_over_F_guess)
+    elif method == PT_NEWTON_lNKVF:
+        V_over_F, xs, ys, l, g, err, _, iterations = nonlin_2P_newton(T=T, P=P, zs=zs, xs_guess=xs_guess, ys_guess=ys_guess,
+                                                                      liquid_phase=liquid_phase, gas_phase=gas_phase,
+                                                                      maxiter=maxiter, xtol=tol, V_over_F_guess=V_over_F_guess)
+        return V_over_F, xs, ys, l, g, iterations, err
+    raise ValueError("Unrecognized method %s" %(method))
+
+
+def Rachford_Rice_many(zs, Ks, guess=None, maxiter=100):
+    # Safeguarded Newton solution of many Rachford-Rice problems at once;
+    # rows without K values on both sides of one get a vapor fraction of
+    # nan, and should be single phase
+    Km1 = Ks - 1.0
+    present = zs > 0.0
+    K_max = np.where(present, Ks, -np.inf).max(axis=1)
+    K_min = np.where(present, Ks, np.inf).min(axis=1)
+    valid = (K_max > 1.0) & (K_min < 1.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        low = np.where(valid, 1.0/(1.0 - K_max), 0.0)
+        high = np.where(valid, 1.0/(1.0 - K_min), 1.0)
+    V = np.full(zs.shape[0], 0.5) if guess is None else np.array(guess, dtype=float)
+    bad_guess = ~((V > low) & (V < high))
+    V[bad_guess] = 0.5*(low[bad_guess] + high[bad_guess])
+    zKm1 = zs*Km1
+    active = valid.copy()
+    for _ in range(maxiter):
+        idx = np.nonzero(active)[0]
+        if not idx.size:
+            break
+        Va = V[idx]
+        t = zKm1[idx]/(1.0 + Va[:, None]*Km1[idx])
+        f = t.sum(axis=1)
+        df = -(t*t/zs[idx].clip(min=1e-300)).sum(axis=1)
+        low[idx] = np.where(f > 0.0, Va, low[idx])
+        high[idx] = np.where(f < 0.0, Va, high[idx])
+        V_new = Va - f/df
+        outside = ~((V_new > low[idx]) & (V_new < high[idx]))
+        V_new[outside] = 0.5*(low[idx][outside] + high[idx][outside])
+        done = np.abs(V_new - Va) <= 1e-14*np.maximum(1.0, np.abs(V_new))
+        V[idx] = V_new
+        active[idx[done]] = False
+    V[~valid] = np.nan
+    with np.errstate(invalid='ignore'):
+        xs = zs/(1.0 + V[:, None]*Km1)
+    ys = Ks*xs
+    return V, xs, ys
+
+def cubic_PIPs_many(T, Vs, zs, b_delta_epsilon, a_alpha_ijs, da_alpha_dT_ijs):
+    # Phase identification parameter of cubic EOS states; needs only the
+    # first and second volume and first temperature derivatives of P
+    b, delta, epsilon = b_delta_epsilon
+    a_alpha = np.einsum('ij,jk,ik->i', zs, a_alpha_ijs, zs)
+    da_alpha_dT = np.einsum('ij,jk,ik->i', zs, da_alpha_dT_ijs, zs)
+    x0 = 1.0/(Vs - b)
+    den = 1.0/(Vs*(Vs + delta) + epsilon)
+    x2 = 2.0*Vs + delta
+    dP_dT = R*x0 - da_alpha_dT*den
+    dP_dV = -R*T*x0*x0 + a_alpha*x2*den*den
+    d2P_dV2 = 2.0*(R*T*x0*x0*x0 + a_alpha*den*den - a_alpha*x2*x2*den*den*den)
+    d2P_dTdV = -R*x0*x0 + da_alpha_dT*x2*den*den
+    return Vs*(d2P_dTdV/dP_dT - d2P_dV2/dP_dV)
+
+def cubic_flash_TP_2P(T, P, zs, Tcs, Pcs, omegas, bs, a_alphas, kijs, sigma,
+                      epsilon, delta_coeff, epsilon_coeff, maxiter=5000, tol=1e-13,
+                      trivial_solution_tol=1e-5):
+    r'''Solves a vapor-liquid TP flash of a cubic equation of state with
+    the van der Waals mixing rules and no volume translation, working only
+    with arrays of pure component parameters. The K values are initialized
+    with the Wilson correlation and converged with sequential substitution,
+    solving the Rachford-Rice equation each iteration. Written with plain
+    loops so it can be compiled with numba; the `a_alphas` and `bs` depend
+    on the alpha function of the EOS, and are the only EOS specific inputs.
+
+    No stability test is performed. When the sequential substitution does
+    not find a two phase solution with a lower Gibbs energy than the feed,
+    `two_phase` is False and the feed should be checked with a full flash.
+
+    Parameters
+    ----------
+    T : float
+        Temperature, [K]
+    P : float
+        Pressure, [Pa]
+    zs : list[float]
+        Feed mole fractions, all nonzero, [-]
+    Tcs : list[float]
+        Critical temperatures, [K]
+    Pcs : list[float]
+        Critical pressures, [Pa]
+    omegas : list[float]
+        Acentric factors, [-]
+    bs : list[float]
+        Pure component `b` coefficients, [m^3/mol]
+    a_alphas : list[float]
+        Pure component :math:`a\alpha` terms at `T`, [J^2/mol^2/Pa]
+    kijs : list[list[float]]
+        Binary interaction parameters, [-]
+    sigma : float
+        EOS constant; :math:`1+\sqrt{2}` for Peng-Robinson and 1 for SRK, [-]
+    epsilon : float
+        EOS constant; :math:`1-\sqrt{2}` for Peng-Robinson and 0 for SRK, [-]
+    delta_coeff : float
+        :math:`\delta/b`; 2 for Peng-Robinson and 1 for SRK, [-]
+    epsilon_coeff : float
+        :math:`\epsilon_{EOS}/b^2`; -1 for Peng-Robinson and 0 for SRK, [-]
+    maxiter : int, optional
+        Maximum number of sequential substitution iterations, [-]
+    tol : float, optional
+        Tolerance on the sum of squared fugacity ratio errors, [-]
+    trivial_solution_tol : float, optional
+        Sum of absolute composition differences below which the phases are
+        considered identical, [-]
+
+    Returns
+    -------
+    two_phase : bool
+        Whether a two phase solution was found, [-]
+    V_over_F : float
+        Vapor fraction, [-]
+    xs : list[float]
+        Mole fractions of the liquid (smallest volume root) phase, [-]
+    ys : list[float]
+        Mole fractions of the gas (largest volume root) phase, [-]
+    iterations : int
+        Number of iterations performed, [-]
+    err : float
+        Final error, [-]
+
+    Examples
+    --------
+    >>> from thermo.eos_mix import PRMIX
+    >>> eos = PRMIX(T=300.0, P=1e6, zs=[0.5, 0.5], Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0], omegas=[0.098, 0.251])
+    >>> two_phase, VF, xs, ys, _, _ = cubic_flash_TP_2P(300.0, 1e6, [0.5, 0.5], eos.Tcs, eos.Pcs, eos.omegas, eos.bs, eos.a_alphas, eos.kijs, 1.0 + 2**0.5, 1.0 - 2**0.5, 2.0, -1.0)
+    >>> two_phase, round(VF, 6), [round(x, 6) for x in xs]
+    (True, 0.334993, [0.284994, 0.715006])
+    '''
+    N = len(zs)
+    a_alpha_ijs = a_alpha_aijs_composition_independent(a_alphas, kijs)[0]
+
+    # Dimensionless Gibbs energy of the feed at its most stable root
+    lnphis_l, _ = cubic_lnphis_fastest(T, P, zs, bs, a_alpha_ijs, sigma, epsilon, delta_coeff,
+                                       epsilon_coeff, True)
+    lnphis_g, _ = cubic_lnphis_fastest(T, P, zs, bs, a_alpha_ijs, sigma, epsilon, delta_coeff,
+                                       epsilon_coeff, False)
+    G_l, G_g = 0.0, 0.0
+    for i in range(N):
+        G_l += zs[i]*lnphis_l[i]
+        G_g += zs[i]*lnphis_g[i]
+    G_feed = G_l if G_l < G_g else G_g
+
+    Ks = [0.0]*N
+    for i in range(N):
+        Ks[i] = Pcs[i]/P*exp(5.37*(1.0 + omegas[i])*(1.0 - Tcs[i]/T))
+
+    V_over_F, xs, ys = 0.5, zs, zs
+    err = 0.0
+    converged = False
+    for iteration in range(maxiter):
+        K_low, K_high = False, False
+        for i in range(N):
+            if Ks[i] > 1.0:
+                K_high = True
+            else:
+                K_low = True
+        if not (K_low and K_high):
+            return False, V_over_F, xs, ys, iteration, err
+        V_over_F, xs, ys = flash_inner_loop(zs, Ks, guess=V_over_F)
+        # Normalize negative fractions only if needed
+        for xi in xs:
+            if xi < 0.0:
+                xs_sum_inv = 0.0
+                for i in range(N):
+                    xs_sum_inv += abs(xs[i])
+                xs_sum_inv = 1.0/xs_sum_inv
+                for i in range(N):
+                    xs[i] = abs(xs[i])*xs_sum_inv
+                break
+        for yi in ys:
+            if yi < 0.0:
+                ys_sum_inv = 0.0
+                for i in range(N):
+                    ys_sum_inv += abs(ys[i])
+                ys_sum_inv = 1.0/ys_sum_inv
+                for i in range(N):
+                    ys[i] = abs(ys[i])*ys_sum_inv
+                break
+        comp_difference = 0.0
+        for i in range(N):
+            comp_difference += abs(xs[i] - ys[i])
+        if comp_difference < trivial_solution_tol:
+            return False, V_over_F, xs, ys, iteration, err
+
+        lnphis_l, _ = cubic_lnphis_fastest(T, P, xs, bs, a_alpha_ijs, sigma, epsilon, delta_coeff,
+                                           epsilon_coeff, True)
+        lnphis_g, _ = cubic_lnphis_fastest(T, P, ys, bs, a_alpha_ijs, sigma, epsilon, delta_coeff,
+                                           epsilon_coeff, False)
+        err = 0.0
+        for i in range(N):
+            Ks[i] = exp(lnphis_l[i] - lnphis_g[i])
+            err_i = Ks[i]*xs[i]/ys[i] - 1.0
+            err += err_i*err_i
+        if err < tol:
+            converged = True
+            break
+    if not converged or V_over_F <= 0.0 or V_over_F >= 1.0:
+        return False, V_over_F, xs, ys, iteration, err
+
+    # The split must lower the Gibbs energy; the ideal mixing terms of
+    # the feed are common to both and cancel
+    G_2P = 0.0
+    for i in range(N):
+        G_2P += (V_over_F*ys[i]*(log(ys[i]/zs[i]) + lnphis_g[i])
+                 + (1.0 - V_over_F)*xs[i]*(log(xs[i]/zs[i]) + lnphis_l[i]))
+    if G_2P >= G_feed:
+        return False, V_over_F, xs, ys, iteration, err
+    return True, V_over_F, xs, ys, iteration, err
 
 def deduplicate_stab_results(results, tol_frac_err=5e-3):
     if not results:
@@ -5301,32 +6536,359 @@ def deduplicate_stab_results(results, tol_frac_err=5e-3):
             good_results.append(t)
     return good_results
 
-class FlashVL(Flash):
-    r'''Class for performing flash calculations on one and
-    two phase vapor and liquid multicomponent systems. Use :obj:`FlashVLN` for
-    systems which can have multiple liquid phases.
-
-    The minimum information that is needed is:
-
-    * MWs
-    * Vapor pressure curve
-    * Functioning enthalpy models for each phase
+class FlashStatistics(object):
+    r'''Class to record how the solver stages of a flasher perform, and to
+    reorder or skip stages in later flashes based on what has worked.
+    Assign an instance to the `statistics` attribute of a :obj:`FlashVL`
+    or :obj:`FlashVLN` flasher to use it; by default no statistics are
+    recorded.
+
+    Each attempt of a stage is recorded by the kind of flash (such as
+    'TP', 'PH', or 'TVF'), the region of the flash, and the name of the
+    stage. The region is a pair of buckets of reduced temperature and
+    reduced pressure, using the mole-fraction averaged critical temperature
+    and pressure of the feed; a bucket is None when that variable is not
+    specified.
+
+    Once a stage has been attempted `min_attempts` times in a region, it
+    is moved ahead of the stages with fewer attempts, and ordered by its
+    mean time per successful solve. Stages which succeed less often than
+    `skip_rate` after that many attempts are moved after all the others in
+    that region; they are only attempted when every other stage fails, so
+    a flash which would succeed without statistics still succeeds, and
+    their records keep being updated.
 
     Parameters
     ----------
-    constants : :obj:`ChemicalConstantsPackage <thermo.chemical_package.ChemicalConstantsPackage>` object
-        Package of chemical constants; these are used as boundaries at times,
-        initial guesses other times, and in all cases these properties are
-        accessible as attributes of the resulting
-        :obj:`EquilibriumState <thermo.equilibrium.EquilibriumState>` object, [-]
-    correlations : :obj:`PropertyCorrelationsPackage <thermo.chemical_package.PropertyCorrelationsPackage>`
-        Package of chemical T-dependent properties; these are used as boundaries at times,
-        for initial guesses other times, and in all cases these properties are
-        accessible as attributes of the resulting
-        :obj:`EquilibriumState <thermo.equilibrium.EquilibriumState>` object, [-]
-    gas : :obj:`Phase <thermo.phases.Phase>` object
-        A single phase which can represent the gas phase, [-]
-    liquid : :obj:`Phase <thermo.phases.Phase>`
+    Tr_step : float, optional
+        Width of the reduced temperature buckets, [-]
+    Pr_step : float, optional
+        Width of the reduced pressure buckets, [-]
+    min_attempts : int, optional
+        Number of attempts of a stage in a region before its order is
+        changed, [-]
+    skip_rate : float, optional
+        Fraction of successful attempts below which a stage is only
+        attempted after all the others, [-]
+
+    Attributes
+    ----------
+    records : dict[tuple(str, tuple, str), list[int, int, int, float]]
+        Number of attempts, number of successes, total iterations, and total
+        time in seconds of each stage, by the kind of flash, the region,
+        and the stage name, [-]
+    '''
+    def __init__(self, Tr_step=0.1, Pr_step=0.25, min_attempts=5,
+                 skip_rate=0.05):
+        self.Tr_step = Tr_step
+        self.Pr_step = Pr_step
+        self.min_attempts = min_attempts
+        self.skip_rate = skip_rate
+        self.records = {}
+
+    def region(self, constants, zs, T=None, P=None):
+        r'''Method to compute the region a flash is recorded in.
+
+        Parameters
+        ----------
+        constants : :obj:`ChemicalConstantsPackage <thermo.chemical_package.ChemicalConstantsPackage>`
+            Constants of the flasher, [-]
+        zs : list[float]
+            Mole fractions of the feed, [-]
+        T : float, optional
+            Temperature, [K]
+        P : float, optional
+            Pressure, [Pa]
+
+        Returns
+        -------
+        region : tuple(int, int)
+            Reduced temperature and reduced pressure buckets, [-]
+        '''
+        Tr_bucket = Pr_bucket = None
+        if T is not None:
+            Tc = 0.0
+            for zi, Tci in zip(zs, constants.Tcs):
+                Tc += zi*Tci
+            Tr_bucket = int(T/(Tc*self.Tr_step))
+        if P is not None:
+            Pc = 0.0
+            for zi, Pci in zip(zs, constants.Pcs):
+                Pc += zi*Pci
+            Pr_bucket = int(P/(Pc*self.Pr_step))
+        return (Tr_bucket, Pr_bucket)
+
+    def record(self, spec, region, name, converged, iterations, time):
+        r'''Method to record one attempt of a stage.
+
+        Parameters
+        ----------
+        spec : str
+            Kind of flash, [-]
+        region : tuple(int, int)
+            Region of the flash, from :obj:`region`, [-]
+        name : str
+            Name of the stage, [-]
+        converged : bool
+            Whether or not the stage solved the flash, [-]
+        iterations : int
+            Number of iterations of the stage, [-]
+        time : float
+            Time taken by the stage, [s]
+        '''
+        key = (spec, region, name)
+        try:
+            rec = self.records[key]
+        except KeyError:
+            rec = self.records[key] = [0, 0, 0, 0.0]
+        rec[0] += 1
+        if converged:
+            rec[1] += 1
+            rec[2] += iterations
+        rec[3] += time
+
+    def order(self, spec, region, stages, names=None):
+        r'''Method to order the stages of a flash based on the recorded
+        statistics, with those which rarely succeed last.
+
+        Parameters
+        ----------
+        spec : str
+            Kind of flash, [-]
+        region : tuple(int, int)
+            Region of the flash, from :obj:`region`, [-]
+        stages : list
+            Stages in their configured order, [-]
+        names : list[str], optional
+            Names of the stages; the first item of each stage by default, [-]
+
+        Returns
+        -------
+        stages : list
+            Stages in the order to attempt them, [-]
+        '''
+        if names is None:
+            names = [stage[0] for stage in stages]
+        records = self.records
+        min_attempts, skip_rate = self.min_attempts, self.skip_rate
+        ranked, untried, skipped = [], [], []
+        for i, (stage, name) in enumerate(zip(stages, names)):
+            rec = records.get((spec, region, name))
+            if rec is None or rec[0] < min_attempts:
+                untried.append(stage)
+            elif rec[1] >= skip_rate*rec[0] and rec[1]:
+                ranked.append((rec[3]/rec[1], i, stage))
+            else:
+                # Kept as a last resort before the flash fails
+                skipped.append(stage)
+        ranked.sort(key=lambda v: (v[0], v[1]))
+        return [v[2] for v in ranked] + untried + skipped
+
+    def summary(self):
+        r'''Method to summarize the recorded statistics of each stage.
+
+        Returns
+        -------
+        summary : dict[tuple(str, tuple, str), dict]
+            Number of attempts, success rate, mean iterations of successful
+            attempts, and mean time in seconds of each stage, [-]
+        '''
+        summary = {}
+        for key, (attempts, successes, iterations, time) in self.records.items():
+            summary[key] = {'attempts': attempts,
+                            'success_rate': successes/attempts,
+                            'iterations': iterations/successes if successes else None,
+                            'time': time/attempts}
+        return summary
+
+
+class PhaseEnvelope(object):
+    r'''Class holding the bubble and dew curves of a mixture of fixed
+    composition, as traced by :obj:`FlashVL.build_VF_envelope` or
+    :obj:`FlashVL.trace_phase_envelope`, and interpolating them with cubic
+    splines. Each curve is stored from its
+    lowest pressure up to the highest pressure the trace reached, which is
+    near the critical point for the bubble curve and near the cricondenbar
+    for the dew curve.
+
+    The interpolated temperatures, pressures, and incipient phase
+    compositions are used as initial guesses of bubble and dew point
+    flashes; they are not exact.
+
+    Parameters
+    ----------
+    zs : list[float]
+        Mole fractions of the mixture, [-]
+    bubble_Ps : list[float]
+        Increasing pressures of the bubble curve, [Pa]
+    bubble_Ts : list[float]
+        Temperatures of the bubble curve, [K]
+    bubble_comps : list[list[float]]
+        Incipient gas compositions along the bubble curve, [-]
+    dew_Ps : list[float]
+        Increasing pressures of the dew curve, [Pa]
+    dew_Ts : list[float]
+        Temperatures of the dew curve, [K]
+    dew_comps : list[list[float]]
+        Incipient liquid compositions along the dew curve, [-]
+    critical_point : tuple(float, float), optional
+        Temperature and pressure of the critical point, if known, [K, Pa]
+    cricondenbar : tuple(float, float), optional
+        Temperature and pressure of the highest pressure on the envelope;
+        estimated from the curves if not provided, [K, Pa]
+    cricondentherm : tuple(float, float), optional
+        Temperature and pressure of the highest temperature on the envelope;
+        estimated from the curves if not provided, [K, Pa]
+
+    Attributes
+    ----------
+    critical_point : tuple(float, float) or None
+        Temperature and pressure of the critical point, [K, Pa]
+    cricondenbar : tuple(float, float)
+        Temperature and pressure of the highest pressure on the envelope,
+        [K, Pa]
+    cricondentherm : tuple(float, float)
+        Temperature and pressure of the highest temperature on the envelope,
+        [K, Pa]
+    '''
+    def __init__(self, zs, bubble_Ps, bubble_Ts, bubble_comps, dew_Ps, dew_Ts,
+                 dew_comps, critical_point=None, cricondenbar=None,
+                 cricondentherm=None):
+        from scipy.interpolate import CubicSpline
+        self.zs = zs
+        self.bubble_Ps, self.bubble_Ts, self.bubble_comps = bubble_Ps, bubble_Ts, bubble_comps
+        self.dew_Ps, self.dew_Ts, self.dew_comps = dew_Ps, dew_Ts, dew_comps
+
+        self.P_splines = {}
+        self.T_splines = {}
+        _cricondentherm, _cricondenbar = cricondentherm, cricondenbar
+        cricondentherm = cricondenbar = (0.0, 0.0)
+        for VF, Ps, Ts, comps in ((0.0, bubble_Ps, bubble_Ts, bubble_comps),
+                                  (1.0, dew_Ps, dew_Ts, dew_comps)):
+            lnPs = np.log(Ps)
+            Ts = np.array(Ts)
+            comps = np.array(comps)
+            # T and incipient composition as functions of log(P)
+            P_spline = CubicSpline(lnPs, np.column_stack([Ts, comps]), bc_type='natural',
+                                   extrapolate=False)
+            self.P_splines[VF] = P_spline
+
+            # Along T the curve turns back at its highest temperature; keep
+            # a spline for each monotonic run, in the order of the trace
+            T_splines = []
+            start = 0
+            for i in range(1, len(Ts) + 1):
+                if i == len(Ts) or (i - start > 1 and (Ts[i] - Ts[i-1])*(Ts[i-1] - Ts[start]) < 0.0):
+                    run = slice(start, i)
+                    Ts_run = Ts[run]
+                    if len(Ts_run) > 1:
+                        order = np.argsort(Ts_run)
+                        T_splines.append(CubicSpline(Ts_run[order], np.column_stack([lnPs[run], comps[run]])[order],
+                                                     bc_type='natural', extrapolate=False))
+                    start = i - 1
+            self.T_splines[VF] = T_splines
+
+            lnPs_fine = np.linspace(lnPs[0], lnPs[-1], 20*len(Ps))
+            Ts_fine = P_spline(lnPs_fine)[:, 0]
+            i_max = int(np.argmax(Ts_fine))
+            if Ts_fine[i_max] > cricondentherm[0]:
+                cricondentherm = (float(Ts_fine[i_max]), float(np.exp(lnPs_fine[i_max])))
+            if Ps[-1] > cricondenbar[1]:
+                cricondenbar = (float(Ts[-1]), float(Ps[-1]))
+        self.cricondentherm = cricondentherm if _cricondentherm is None else _cricondentherm
+        self.cricondenbar = cricondenbar if _cricondenbar is None else _cricondenbar
+        self.critical_point = critical_point
+
+    @staticmethod
+    def _incipient(values):
+        comp = [max(v, 0.0) for v in values.tolist()]
+        tot = sum(comp)
+        return [v/tot for v in comp]
+
+    def T_guess(self, P, VF):
+        r'''Interpolate the temperature and incipient phase composition of
+        the bubble (`VF` = 0) or dew (`VF` = 1) point at a pressure.
+
+        Parameters
+        ----------
+        P : float
+            Pressure, [Pa]
+        VF : float
+            Vapor fraction; 0 or 1, [-]
+
+        Returns
+        -------
+        T : float
+            Temperature, [K]
+        comp : list[float]
+            Incipient phase composition, [-]
+
+        Notes
+        -----
+        None is returned outside the range of the traced curve.
+        '''
+        values = self.P_splines[VF](log(P))
+        if np.isnan(values[0]):
+            return None
+        return float(values[0]), self._incipient(values[1:])
+
+    def P_guess(self, T, VF):
+        r'''Interpolate the pressure and incipient phase composition of
+        the bubble (`VF` = 0) or dew (`VF` = 1) point at a temperature. Where
+        the curve passes a temperature twice, the point reached first from
+        low pressure is returned.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        VF : float
+            Vapor fraction; 0 or 1, [-]
+
+        Returns
+        -------
+        P : float
+            Pressure, [Pa]
+        comp : list[float]
+            Incipient phase composition, [-]
+
+        Notes
+        -----
+        None is returned outside the range of the traced curve.
+        '''
+        for spline in self.T_splines[VF]:
+            values = spline(T)
+            if not np.isnan(values[0]):
+                return float(exp(values[0])), self._incipient(values[1:])
+        return None
+
+
+class FlashVL(Flash):
+    r'''Class for performing flash calculations on one and
+    two phase vapor and liquid multicomponent systems. Use :obj:`FlashVLN` for
+    systems which can have multiple liquid phases.
+
+    The minimum information that is needed is:
+
+    * MWs
+    * Vapor pressure curve
+    * Functioning enthalpy models for each phase
+
+    Parameters
+    ----------
+    constants : :obj:`ChemicalConstantsPackage <thermo.chemical_package.ChemicalConstantsPackage>` object
+        Package of chemical constants; these are used as boundaries at times,
+        initial guesses other times, and in all cases these properties are
+        accessible as attributes of the resulting
+        :obj:`EquilibriumState <thermo.equilibrium.EquilibriumState>` object, [-]
+    correlations : :obj:`PropertyCorrelationsPackage <thermo.chemical_package.PropertyCorrelationsPackage>`
+        Package of chemical T-dependent properties; these are used as boundaries at times,
+        for initial guesses other times, and in all cases these properties are
+        accessible as attributes of the resulting
+        :obj:`EquilibriumState <thermo.equilibrium.EquilibriumState>` object, [-]
+    gas : :obj:`Phase <thermo.phases.Phase>` object
+        A single phase which can represent the gas phase, [-]
+    liquid : :obj:`Phase <thermo.phases.Phase>`
         A single phase which can represent the liquid phase, [-]
     settings : :obj:`BulkSettings <thermo.bulk.BulkSettings>` object
         Object containing settings for calculating bulk and transport
@@ -5361,6 +6923,81 @@ class FlashVL(Flash):
         [-]
     PT_STABILITY_XTOL : float
         Convergence tolerance in the stability test [-]
+    STAB_WARM_START_SIZE : int
+        Number of recent unstable stability test results to remember; a later
+        stability test at a nearby condition first tries the remembered
+        incipient phase composition, and stops there if it is also unstable.
+        0 disables the warm start, [-]
+    STAB_WARM_START_TOL : float
+        Largest relative difference in `T` and `P`, and largest absolute
+        difference in any mole fraction, at which a remembered stability
+        test result is tried first, [-]
+    STAB_TPD_SCREEN : bool
+        If True, every incipient phase guess of a stability test is screened
+        with one fugacity evaluation before it is iterated. Guesses which
+        repeat an earlier guess, or which are already stationary points
+        (:obj:`Stateva_Tsvetkov_TPDF <thermo.utils.Stateva_Tsvetkov_TPDF>`
+        of zero) with a non-negative tangent plane distance, are skipped;
+        neither can lead to a different result, [-]
+    STAB_TPD_SCREEN_MAX : float or None
+        If set, guesses whose tangent plane distance
+        (:obj:`TPD <thermo.utils.TPD>`) divided by `RT` exceeds this value
+        are also skipped when :obj:`STAB_TPD_SCREEN` is set. This cut is a
+        heuristic, not a rigorous prune - a guess far uphill of the feed
+        rarely but possibly iterates to an unstable result - so it is off
+        by default, [-]
+    stab_trials_screened : int
+        Number of stability test guesses screened by this flasher, [-]
+    stab_trials_pruned : int
+        Number of stability test guesses this flasher did not iterate because
+        they were duplicates or already stationary, [-]
+    stab_trials_pruned_TPD_max : int
+        Number of stability test guesses this flasher did not iterate because
+        of :obj:`STAB_TPD_SCREEN_MAX`, [-]
+    FLASH_BATCH_SS_MAXITER : int
+        Maximum number of sequential substitution iterations to try when
+        converging all two-phase feeds at once in :obj:`flash_batch`; feeds
+        not converged by then are flashed individually, [-]
+    VF_envelopes : dict[tuple, :obj:`PhaseEnvelope`]
+        Phase envelopes built by :obj:`build_VF_envelope` or
+        :obj:`trace_phase_envelope`, by the feed composition. Bubble and dew point flashes of those compositions
+        start from the interpolated envelope, [-]
+    PT_2P_STAGES : list[tuple(str, int, float)]
+        Methods to try in order to converge a two phase `TP` flash once the
+        stability test has found a second phase, with the maximum number of
+        iterations and the tolerance of each; see :obj:`solve_PT_2P` for
+        the methods. None uses `PT_SS_MAXITER` or `PT_SS_TOL`. The method
+        which converged is reported as `strategy` in `flash_convergence`,
+        [-]
+    TPV_HSGUA_STAGES : list[tuple(str, int, float)]
+        Strategies to try in order in flashes with one (`T`, `P`, `V`) spec
+        and one (`H`, `S`, `G`, `U`, `A`) spec, with the maximum number of
+        iterations and the tolerance of each; 'bisect' is a secant/bisection
+        solver on `TP` flashes, 'newton_2P' a Newton solver of a vapor-liquid
+        solution, and '1P' the best one phase solution of any phase. None
+        uses the `TPV_HSGUA_BISECT_*` or `TPV_HSGUA_NEWTON_*` settings or the
+        one phase solver defaults. The strategy which succeeded is reported
+        as `strategy` in `flash_convergence`, [-]
+    TPV_HSGUA_SPEC_STAGES : dict[tuple(str, str), list[tuple(str, int, float)]]
+        Strategies to use instead of `TPV_HSGUA_STAGES` for specific
+        specifications, by the fixed variable and the energy specification
+        such as ('P', 'H'), [-]
+    statistics : :obj:`FlashStatistics`
+        When set, the attempts of the `PT_2P_STAGES`, `TPV_HSGUA_STAGES`,
+        and bubble and dew point algorithms are recorded in it, and the
+        stages are attempted in the order it recommends, [-]
+    PT_CUBIC_KERNEL : bool
+        Opt-in; when True and the gas and liquid are
+        :obj:`CEOSGas <thermo.phases.CEOSGas>` and
+        :obj:`CEOSLiquid <thermo.phases.CEOSLiquid>` objects using the same
+        cubic EOS without volume translation, `TP` flashes first try
+        :obj:`cubic_flash_TP_2P`, which works on arrays only and can be
+        compiled with numba. Its two phase solutions are used directly
+        *without a stability test*, so a local or metastable split
+        with a lower Gibbs energy than the feed is accepted and
+        `stab_info` in `flash_convergence` is None; when it does not find
+        one, the stability test is performed as usual. Defaults to False,
+        [-]
     DEW_BUBBLE_QUASI_NEWTON_XTOL : float
         Convergence tolerance in quasi-Newton bubble and dew point flashes, [-]
     DEW_BUBBLE_QUASI_NEWTON_MAXITER : int
@@ -5486,10 +7123,30 @@ class FlashVL(Flash):
     SS_2P_STAB_HIGHEST_COMP_DIFF = False
     SS_2P_STAB_COMP_DIFF_MIN = None
 
+    STAB_WARM_START_SIZE = 0
+    STAB_WARM_START_TOL = 0.02
+
+    STAB_TPD_SCREEN = False
+    STAB_TPD_SCREEN_MAX = None
+    stab_trials_screened = 0
+    stab_trials_pruned = 0
+    stab_trials_pruned_TPD_max = 0
+
     PT_methods = [PT_SS, PT_SS_MEHRA, PT_SS_GDEM3, PT_NEWTON_lNKVF]
     PT_algorithms = [sequential_substitution_2P, sequential_substitution_Mehra_2P,
                      sequential_substitution_GDEM3_2P, nonlin_2P_newton]
 
+    FLASH_BATCH_SS_MAXITER = 1000
+    PT_CUBIC_KERNEL = False
+
+    PT_2P_STAGES = [(PT_SS, None, None)]
+    TPV_HSGUA_STAGES = [(HSGUA_BISECT, None, None), (HSGUA_NEWTON_2P, None, None),
+                        (HSGUA_1P, None, None)]
+    TPV_HSGUA_SPEC_STAGES = {}
+    statistics = None
+
+    VF_envelopes = None
+
     PT_STABILITY_MAXITER = 500 # 30 good professional default; 500 used in source DTU
     PT_STABILITY_XTOL = 5E-9 # 1e-12 was too strict; 1e-10 used in source DTU; 1e-9 set for some points near critical where convergence stopped; even some more stopped at higher Ts
 
@@ -5582,6 +7239,12 @@ class FlashVL(Flash):
         self.unique_phase_count = 1 + self.unique_liquid_count
         self.unique_liquid_hashes = unique_liquid_hashes
 
+        # sigma and epsilon for the array based TP flash, if it supports the phases
+        self.cubic_kernel_constants = None
+        if (isinstance(gas, CEOSGas) and isinstance(liquid, CEOSLiquid)
+                and gas_to_unique_liquid is not None):
+            self.cubic_kernel_constants = batch_cubic_eos_constants.get(gas.eos_class)
+
     def flash_TVF(self, T, VF, zs, solution=None, hot_start=None):
         return self.flash_TVF_2P(T, VF, zs, self.liquid, self.gas, solution=solution, hot_start=hot_start)
 
@@ -5598,8 +7261,17 @@ class FlashVL(Flash):
         dew_bubble_newton_xtol = self.DEW_BUBBLE_NEWTON_XTOL
         dew_bubble_maxiter = self.DEW_BUBBLE_QUASI_NEWTON_MAXITER
 
+        envelope_guess = None
+        if hot_start is None and self.VF_envelopes is not None and (VF == 0.0 or VF == 1.0):
+            envelope = self.VF_envelopes.get(tuple(zs))
+            if envelope is not None:
+                envelope_guess = envelope.P_guess(T, VF)
+
         if hot_start is not None:
             P, xs, ys = hot_start.P, hot_start.liquid0.zs, hot_start.gas.zs
+        elif envelope_guess is not None:
+            P, comp = envelope_guess
+            xs, ys = (zs, comp) if VF == 0.0 else (comp, zs)
         else:
             for method in self.VF_guess_methods:
                 try:
@@ -5629,14 +7301,24 @@ class FlashVL(Flash):
             algos = self.VF_flash_algos
 
         if integral_VF:
+            statistics = self.statistics
+            if statistics is not None:
+                region = statistics.region(self.constants, zs, T=T)
+                algos = statistics.order('TVF', region, algos, [algo.__name__ for algo in algos])
             for algo in algos:
+                if statistics is not None:
+                    t0 = perf_counter()
                 try:
                     sln = algo(P, fixed_val=T, zs=zs, liquid_phase=liquid, gas_phase=gas,
                                 iter_var='P', fixed_var='T', V_over_F=VF,
                                 maxiter=dew_bubble_maxiter, xtol=dew_bubble_xtol,
                                 comp_guess=comp_guess)
+                    if statistics is not None:
+                        statistics.record('TVF', region, algo.__name__, True, sln[4], perf_counter() - t0)
                     break
                 except Exception as e:
+                    if statistics is not None:
+                        statistics.record('TVF', region, algo.__name__, False, 0, perf_counter() - t0)
                     print(e)
                     continue
 
@@ -5665,8 +7347,17 @@ class FlashVL(Flash):
         dew_bubble_xtol = self.DEW_BUBBLE_QUASI_NEWTON_XTOL
         dew_bubble_maxiter = self.DEW_BUBBLE_QUASI_NEWTON_MAXITER
         dew_bubble_newton_xtol = self.DEW_BUBBLE_NEWTON_XTOL
+        envelope_guess = None
+        if hot_start is None and self.VF_envelopes is not None and (VF == 0.0 or VF == 1.0):
+            envelope = self.VF_envelopes.get(tuple(zs))
+            if envelope is not None:
+                envelope_guess = envelope.T_guess(P, VF)
+
         if hot_start is not None:
             T, xs, ys = hot_start.T, hot_start.liquid0.zs, hot_start.gas.zs
+        elif envelope_guess is not None:
+            T, comp = envelope_guess
+            xs, ys = (zs, comp) if VF == 0.0 else (comp, zs)
         else:
             for method in self.VF_guess_methods:
                 try:
@@ -5696,14 +7387,24 @@ class FlashVL(Flash):
             algos = self.VF_flash_algos
 
         if integral_VF:
+            statistics = self.statistics
+            if statistics is not None:
+                region = statistics.region(self.constants, zs, P=P)
+                algos = statistics.order('PVF', region, algos, [algo.__name__ for algo in algos])
             for algo in algos:
+                if statistics is not None:
+                    t0 = perf_counter()
                 try:
                     sln = algo(T, fixed_val=P, zs=zs, liquid_phase=liquid, gas_phase=gas,
                                 iter_var='T', fixed_var='P', V_over_F=VF,
                                 maxiter=dew_bubble_maxiter, xtol=dew_bubble_xtol,
                                 comp_guess=comp_guess)
+                    if statistics is not None:
+                        statistics.record('PVF', region, algo.__name__, True, sln[4], perf_counter() - t0)
                     break
                 except Exception as e:
+                    if statistics is not None:
+                        statistics.record('PVF', region, algo.__name__, False, 0, perf_counter() - t0)
                     print(e)
                     continue
 
@@ -5718,6 +7419,119 @@ class FlashVL(Flash):
         else:
             raise NotImplementedError("TODO")
 
+    def build_VF_envelope(self, zs, P_low=1e5, factor=1.15, min_factor=1.0001):
+        r'''Method to trace the bubble and dew curves of a mixture, store them
+        as a :obj:`PhaseEnvelope` in :obj:`VF_envelopes`, and return it.
+        Afterwards, bubble and dew point flashes of the same composition
+        start from the interpolated envelope instead of the usual initial
+        guesses.
+
+        Each curve is traced with `P` and `VF` flashes, starting from `P_low`
+        and multiplying the pressure by `factor` after each point; each flash
+        is started from the previous point. When a point fails or jumps away
+        from the curve, the step is halved, and the trace ends once the step
+        factor is under `min_factor`.
+
+        Parameters
+        ----------
+        zs : list[float]
+            Mole fractions of each component, [-]
+        P_low : float, optional
+            Pressure to start tracing the envelope at, [Pa]
+        factor : float, optional
+            Initial ratio between the pressures of consecutive points, [-]
+        min_factor : float, optional
+            Ratio between the pressures of consecutive points at which
+            the trace ends, [-]
+
+        Returns
+        -------
+        envelope : :obj:`PhaseEnvelope`
+            Phase envelope, [-]
+        '''
+        branches = []
+        for VF in (0.0, 1.0):
+            Ps, Ts, comps = [], [], []
+            P, step, prev = P_low, factor, None
+            while step > min_factor:
+                try:
+                    res = self.flash(P=P, VF=VF, zs=zs, hot_start=prev)
+                    xs, ys = res.liquid0.zs, res.gas.zs
+                    if prev is not None and abs(res.T - prev.T) > 0.05*prev.T:
+                        raise ValueError("Jumped away from the envelope")
+                    if sum([abs(xs[i] - ys[i]) for i in self.cmps]) < 1e-3:
+                        raise ValueError("Trivial solution")
+                except Exception:
+                    if prev is None:
+                        raise ValueError("Could not flash the first point of the envelope")
+                    step = 1.0 + 0.5*(step - 1.0)
+                    P = prev.P*step
+                    continue
+                Ps.append(P)
+                Ts.append(res.T)
+                comps.append(ys if VF == 0.0 else xs)
+                prev = res
+                P *= step
+            branches.append((Ps, Ts, comps))
+        (bubble_Ps, bubble_Ts, bubble_comps), (dew_Ps, dew_Ts, dew_comps) = branches
+        envelope = PhaseEnvelope(zs, bubble_Ps, bubble_Ts, bubble_comps, dew_Ps, dew_Ts, dew_comps)
+        if self.VF_envelopes is None:
+            self.VF_envelopes = {}
+        self.VF_envelopes[tuple(zs)] = envelope
+        return envelope
+
+    def trace_phase_envelope(self, zs, P_low=1e5, **kwargs):
+        r'''Method to trace the whole bubble and dew curve of a mixture in one
+        continuation through the critical point with
+        :obj:`phase_envelope_continuation`, store it as a
+        :obj:`PhaseEnvelope` in :obj:`VF_envelopes`, and return it. Unlike
+        :obj:`build_VF_envelope`, no flashes are done after the first bubble
+        point, and the part of the curves near the critical point, where
+        bubble and dew point flashes fail, is included.
+
+        The curves stored are each from `P_low` up to their highest
+        pressure; the critical point, cricondenbar, and cricondentherm are
+        those found by the continuation.
+
+        Parameters
+        ----------
+        zs : list[float]
+            Mole fractions of each component, [-]
+        P_low : float, optional
+            Pressure to start and end the envelope at, [Pa]
+        kwargs : dict
+            Other settings of :obj:`phase_envelope_continuation`, [-]
+
+        Returns
+        -------
+        envelope : :obj:`PhaseEnvelope`
+            Phase envelope, [-]
+        '''
+        start = self.flash(P=P_low, VF=0.0, zs=zs)
+        Ts, Ps, betas, comps, critical_point, cricondenbar, cricondentherm, _ = phase_envelope_continuation(
+            zs, self.liquid, self.gas, start.T, P_low, start.gas.zs, P_min=P_low, **kwargs)
+        branches = []
+        for beta in (0.0, 1.0):
+            points = [(P, T, comp) for P, T, b, comp in zip(Ps, Ts, betas, comps) if b == beta]
+            if beta == 1.0:
+                points.reverse()
+            # Keep each curve from low pressure up to its highest pressure
+            end = 1
+            while end < len(points) and points[end][0] > points[end-1][0]:
+                end += 1
+            points = points[:end]
+            if len(points) < 2:
+                raise ValueError("Phase envelope trace did not pass the critical point")
+            branches.append(([p[0] for p in points], [p[1] for p in points], [p[2] for p in points]))
+        (bubble_Ps, bubble_Ts, bubble_comps), (dew_Ps, dew_Ts, dew_comps) = branches
+        envelope = PhaseEnvelope(zs, bubble_Ps, bubble_Ts, bubble_comps, dew_Ps, dew_Ts, dew_comps,
+                                 critical_point=critical_point, cricondenbar=cricondenbar,
+                                 cricondentherm=cricondentherm)
+        if self.VF_envelopes is None:
+            self.VF_envelopes = {}
+        self.VF_envelopes[tuple(zs)] = envelope
+        return envelope
+
     def stability_test_Michelsen(self, T, P, zs, min_phase, other_phase,
                                  existing_comps=None, skip=None,
                                  expect_liquid=False, expect_aqueous=False,
@@ -5733,6 +7547,20 @@ class FlashVL(Flash):
         if skip is not None:
             (gen() for i in range(skip))
 
+        # Remembered results only help when the first unstable trial is used
+        warm_start = (self.STAB_WARM_START_SIZE and skip is None and not all_solutions
+                      and not lowest_dG and not highest_comp_diff and not handle_iffy)
+        warm_trials = []
+        gen = enumerate(gen)
+        if self.STAB_TPD_SCREEN:
+            gen = self._stab_TPD_screen(gen, T, zs, min_phase, other_phase)
+        if warm_start:
+            warm_key = (self._stab_model_key(min_phase), self._stab_model_key(other_phase),
+                        existing_phases, expect_liquid, expect_aqueous)
+            warm_trials = self._stab_warm_start_trials(T, P, zs, warm_key)
+            gen = chain(warm_trials, gen)
+        warm_trials_left = len(warm_trials)
+
         iffy_solution = None
         lowest_solution, dG_min = None, -1e100
         comp_diff_solution, comp_diff_max = None, 0.0
@@ -5742,7 +7570,9 @@ class FlashVL(Flash):
         if all_solutions:
             all_solutions_list = []
 
-        for i, trial_comp in enumerate(gen):
+        for i, trial_comp in gen:
+                warm_trial = warm_trials_left > 0
+                warm_trials_left -= 1
                 try:
                     sln = stabiliy_iteration_Michelsen(min_phase, trial_comp, test_phase=other_phase,
                                                        maxiter=self.PT_STABILITY_MAXITER, xtol=self.PT_STABILITY_XTOL)
@@ -5819,10 +7649,74 @@ class FlashVL(Flash):
             if skip is not None:
                 i += skip
             stab_guess_name = self.stab.incipient_guess_name(i, expect_liquid=expect_liquid)
+            if warm_start:
+                self._stab_warm_start_store(T, P, zs, warm_key, appearing_zs, i)
+                if warm_trial:
+                    stab_guess_name = 'warm start from %s' %(stab_guess_name)
             return (False, (trial_zs, appearing_zs, V_over_F, stab_guess_name, i, sum_criteria, lnK_2_tot))
         else:
             return (stable, (None, None, None, None, None, None, None))
 
+    def _stab_TPD_screen(self, trials, T, zs, min_phase, other_phase):
+        # Yield only the guesses worth iterating; the feed and trial
+        # compositions get the same trace amounts as in the stability iteration
+        cmps, P = self.cmps, min_phase.P
+        zs = [zi if zi != 0.0 else 1e-50 for zi in zs]
+        if zs != min_phase.zs:
+            min_phase = min_phase.to(T=T, P=P, zs=zs)
+        fugacities = min_phase.fugacities_lowest_Gibbs()
+        lnphis = [log(fugacities[j]/(P*zs[j])) for j in cmps]
+        RT_inv = 1.0/(R*T)
+        tpd_max = self.STAB_TPD_SCREEN_MAX
+        seen = []
+        for i, trial_comp in trials:
+            self.stab_trials_screened += 1
+            ys = [yi if yi != 0.0 else 1e-50 for yi in trial_comp]
+            tot_inv = 1.0/sum(ys)
+            ys = [yi*tot_inv for yi in ys]
+            duplicate = False
+            for ys_seen in seen:
+                if max([abs(ys[j] - ys_seen[j]) for j in cmps]) < 1e-9:
+                    duplicate = True
+                    break
+            if duplicate:
+                self.stab_trials_pruned += 1
+                continue
+            seen.append(ys)
+            lnphis_trial = other_phase.lnphis_at_zs(ys)
+            tpd = TPD(T, zs, lnphis, ys, lnphis_trial)*RT_inv
+            if tpd >= 0.0 and Stateva_Tsvetkov_TPDF(lnphis, zs, lnphis_trial, ys) < 1e-14:
+                self.stab_trials_pruned += 1
+                continue
+            if tpd_max is not None and tpd > tpd_max:
+                self.stab_trials_pruned_TPD_max += 1
+                continue
+            yield i, trial_comp
+
+    @staticmethod
+    def _stab_model_key(phase):
+        if type(phase).model_hash is Phase.model_hash:
+            return type(phase)
+        return phase.model_hash()
+
+    def _stab_warm_start_near(self, T, P, zs, key, entry):
+        T_old, P_old, zs_old, key_old = entry[:4]
+        tol = self.STAB_WARM_START_TOL
+        return (key_old == key and abs(T - T_old) <= tol*T_old and abs(P - P_old) <= tol*P_old
+                and max([abs(zs[j] - zs_old[j]) for j in self.cmps]) <= tol)
+
+    def _stab_warm_start_trials(self, T, P, zs, key):
+        history = self.__dict__.get('_stab_warm_start_history', ())
+        return [(entry[5], entry[4]) for entry in history
+                if self._stab_warm_start_near(T, P, zs, key, entry)]
+
+    def _stab_warm_start_store(self, T, P, zs, key, comp, i):
+        history = self.__dict__.get('_stab_warm_start_history', [])
+        # Most recent first, replacing results this one supersedes
+        history = [entry for entry in history if not self._stab_warm_start_near(T, P, zs, key, entry)]
+        history.insert(0, (T, P, list(zs), key, list(comp), i))
+        self._stab_warm_start_history = history[:self.STAB_WARM_START_SIZE]
+
 
     def flash_TP_stability_test(self, T, P, zs, liquid, gas, solution=None, LL=False, phases_ready=False):
         # gen = self.stab.incipient_guesses(T, P, zs)
@@ -5878,16 +7772,34 @@ class FlashVL(Flash):
         if 0:
             self.PT_converge(T=T, P=P, zs=zs, xs_guess=trial_zs, ys_guess=appearing_zs, liquid_phase=min_phase,
                         gas_phase=other_phase, V_over_F_guess=V_over_F_guess)
-        try:
-            V_over_F, xs, ys, l, g, iteration, err = sequential_substitution_2P(T=T, P=P, V=None,
-                                                                                zs=zs, xs_guess=trial_zs, ys_guess=appearing_zs,
-                                                                                liquid_phase=min_phase,
-                                                                                gas_phase=other_phase, maxiter=self.PT_SS_MAXITER,
-                                                                                tol=self.PT_SS_TOL,
-                                                                                V_over_F_guess=V_over_F_guess)
-        except TrivialSolutionError as e:
-            ls, g = ([liquid], None) if min_phase is liquid else ([], gas)
-            return g, ls, [], [1.0], {'iterations': 0, 'err': 0.0, 'stab_info': stab_info}
+        stages, statistics = self.PT_2P_STAGES, self.statistics
+        if statistics is not None:
+            region = statistics.region(self.constants, zs, T=T, P=P)
+            stages = statistics.order('TP', region, stages)
+        for i, (method, maxiter, tol) in enumerate(stages):
+            if statistics is not None:
+                t0 = perf_counter()
+            try:
+                V_over_F, xs, ys, l, g, iteration, err = solve_PT_2P(method, T, P, zs, trial_zs, appearing_zs,
+                                                                     liquid_phase=min_phase, gas_phase=other_phase,
+                                                                     maxiter=self.PT_SS_MAXITER if maxiter is None else maxiter,
+                                                                     tol=self.PT_SS_TOL if tol is None else tol,
+                                                                     V_over_F_guess=V_over_F_guess)
+                if statistics is not None:
+                    statistics.record('TP', region, method, True, iteration, perf_counter() - t0)
+                break
+            except TrivialSolutionError as e:
+                if statistics is not None:
+                    statistics.record('TP', region, method, True, 0, perf_counter() - t0)
+                ls, g = ([liquid], None) if min_phase is liquid else ([], gas)
+                return g, ls, [], [1.0], {'iterations': 0, 'err': 0.0, 'stab_info': stab_info,
+                                          'strategy': method}
+            except (UnconvergedError, OscillationError, PhaseCountReducedError,
+                    ValueError, ZeroDivisionError, OverflowError) as e:
+                if statistics is not None:
+                    statistics.record('TP', region, method, False, 0, perf_counter() - t0)
+                if i == len(stages) - 1:
+                    raise e
 
         if V_over_F < self.PT_SS_POLISH_VF or V_over_F > 1.0-self.PT_SS_POLISH_VF:
             # Continue the SS, with the previous values, to a much tighter tolerance - if specified/allowed
@@ -5904,17 +7816,19 @@ class FlashVL(Flash):
             if V_over_F < 0.0 or V_over_F > 1.0:
 
                 ls, g = ([liquid], None) if min_phase is liquid else ([], gas)
-                return g, ls, [], [1.0], {'iterations': iteration, 'err': err, 'stab_info': stab_info}
+                return g, ls, [], [1.0], {'iterations': iteration, 'err': err, 'stab_info': stab_info,
+                                          'strategy': method}
         if LL:
             return None, [g, l], [], [V_over_F, 1.0 - V_over_F], {'iterations': iteration, 'err': err,
-                                                                    'stab_info': stab_info}
+                                                                    'stab_info': stab_info, 'strategy': method}
 
         if min_phase is liquid:
             ls, g, V_over_F = [l], g, V_over_F
         else:
             ls, g, V_over_F = [g], l, 1.0 - V_over_F
 
-        return g, ls, [], [V_over_F, 1.0 - V_over_F], {'iterations': iteration, 'err': err, 'stab_info': stab_info}
+        return g, ls, [], [V_over_F, 1.0 - V_over_F], {'iterations': iteration, 'err': err, 'stab_info': stab_info,
+                                                       'strategy': method}
 
     def PT_converge(self, T, P, zs, xs_guess, ys_guess, liquid_phase,
                     gas_phase, V_over_F_guess=0.5):
@@ -5931,9 +7845,10 @@ class FlashVL(Flash):
                      sequential_substitution_GDEM3_2P, nonlin_2P_newton]
 
     def flash_TPV(self, T, P, V, zs=None, solution=None, hot_start=None):
-        if hot_start is not None:
+        if hot_start is not None and hot_start.phase_count == 2 and hot_start.gas is not None:
+            # Only a vapor-liquid solution carries K values to start from
             try:
-                VF_guess, xs, ys = hot_start.beta_gas, hot_start.liquid0.zs, hot_start.gas.zs
+                VF_guess, xs, ys = hot_start.gas_beta, hot_start.liquid0.zs, hot_start.gas.zs
                 liquid, gas = self.liquid, self.gas
 
                 V_over_F, xs, ys, l, g, iteration, err = sequential_substitution_2P(T=T, P=P, V=None,
@@ -5944,17 +7859,254 @@ class FlashVL(Flash):
                 assert 0.0 <= V_over_F <= 1.0
                 return g, [l], [], [V_over_F, 1.0 - V_over_F], {'iterations': iteration, 'err': err}
             except Exception as e:
-                print('FAILED from hot start TP')
                 pass
 
+        if (self.PT_CUBIC_KERNEL and self.cubic_kernel_constants is not None
+                and V is None and solution is None):
+            sln = self.flash_TP_cubic_kernel(T, P, zs)
+            if sln is not None:
+                return sln
 
         return self.flash_TP_stability_test(T, P, zs, self.liquid, self.gas, solution=solution)
 
+    def flash_TP_cubic_kernel(self, T, P, zs):
+        # Only two phase solutions are returned; None means the stability
+        # test is needed
+        for zi in zs:
+            if zi <= 0.0:
+                return None
+        eos = self.gas.eos_mix
+        try:
+            two_phase, V_over_F, xs, ys, iteration, err = cubic_flash_TP_2P(
+                T, P, zs, eos.Tcs, eos.Pcs, eos.omegas, eos.bs, eos.a_alphas_vectorized(T),
+                eos.kijs, *self.cubic_kernel_constants, maxiter=self.PT_SS_MAXITER,
+                tol=self.PT_SS_TOL)
+        except Exception:
+            return None
+        # Near-boundary solutions are left to the polishing of `flash_2P`
+        if (not two_phase or V_over_F < self.PT_SS_POLISH_VF
+                or V_over_F > 1.0 - self.PT_SS_POLISH_VF):
+            return None
+        g = self.gas.to(T=T, P=P, zs=ys)
+        l = self.liquid.to(T=T, P=P, zs=xs)
+        return g, [l], [], [V_over_F, 1.0 - V_over_F], {'iterations': iteration, 'err': err,
+                                                        'stab_info': None}
+
+    def flash_batch(self, zs_matrix, T, P):
+        r'''Method to perform TP flashes on many feed compositions at the same
+        temperature and pressure, returning the results in a
+        :obj:`FlashResultTable <thermo.equilibrium.FlashResultTable>`
+        rather than as :obj:`EquilibriumState <thermo.equilibrium.EquilibriumState>`
+        objects.
+
+        When the phase models are composition independent, a single set of K
+        values is used to solve the Rachford-Rice equation for every feed.
+        When the gas and liquid are :obj:`CEOSGas <thermo.phases.CEOSGas>` and
+        :obj:`CEOSLiquid <thermo.phases.CEOSLiquid>` objects using the same
+        cubic EOS without volume translation, the Wilson-guessed stability
+        test and the sequential substitution are performed for all feeds at
+        once with NumPy array operations. Any feed the array solution cannot
+        settle, and all feeds for other phase models, are flashed with
+        :obj:`flash <Flash.flash>`.
+
+        Parameters
+        ----------
+        zs_matrix : list[list[float]] or ndarray
+            Mole fractions of each component, one feed per row, [-]
+        T : float
+            Temperature, [K]
+        P : float
+            Pressure, [Pa]
+
+        Returns
+        -------
+        table : :obj:`FlashResultTable <thermo.equilibrium.FlashResultTable>`
+            Results with one row per feed, and a `batched` column which is
+            False for feeds that were flashed individually, [-]
+
+        Notes
+        -----
+        The array path identifies single phase feeds as gas or liquid with
+        the phase identification parameter. Two-phase feeds whose
+        lighter phase is not vapor-like are flashed individually.
+
+        Examples
+        --------
+        >>> from thermo import ChemicalConstantsPackage, CEOSGas, CEOSLiquid, PRMIX, FlashVL, PropertyCorrelationsPackage, HeatCapacityGas
+        >>> constants = ChemicalConstantsPackage(Tcs=[190.564, 305.32, 126.2], Pcs=[4599000.0, 4872000.0, 3394387.5], omegas=[0.008, 0.098, 0.04], MWs=[16.04246, 30.06904, 28.0134], CASs=['74-82-8', '74-84-0', '7727-37-9'])
+        >>> correlations = PropertyCorrelationsPackage(constants, skip_missing=True, HeatCapacityGases=[HeatCapacityGas(poly_fit=(50.0, 1000.0, [6.7e-21, -3.0e-17, 5.8e-14, -6.3e-11, 4.2e-08, -1.6e-05, 0.0035, -0.4, 50.])), HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.1e-21, -3.3e-17, 6.6e-14, -7.2e-11, 4.5e-08, -1.5e-05, 0.0023, -0.08, 34.])), HeatCapacityGas(poly_fit=(50.0, 1000.0, [-6.4e-21, 3.0e-17, -5.9e-14, 6.1e-11, -3.5e-08, 1.1e-05, -0.0017, 0.11, 27.]))])
+        >>> eos_kwargs = {'Pcs': constants.Pcs, 'Tcs': constants.Tcs, 'omegas': constants.omegas}
+        >>> gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases)
+        >>> liquid = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases)
+        >>> flasher = FlashVL(constants, correlations, liquid=liquid, gas=gas)
+        >>> res = flasher.flash_batch([[0.965, 0.018, 0.017], [0.5, 0.5, 0.0]], T=110.0, P=1e5)
+        >>> res['phase_count']
+        array([2, 1])
+        >>> round(float(res['gas_beta'][0]), 6)
+        0.088548
+        '''
+        zs_matrix = np.array(zs_matrix, dtype=float)
+        n, N = zs_matrix.shape
+        table = FlashResultTable(self, n, zs_matrix)
+        batched = np.zeros(n, dtype=bool)
+
+        gas, liquid = self.gas, self.liquid
+        if self.max_phases != 2:
+            pass
+        elif self.K_composition_independent:
+            zs0 = zs_matrix[0].tolist()
+            lnKs = (np.array(liquid.to(T=T, P=P, zs=zs0).lnphis())
+                    - np.array(gas.to(T=T, P=P, zs=zs0).lnphis()))
+            Ks = np.broadcast_to(np.exp(lnKs), (n, N))
+            VFs, xs, ys = Rachford_Rice_many(zs_matrix, Ks)
+            gas_like = np.where(np.isnan(VFs), (Ks*zs_matrix).sum(axis=1) > 1.0, VFs >= 1.0)
+            two_phase = (VFs > 0.0) & (VFs < 1.0)
+            batched[:] = True
+            self._flash_batch_store(table, T, P, batched, two_phase, gas_like, VFs, xs, ys,
+                                    np.where(gas_like, 0, 1))
+        elif (isinstance(gas, CEOSGas) and isinstance(liquid, CEOSLiquid)
+              and self.gas_to_unique_liquid is not None
+              and gas.eos_class in batch_cubic_eos_constants):
+            batched, two_phase, gas_like, VFs, xs, ys, feed_liquid = self._flash_batch_cubic(zs_matrix, T, P)
+            self._flash_batch_store(table, T, P, batched, two_phase, gas_like, VFs, xs, ys,
+                                    np.where(feed_liquid, 1, 0))
+
+        for i in np.nonzero(~batched)[0]:
+            table.store(i, self.flash(zs=zs_matrix[i].tolist(), T=T, P=P))
+        table.columns['batched'] = batched
+        return table
+
+    @staticmethod
+    def _flash_batch_store(table, T, P, batched, two_phase, gas_like, VFs, xs, ys,
+                           single_models):
+        # Models are indexes into `phases`, [gas, liquid]
+        two_phase = batched & two_phase
+        one_gas = batched & ~two_phase & gas_like
+        one_liquid = batched & ~two_phase & ~gas_like
+        one_phase = one_gas | one_liquid
+        table.T[batched] = T
+        table.P[batched] = P
+        table.gas_count[two_phase | one_gas] = 1
+        table.liquid_count[two_phase | one_liquid] = 1
+        table.betas[two_phase, 0] = VFs[two_phase]
+        table.betas[two_phase, 1] = 1.0 - VFs[two_phase]
+        table.phase_zs[two_phase, 0] = ys[two_phase]
+        table.phase_zs[two_phase, 1] = xs[two_phase]
+        table.phase_models[two_phase, 0] = 0
+        table.phase_models[two_phase, 1] = 1
+        table.betas[one_phase, 0] = 1.0
+        table.phase_zs[one_phase, 0] = table.zs[one_phase]
+        table.phase_models[one_phase, 0] = single_models[one_phase]
+
+    def _flash_batch_cubic(self, zs, T, P):
+        n, N = zs.shape
+        eos_constants = batch_cubic_eos_constants[self.gas.eos_class]
+        delta_coeff, epsilon_coeff = eos_constants[2:]
+        eos = self.liquid.to(T=T, P=P, zs=zs[0].tolist()).eos_mix
+        bs = np.array(eos.bs)
+        one_m_kijs = 1.0 - np.array(eos.kijs)
+        a_alphas, da_alpha_dTs = np.array(eos.a_alphas), np.array(eos.da_alpha_dTs)
+        a_alpha_roots = np.sqrt(a_alphas)
+        a_alpha_ijs = one_m_kijs*np.outer(a_alpha_roots, a_alpha_roots)
+        da_alpha_dT_ijs = 0.5*one_m_kijs*(np.outer(da_alpha_dTs, a_alphas)
+                                          + np.outer(a_alphas, da_alpha_dTs))/np.outer(a_alpha_roots, a_alpha_roots)
+
+        def lnphis(comps, liquid):
+            return cubic_lnphis_many(T, P, comps, bs, a_alpha_ijs, *eos_constants, liquid=liquid)[0:2]
+
+        def PIPs(comps, Vs):
+            b = comps.dot(bs)
+            return cubic_PIPs_many(T, Vs, comps, (b, delta_coeff*b, epsilon_coeff*b*b),
+                                   a_alpha_ijs, da_alpha_dT_ijs)
+
+        present = zs > 0.0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_zs = np.where(present, np.log(np.where(present, zs, 1.0)), -np.inf)
+
+            # Feed at whichever root has the lower Gibbs energy
+            lnphis_zl, V_zl = lnphis(zs, True)
+            lnphis_zg, V_zg = lnphis(zs, False)
+            G_l = np.where(present, zs*lnphis_zl, 0.0).sum(axis=1)
+            G_g = np.where(present, zs*lnphis_zg, 0.0).sum(axis=1)
+            # With a single root, the flash picks the model matching the root
+            feed_liquid = (G_l < G_g) | ((G_l == G_g) & (PIPs(zs, V_zl) > 1.0))
+            lnphis_z = np.where(feed_liquid[:, None], lnphis_zl, lnphis_zg)
+            V_z = np.where(feed_liquid, V_zl, V_zg)
+            ds = log_zs + lnphis_z
+
+            # Michelsen stability test from the two Wilson guesses
+            constants = self.constants
+            Tcs, Pcs, omegas = np.array(constants.Tcs), np.array(constants.Pcs), np.array(constants.omegas)
+            Ks_Wilson = Pcs/P*np.exp(5.37*(1.0 + omegas)*(1.0 - Tcs/T))
+            maxiter, xtol = self.PT_STABILITY_MAXITER, self.PT_STABILITY_XTOL
+            trial_results = []
+            for trial_liquid, lnWs in ((False, log_zs + np.log(Ks_Wilson)),
+                                       (True, log_zs - np.log(Ks_Wilson))):
+                converged = ~present.any(axis=1)
+                for _ in range(maxiter):
+                    idx = np.nonzero(~converged)[0]
+                    if not idx.size:
+                        break
+                    Ws = np.exp(lnWs[idx])
+                    ws = Ws/Ws.sum(axis=1)[:, None]
+                    lnWs_new = ds[idx] - lnphis(ws, trial_liquid)[0]
+                    lnWs_new[~present[idx]] = -np.inf
+                    change = np.where(present[idx], np.abs(lnWs_new - lnWs[idx]), 0.0).max(axis=1)
+                    lnWs[idx] = lnWs_new
+                    converged[idx[change < xtol]] = True
+                Ws = np.exp(lnWs)
+                sum_Ws = Ws.sum(axis=1)
+                ws = Ws/sum_Ws[:, None]
+                lnK_2_tot = np.where(present, (np.log(np.where(present, ws, 1.0)) - log_zs)**2, 0.0).sum(axis=1)
+                unstable = converged & (sum_Ws > 1.0 + 1e-9) & (lnK_2_tot > 1e-7)
+                trial_results.append((converged, unstable, ws))
+
+            (conv_g, unstable_g, ws_g), (conv_l, unstable_l, ws_l) = trial_results
+            unstable = unstable_g | unstable_l
+            settled = unstable | (conv_g & conv_l)
+
+            # Successive substitution from the stability test results
+            Ks = np.ones((n, N))
+            Ks = np.where(unstable_g[:, None], ws_g/np.where(present, zs, 1.0), Ks)
+            Ks = np.where(unstable_l[:, None], np.where(present, zs, 1.0)/ws_l, Ks)
+            both = unstable_g & unstable_l
+            Ks[both] = ws_g[both]/ws_l[both]
+
+            two_phase = np.zeros(n, dtype=bool)
+            VFs = np.full(n, np.nan)
+            xs, ys = zs.copy(), zs.copy()
+            V_xs, V_ys = V_z.copy(), V_z.copy()
+            ss_converged = ~unstable
+            idx = np.nonzero(unstable)[0]
+            VF_guess = None
+            for _ in range(self.FLASH_BATCH_SS_MAXITER):
+                if not idx.size:
+                    break
+                VF_idx, xs_idx, ys_idx = Rachford_Rice_many(zs[idx], Ks[idx], guess=VF_guess)
+                trivial = np.isnan(VF_idx) | (np.abs(xs_idx - ys_idx).sum(axis=1) < 1e-5)
+                lnphis_l, V_l = lnphis(np.where(trivial[:, None], zs[idx], xs_idx), True)
+                lnphis_g, V_g = lnphis(np.where(trivial[:, None], zs[idx], ys_idx), False)
+                Ks_new = np.exp(lnphis_l - lnphis_g)
+                err = np.where(present[idx], (Ks_new*xs_idx/ys_idx - 1.0)**2, 0.0).sum(axis=1)
+                done = trivial | (err < self.PT_SS_TOL)
+                Ks[idx] = Ks_new
+                VFs[idx], xs[idx], ys[idx], V_xs[idx], V_ys[idx] = VF_idx, xs_idx, ys_idx, V_l, V_g
+                two_phase[idx[done & ~trivial]] = True
+                ss_converged[idx[done]] = True
+                VF_guess = VF_idx[~done]
+                idx = idx[~done]
+
+            two_phase &= (VFs > 0.0) & (VFs < 1.0)
+            gas_like = PIPs(zs, V_z) < 1.00000000000001
+            # Leave liquid-liquid splits to the full flash for phase sorting
+            two_phase_VL = two_phase & (PIPs(ys, V_ys) < 1.00000000000001)
+        batched = settled & ss_converged & (two_phase_VL | ~unstable)
+        return batched, two_phase, gas_like, VFs, xs, ys, feed_liquid
+
     def flash_TPV_HSGUA(self, fixed_val, spec_val, fixed_var='P', spec='H',
                         iter_var='T', zs=None, solution=None,
                         selection_fun_1P=None, hot_start=None):
 
-        constants, correlations = self.constants, self.correlations
         if solution is None:
             if fixed_var == 'P' and spec == 'H':
                 fun = lambda obj: -obj.S()
@@ -5984,44 +8136,80 @@ class FlashVL(Flash):
                     return True
                 return False
 
-        try:
-            solutions_1P = []
-            G_min = 1e100
-            results_G_min_1P = None
-            for phase in self.unique_phases:
-                try:
-                    T, P, phase, iterations, err = solve_PTV_HSGUA_1P(phase, zs, fixed_val, spec_val, fixed_var=fixed_var,
-                                                                      spec=spec, iter_var=iter_var, constants=constants, correlations=correlations)
-                    G = fun(phase)
-                    new = [T, phase, iterations, err, G]
-                    if results_G_min_1P is None or selection_fun_1P(new, results_G_min_1P):
-                        G_min = G
-                        results_G_min_1P = new
-
-                    solutions_1P.append(new)
-                except Exception as e:
-#                    print(e)
-                    solutions_1P.append(None)
-        except:
-            pass
-
-        if 1:
+        # The multiphase solvers handle one phase results as well; the one
+        # phase solutions of each phase model are normally only computed if
+        # they fail. The strategy which succeeded is reported in flash_convergence.
+        stages = self.TPV_HSGUA_SPEC_STAGES.get((fixed_var, spec), self.TPV_HSGUA_STAGES)
+        statistics = self.statistics
+        if statistics is not None:
+            spec_name = fixed_var + spec
+            region = statistics.region(self.constants, zs, **{fixed_var: fixed_val}) if fixed_var != 'V' else (None, None)
+            stages = statistics.order(spec_name, region, stages)
+        error = None
+        for strategy, maxiter, xtol in stages:
+            if statistics is not None:
+                t0 = perf_counter()
             try:
-                res, flash_convergence = self.solve_PT_HSGUA_NP_guess_bisect(zs, fixed_val, spec_val,
-                                                               fixed_var=fixed_var, spec=spec, iter_var=iter_var)
-                return None, res.phases, [], res.betas, flash_convergence
-            except:
-                g, ls, ss, betas, flash_convergence = self.solve_PT_HSGUA_NP_guess_newton_2P(zs, fixed_val, spec_val,
-                                                                                             fixed_var=fixed_var,
-                                                                                             spec=spec,
-                                                                                             iter_var=iter_var)
-                return g, ls, ss, betas, flash_convergence
-        if 1:
-            g, ls, ss, betas, flash_convergence = self.solve_PT_HSGUA_NP_guess_newton_2P(zs, fixed_val, spec_val,
-                                                           fixed_var=fixed_var, spec=spec, iter_var=iter_var)
+                if strategy == HSGUA_BISECT:
+                    res, flash_convergence = self.solve_PT_HSGUA_NP_guess_bisect(zs, fixed_val, spec_val,
+                                                                   fixed_var=fixed_var, spec=spec, iter_var=iter_var,
+                                                                   hot_start=hot_start, maxiter=maxiter, xtol=xtol)
+                    g, ls, ss, betas = None, res.phases, [], res.betas
+                elif strategy == HSGUA_NEWTON_2P:
+                    g, ls, ss, betas, flash_convergence = self.solve_PT_HSGUA_NP_guess_newton_2P(zs, fixed_val, spec_val,
+                                                                                                 fixed_var=fixed_var,
+                                                                                                 spec=spec,
+                                                                                                 iter_var=iter_var,
+                                                                                                 maxiter=maxiter, xtol=xtol)
+                elif strategy == HSGUA_1P:
+                    g, ls, ss, betas, flash_convergence = self.solve_PT_HSGUA_1P_phases(zs, fixed_val, spec_val,
+                                                                                        fixed_var=fixed_var, spec=spec,
+                                                                                        iter_var=iter_var, fun=fun,
+                                                                                        selection_fun_1P=selection_fun_1P,
+                                                                                        maxiter=maxiter, xtol=xtol)
+                else:
+                    raise ValueError("Unrecognized strategy %s" %(strategy))
+            except Exception as e:
+                if statistics is not None:
+                    statistics.record(spec_name, region, strategy, False, 0, perf_counter() - t0)
+                if error is None or strategy != HSGUA_1P:
+                    # Report the failure of a multiphase solver over that of the one phase solvers
+                    error = e
+                continue
+            if statistics is not None:
+                statistics.record(spec_name, region, strategy, True, flash_convergence.get('iterations', 0),
+                                  perf_counter() - t0)
+            flash_convergence['strategy'] = strategy
             return g, ls, ss, betas, flash_convergence
+        raise error
 
-# Need to return g, ls, ss, betas, flash_convergence
+    def solve_PT_HSGUA_1P_phases(self, zs, fixed_val, spec_val, fixed_var='P',
+                                 spec='H', iter_var='T', fun=None,
+                                 selection_fun_1P=None, maxiter=None, xtol=None):
+        constants, correlations = self.constants, self.correlations
+        solve_kwargs = {}
+        if maxiter is not None:
+            solve_kwargs['maxiter'] = maxiter
+        if xtol is not None:
+            solve_kwargs['xtol'] = xtol
+        results_G_min_1P, gas_G_min_1P = None, False
+        for i, phase in enumerate(self.unique_phases):
+            try:
+                T, P, phase, iterations, err = solve_PTV_HSGUA_1P(phase, zs, fixed_val, spec_val, fixed_var=fixed_var,
+                                                                  spec=spec, iter_var=iter_var, constants=constants,
+                                                                  correlations=correlations, **solve_kwargs)
+            except Exception:
+                continue
+            new = [T, phase, iterations, err, fun(phase)]
+            if results_G_min_1P is None or selection_fun_1P(new, results_G_min_1P):
+                results_G_min_1P, gas_G_min_1P = new, i == 0
+        if results_G_min_1P is None:
+            raise UnconvergedError("No phase could be solved at the specifications")
+        _, phase, iterations, err, _ = results_G_min_1P
+        flash_convergence = {'iterations': iterations, 'err': err}
+        if gas_G_min_1P:
+            return phase, [], [], [1.0], flash_convergence
+        return None, [phase], [], [1.0], flash_convergence
 
     def bounds_PT_HSGUA(self, iter_var='T'):
         if iter_var == 'T':
@@ -6045,7 +8233,8 @@ class FlashVL(Flash):
         return min_bound, max_bound
 
     def solve_PT_HSGUA_NP_guess_newton_2P(self, zs, fixed_val, spec_val,
-                                          fixed_var='P', spec='H', iter_var='T'):
+                                          fixed_var='P', spec='H', iter_var='T',
+                                          maxiter=None, xtol=None):
         phases = self.phases
         constants = self.constants
         correlations = self.correlations
@@ -6069,7 +8258,8 @@ class FlashVL(Flash):
 
         sln = nonlin_spec_NP(guess, fixed_val, spec_val, zs, [xs, ys], [1.0-VF, VF],
                              [self.liquids[0], self.gas], iter_var=iter_var, fixed_var=fixed_var, spec=spec,
-                             maxiter=self.TPV_HSGUA_NEWTON_MAXITER, tol=self.TPV_HSGUA_NEWTON_XTOL,
+                             maxiter=self.TPV_HSGUA_NEWTON_MAXITER if maxiter is None else maxiter,
+                             tol=self.TPV_HSGUA_NEWTON_XTOL if xtol is None else xtol,
                              trivial_solution_tol=1e-5, ref_phase=-1,
                              method=self.TPV_HSGUA_NEWTON_SOLVER,
                              solve_kwargs=None, debug=False,
@@ -6081,7 +8271,8 @@ class FlashVL(Flash):
 
 
     def solve_PT_HSGUA_NP_guess_bisect(self, zs, fixed_val, spec_val,
-                                       fixed_var='P', spec='H', iter_var='T'):
+                                       fixed_var='P', spec='H', iter_var='T',
+                                       hot_start=None, maxiter=None, xtol=None):
         phases = self.phases
         constants = self.constants
         correlations = self.correlations
@@ -6089,6 +8280,13 @@ class FlashVL(Flash):
 
         init_methods = [SHAW_ELEMENTAL, IDEAL_WILSON]
         guess = None
+        if hot_start is not None:
+            # A nearby converged state is a better guess than any model
+            guess = hot_start.value(iter_var)
+            if not (min_bound < guess < max_bound):
+                guess = None
+            else:
+                init_methods = []
 
         for method in init_methods:
             try:
@@ -6121,15 +8319,17 @@ class FlashVL(Flash):
             global iterations
             iterations += 1
             kwargs[iter_var] = iter_val
-            res = self.flash(**kwargs)
+            # Intermediate points are not worth keeping in the flash cache
+            res = self.flash(dest=EquilibriumState, **kwargs)
             err = getattr(res, spec)() - spec_val
             sln[:] = (res, iter_val)
             return err
 
         ytol = abs(spec_val)*self.TPV_HSGUA_BISECT_YTOL
-        sln_val = secant(to_solve, guess, xtol=self.TPV_HSGUA_BISECT_XTOL, ytol=ytol,
+        secant_kwargs = {} if maxiter is None else {'maxiter': maxiter}
+        sln_val = secant(to_solve, guess, xtol=self.TPV_HSGUA_BISECT_XTOL if xtol is None else xtol, ytol=ytol,
                          require_xtol=self.TPV_HSGUA_BISECT_YTOL_ONLY, require_eval=True, bisection=True,
-                         low=min_bound, high=max_bound)
+                         low=min_bound, high=max_bound, **secant_kwargs)
         return sln[0], {'iterations': iterations, 'err': sln[1]}
 
 
@@ -6182,6 +8382,28 @@ class FlashVLN(FlashVL):
     SS_NP_TRIVIAL_TOL : float
         Tolerance at which to quick a three-phase flash because it is
         converging to the trivial solution, [-]
+    SS_NP_ACCELERATION : str or None
+        Dominant eigenvalue acceleration of the sequential substitution for
+        three or more phases; 'DEM' extrapolates along the largest eigenvalue
+        and 'GDEM' along the two largest; None disables it, [-]
+    SS_NP_ACC_FREQUENCY : int
+        Number of sequential substitution iterations between accelerated
+        steps, [-]
+    SS_NP_ACC_DELAY : int
+        Number of sequential substitution iterations before the first
+        accelerated step, [-]
+    NP_NEWTON : bool
+        Whether to converge three or more phase solutions with
+        :obj:`newton_equilibrium_NP`, which switches from sequential
+        substitution to Newton's method with analytical Jacobians; when it
+        does not converge, sequential substitution is used as before and
+        the reason is reported as `NP_newton_abandoned` in
+        `flash_convergence`. Other exceptions are not caught, [-]
+    NP_NEWTON_SWITCH_TOL : float
+        Sequential substitution error at which to switch to Newton's method
+        when :obj:`NP_NEWTON` is set, [-]
+    NP_NEWTON_MAXITER : int
+        Maximum number of Newton iterations when :obj:`NP_NEWTON` is set, [-]
     SS_STAB_AQUEOUS_CHECK : bool
         If True, the first three-phase stability check will be on water (if
         it is present) as it forms a three-phase solution more than any
@@ -6246,6 +8468,14 @@ class FlashVLN(FlashVL):
     SS_NP_TOL = 1e-15
     SS_STAB_AQUEOUS_CHECK = True
 
+    SS_NP_ACCELERATION = 'DEM'
+    SS_NP_ACC_FREQUENCY = 3
+    SS_NP_ACC_DELAY = 2
+
+    NP_NEWTON = True
+    NP_NEWTON_SWITCH_TOL = 1e-7
+    NP_NEWTON_MAXITER = 50
+
     DOUBLE_CHECK_2P = False
 
     SS_NP_STAB_HIGHEST_COMP_DIFF = False
@@ -6387,11 +8617,45 @@ class FlashVLN(FlashVL):
             phases = hot_start.phases
             comps = [i.zs for i in hot_start.phases]
             betas = hot_start.betas
-            slnN = sequential_substitution_NP(T, P, zs, comps, betas, phases,
-                                              maxiter=self.SS_NP_MAXITER, tol=self.SS_NP_TOL,
-                                              trivial_solution_tol=self.SS_NP_TRIVIAL_TOL)
-            return None, slnN[2], [], slnN[0], {'iterations': slnN[3], 'err': slnN[4],
-                                                'stab_guess_name': None}
+            slnN = self.solve_NP(T, P, zs, comps, betas, phases)
+            info = {'iterations': slnN[3], 'err': slnN[4], 'stab_guess_name': None}
+            info.update(slnN[5])
+            return None, slnN[2], [], slnN[0], info
+
+    def solve_NP(self, T, P, zs, compositions, betas, phases, maxiter=None,
+                 tol=None, trivial_solution_tol=None):
+        # Returns betas, compositions, phases, iterations, err, and a dict
+        # of entries for `flash_convergence`
+        maxiter = self.SS_NP_MAXITER if maxiter is None else maxiter
+        tol = self.SS_NP_TOL if tol is None else tol
+        trivial_solution_tol = self.SS_NP_TRIVIAL_TOL if trivial_solution_tol is None else trivial_solution_tol
+        info = {}
+        if self.NP_NEWTON:
+            try:
+                return newton_equilibrium_NP(T, P, zs, compositions, list(betas), phases,
+                                             maxiter=self.NP_NEWTON_MAXITER, tol=tol,
+                                             trivial_solution_tol=trivial_solution_tol,
+                                             ss_maxiter=maxiter, switch_tol=self.NP_NEWTON_SWITCH_TOL,
+                                             acceleration=self.SS_NP_ACCELERATION,
+                                             acc_frequency=self.SS_NP_ACC_FREQUENCY,
+                                             acc_delay=self.SS_NP_ACC_DELAY) + (info,)
+            except (UnconvergedError, TrivialSolutionError, ZeroDivisionError) as e:
+                # Fall back to sequential substitution from the initial guesses
+                info['NP_newton_abandoned'] = str(e)
+        try:
+            return sequential_substitution_NP(T, P, zs, compositions, list(betas), phases,
+                                              maxiter=maxiter, tol=tol,
+                                              trivial_solution_tol=trivial_solution_tol,
+                                              acceleration=self.SS_NP_ACCELERATION,
+                                              acc_frequency=self.SS_NP_ACC_FREQUENCY,
+                                              acc_delay=self.SS_NP_ACC_DELAY) + (info,)
+        except UnconvergedError:
+            if self.SS_NP_ACCELERATION is None:
+                raise
+        # Plain sequential substitution as a last resort
+        return sequential_substitution_NP(T, P, zs, compositions, list(betas), phases,
+                                          maxiter=maxiter, tol=tol,
+                                          trivial_solution_tol=trivial_solution_tol) + (info,)
 
 
     def flash_TP_K_composition_idependent(self, T, P, zs):
@@ -6595,8 +8859,7 @@ class FlashVLN(FlashVL):
             try:
                 failed_3P = False
 
-                sln3 = sequential_substitution_NP(T, P, zs, flash_comps, flash_betas, flash_phases, maxiter=self.SS_NP_MAXITER, tol=self.SS_NP_TOL,
-                               trivial_solution_tol=self.SS_NP_TRIVIAL_TOL)
+                sln3 = self.solve_NP(T, P, zs, flash_comps, flash_betas, flash_phases)
                 if ideal_gas_basis:
                     G_3P = sum([sln3[0][i]*sln3[2][i].G_min_criteria() for i in range(3)])
                 else:
@@ -6609,8 +8872,10 @@ class FlashVLN(FlashVL):
                 if self.max_phases == 3 and good_betas:
                     if G_2P < G_3P:
                         raise ValueError("Should never happen")
-                    return None, sln3[2], [], sln3[0], {'iterations': sln3[3], 'err': sln3[4],
-                                                                   'stab_guess_name': stab_guess_name, 'G_2P': G_2P}
+                    info = {'iterations': sln3[3], 'err': sln3[4],
+                            'stab_guess_name': stab_guess_name, 'G_2P': G_2P}
+                    info.update(sln3[5])
+                    return None, sln3[2], [], sln3[0], info
                 if not good_betas or G_3P > G_2P:
                     # Might need to make this true
                     try_LL_3P_failed = False
@@ -6674,17 +8939,22 @@ class FlashVLN(FlashVL):
                 flash_betas = list(slnN[0])
                 flash_betas.append(0.0)
                 try:
-                    slnN = sequential_substitution_NP(T, P, zs, flash_comps, flash_betas, flash_phases)
+                    slnN = self.solve_NP(T, P, zs, flash_comps, flash_betas, flash_phases,
+                                         maxiter=1000, tol=1E-13, trivial_solution_tol=1e-5)
                     if self.max_phases == len(slnN[0]):
-                        return None, slnN[2], [], slnN[0], {'iterations': slnN[3], 'err': slnN[4],
-                                                                       'stab_guess_name': stab_guess_name, 'G_2P': G_2P}
+                        info = {'iterations': slnN[3], 'err': slnN[4],
+                                'stab_guess_name': stab_guess_name, 'G_2P': G_2P}
+                        info.update(slnN[5])
+                        return None, slnN[2], [], slnN[0], info
                 except:
                     pass
 
             liquid_idx += 1
 
-        return None, slnN[2], [], slnN[0], {'iterations': slnN[3], 'err': slnN[4],
-                                            'stab_guess_name': stab_guess_name, 'G_2P': G_2P}
+        info = {'iterations': slnN[3], 'err': slnN[4],
+                'stab_guess_name': stab_guess_name, 'G_2P': G_2P}
+        info.update(slnN[5])
+        return None, slnN[2], [], slnN[0], info
 
     # Should be straightforward for stability test
     # How handle which phase to stability test? May need both
@@ -6734,6 +9004,597 @@ spec_to_iter_vars_backup =  {(True, False, False, True, False, False) : ('T', 'H
                              (False, False, True, False, False, True) : ('V', 'U', 'T'),
 }
 
+class PureFlashTable(object):
+    r'''Class holding tabulated properties of a pure fluid on a grid of one
+    fixed variable and one specification, as built by
+    :obj:`FlashPureVLS.build_flash_table`, and interpolating them with
+    bicubic splines. Tables of `P` and `H` (with `P` fixed) and of `T` and
+    `P` (with `T` fixed) are supported.
+
+    Below the critical point, each row of the table is split at the
+    saturation curve: one region spans from the lowest specification to the
+    saturated phase at one side of the curve, the other from the saturated
+    phase at the other side to the highest specification, each with the
+    same number of nodes. Where the saturation curve is outside or near the
+    ends of the specification range, the region is extended past that end
+    by 5% of the range. No nodes lie in the two phase region; states there
+    are interpolated from the saturated phases. Above the critical point,
+    rows span the whole specification range. Rows within 1% of the critical
+    point are not tabulated.
+
+    `P` and `V` are interpolated on a log scale, as are `P` coordinates.
+
+    Parameters
+    ----------
+    fixed_var : str
+        Fixed variable of each row of the table; 'P' or 'T', [-]
+    spec : str
+        Specification varying along each row; 'H' when `fixed_var` is 'P',
+        'P' when `fixed_var` is 'T', [-]
+    spec_min : float
+        Lowest specification in the table, [various]
+    spec_max : float
+        Highest specification in the table, [various]
+    sat_rows : list[float]
+        Increasing values of `fixed_var` of the rows below the critical
+        point, [various]
+    sat_liquid : list[list[float]]
+        Each of :obj:`props`, for the saturated liquid of each row below the
+        critical point, [various]
+    sat_gas : list[list[float]]
+        Each of :obj:`props`, for the saturated gas of each row below the
+        critical point, [various]
+    low : list[list[list[float]]]
+        Each of :obj:`props` followed by 1 for a gas or 0 for a liquid, for
+        each row below the critical point and each of the evenly spaced
+        nodes from `spec_min` to the saturation curve (see
+        :obj:`region_bounds`), [various]
+    high : list[list[list[float]]]
+        As `low`, from the saturation curve to `spec_max`, [various]
+    super_rows : list[float]
+        Increasing values of `fixed_var` of the rows above the critical
+        point, [various]
+    supercritical : list[list[list[float]]]
+        As `low`, at each node of the rows above the critical point from
+        `spec_min` to `spec_max`, [various]
+
+    Attributes
+    ----------
+    props : tuple(str)
+        Properties stored at each node, [-]
+    '''
+    props = ('T', 'P', 'V', 'H', 'S')
+    log_props = (False, True, True, False, False)
+
+    def __init__(self, fixed_var, spec, spec_min, spec_max, sat_rows, sat_liquid,
+                 sat_gas, low, high, super_rows, supercritical):
+        from scipy.interpolate import CubicSpline, RectBivariateSpline
+        if (fixed_var, spec) not in (('P', 'H'), ('T', 'P')):
+            raise ValueError("Tables are available for fixed P and H or fixed T and P only")
+        self.fixed_var, self.spec = fixed_var, spec
+        self.spec_min, self.spec_max = spec_min, spec_max
+        self.sat_rows, self.sat_liquid, self.sat_gas = np.array(sat_rows), np.array(sat_liquid), np.array(sat_gas)
+        self.low, self.high = np.array(low), np.array(high)
+        self.super_rows, self.supercritical = np.array(super_rows), np.array(supercritical)
+
+        self.log_fixed = fixed_var == 'P'
+        self.log_spec = spec == 'P'
+        self.spec_idx = self.props.index(spec)
+        # Along rows below the critical point, the liquid is at low H or at high P
+        self.liquid_low = spec == 'H'
+        self.s_min, self.s_max = self._s(spec_min), self._s(spec_max)
+
+        self._sat_liquid = self._sat_gas = None
+        if len(self.sat_rows):
+            fs = self._f(self.sat_rows)
+            self.sat_f_min, self.sat_f_max = fs[0], fs[-1]
+            self._sat_liquid = CubicSpline(fs, self._transform(self.sat_liquid).T,
+                                           bc_type='natural', extrapolate=False)
+            self._sat_gas = CubicSpline(fs, self._transform(self.sat_gas).T,
+                                        bc_type='natural', extrapolate=False)
+            self._low = self._region_splines(fs, self.low, RectBivariateSpline)
+            self._high = self._region_splines(fs, self.high, RectBivariateSpline)
+        self._super = None
+        if len(self.super_rows):
+            fs = self._f(self.super_rows)
+            self.super_f_min, self.super_f_max = fs[0], fs[-1]
+            self._super = self._region_splines(fs, self.supercritical, RectBivariateSpline)
+
+    @staticmethod
+    def region_bounds(s_min, s_max, b_low, b_high):
+        r'''Calculate where the regions of a row below the critical point
+        start and end, given the ends of the specification range and the
+        specifications of the saturated phases. All values are in the
+        interpolation coordinates (`P` in log scale).
+
+        Parameters
+        ----------
+        s_min : float
+            Lowest specification in the table, [various]
+        s_max : float
+            Highest specification in the table, [various]
+        b_low : float
+            Specification of the saturated phase closer to `s_min`, [various]
+        b_high : float
+            Specification of the saturated phase closer to `s_max`, [various]
+
+        Returns
+        -------
+        low_start : float
+            Start of the region ending at `b_low`, [various]
+        high_end : float
+            End of the region starting at `b_high`, [various]
+        '''
+        margin = 0.05*(s_max - s_min)
+        return min(s_min, b_low - margin), max(s_max, b_high + margin)
+
+    def _f(self, fixed_val):
+        return np.log(fixed_val) if self.log_fixed else fixed_val
+
+    def _s(self, spec_val):
+        return log(spec_val) if self.log_spec else spec_val
+
+    def _transform(self, values):
+        values = np.array(values, dtype=float)
+        for i, is_log in enumerate(self.log_props):
+            if is_log:
+                values[i] = np.log(values[i])
+        return values
+
+    def _region_splines(self, fs, nodes, RectBivariateSpline):
+        xs = np.linspace(0.0, 1.0, nodes.shape[2])
+        values = self._transform(nodes[:-1])
+        splines = [RectBivariateSpline(fs, xs, values[i]) for i in range(len(self.props))]
+        # Phase of each node, interpolated linearly and rounded
+        splines.append(RectBivariateSpline(fs, xs, nodes[-1], kx=1, ky=1))
+        return splines
+
+    def _locate(self, fixed_val, spec_val):
+        f, s = self._f(fixed_val), self._s(spec_val)
+        if self._sat_liquid is not None and self.sat_f_min <= f <= self.sat_f_max:
+            liquid, gas = self._sat_liquid(f), self._sat_gas(f)
+            low_sat, high_sat = (liquid, gas) if self.liquid_low else (gas, liquid)
+            b_low, b_high = low_sat[self.spec_idx], high_sat[self.spec_idx]
+            low_start, high_end = self.region_bounds(self.s_min, self.s_max, b_low, b_high)
+            if not (self.s_min <= s <= self.s_max):
+                return None
+            elif s <= b_low:
+                return self._low, f, (s - low_start)/(b_low - low_start), liquid, gas
+            elif b_high <= s:
+                return self._high, f, (s - b_high)/(high_end - b_high), liquid, gas
+            elif b_low < s < b_high:
+                return None, f, (s - b_low)/(b_high - b_low), liquid, gas
+        elif (self._super is not None and self.super_f_min <= f <= self.super_f_max
+              and self.s_min <= s <= self.s_max):
+            return self._super, f, (s - self.s_min)/(self.s_max - self.s_min), None, None
+        return None
+
+    def value(self, fixed_val, spec_val, prop):
+        r'''Interpolate a property of the fluid at a point in the table.
+        In the two phase region, molar properties are averaged by the vapor
+        fraction.
+
+        Parameters
+        ----------
+        fixed_val : float
+            Value of `fixed_var`, [various]
+        spec_val : float
+            Value of `spec`, [various]
+        prop : str
+            One of :obj:`props`, [-]
+
+        Returns
+        -------
+        value : float
+            Interpolated property, [various]
+
+        Notes
+        -----
+        None is returned outside the range of the table.
+        '''
+        loc = self._locate(fixed_val, spec_val)
+        if loc is None:
+            return None
+        splines, f, x, liquid, gas = loc
+        i = self.props.index(prop)
+        is_log = self.log_props[i]
+        if splines is None:
+            v_l, v_g = liquid[i], gas[i]
+            if is_log:
+                v_l, v_g = exp(v_l), exp(v_g)
+            return v_l + x*(v_g - v_l)
+        v = float(splines[i].ev(f, x))
+        return exp(v) if is_log else v
+
+    def state(self, fixed_val, spec_val):
+        r'''Interpolate the temperature, vapor fraction, and molar volumes of
+        the phases present at a point in the table.
+
+        Parameters
+        ----------
+        fixed_val : float
+            Value of `fixed_var`, [various]
+        spec_val : float
+            Value of `spec`, [various]
+
+        Returns
+        -------
+        T : float
+            Temperature, [K]
+        VF : float
+            Molar vapor fraction; 1 for a gas and 0 for a liquid outside
+            the two phase region, [-]
+        V_liquid : float
+            Molar volume of the liquid, or None if there is no liquid,
+            [m^3/mol]
+        V_gas : float
+            Molar volume of the gas, or None if there is no gas, [m^3/mol]
+
+        Notes
+        -----
+        None is returned outside the range of the table.
+        '''
+        loc = self._locate(fixed_val, spec_val)
+        if loc is None:
+            return None
+        splines, f, x, liquid, gas = loc
+        if splines is None:
+            return float(liquid[0]), x, exp(liquid[2]), exp(gas[2])
+        T, V = float(splines[0].ev(f, x)), exp(float(splines[2].ev(f, x)))
+        if float(splines[-1].ev(f, x)) >= 0.5:
+            return T, 1.0, None, V
+        return T, 0.0, V, None
+
+    def save(self, path):
+        r'''Save the table to a .npz file.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file, [-]
+        '''
+        np.savez(path, fixed_var=self.fixed_var, spec=self.spec,
+                 spec_min=self.spec_min, spec_max=self.spec_max,
+                 sat_rows=self.sat_rows, sat_liquid=self.sat_liquid,
+                 sat_gas=self.sat_gas, low=self.low, high=self.high,
+                 super_rows=self.super_rows, supercritical=self.supercritical)
+
+    @classmethod
+    def load(cls, path):
+        r'''Load a table saved by :obj:`save`.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file, [-]
+
+        Returns
+        -------
+        table : :obj:`PureFlashTable`
+            Table, [-]
+        '''
+        with np.load(path) as data:
+            return cls(str(data['fixed_var']), str(data['spec']),
+                       float(data['spec_min']), float(data['spec_max']),
+                       data['sat_rows'], data['sat_liquid'], data['sat_gas'],
+                       data['low'], data['high'], data['super_rows'],
+                       data['supercritical'])
+
+
+def _flash_table_rows(flasher, zs, var0, values0, var1, values1, props):
+    # Flash a chunk of rows of a FlashTable; the flasher of a worker process
+    # created by from_flasher is used when `flasher` is None
+    if flasher is None:
+        flasher = _grid_flash_worker_flasher
+    return [FlashTable.flash_row(flasher, zs, var0, value0, var1, values1, props)
+            for value0 in values0]
+
+
+class FlashTable(object):
+    r'''Class holding tabulated properties of a fixed composition on a
+    rectangular grid of two flash specifications, such as `T` and `P` or
+    `P` and `H`, as generated by :obj:`from_flasher`, and looking them up
+    with bilinear or bicubic interpolation.
+
+    Tables are saved to uncompressed .npz files, whose `data` array can be
+    memory-mapped by :obj:`load` so that large tables are not read into
+    memory.
+
+    Nodes where the flash or a property failed are NaN; bilinear lookups
+    next to them are NaN, and bicubic lookups of that property are not
+    available.
+
+    Parameters
+    ----------
+    var0 : str
+        First specification, varying along the first axis, [-]
+    values0 : list[float]
+        Increasing values of `var0`, [various]
+    var1 : str
+        Second specification, varying along the second axis, [-]
+    values1 : list[float]
+        Increasing values of `var1`, [various]
+    props : list[str]
+        Names of the tabulated properties, [-]
+    data : ndarray
+        Values of each property at each node, with shape
+        (len(props), len(values0), len(values1)), [various]
+    metadata : dict, optional
+        Description of the table, such as the components and composition,
+        [-]
+
+    Attributes
+    ----------
+    default_props : tuple(str)
+        Properties tabulated by default; methods and attributes of
+        :obj:`EquilibriumState <thermo.equilibrium.EquilibriumState>`, with
+        molar `H`, `S` and `Cp`. The phase fractions `beta_gas` and
+        `beta_liquid0`, `beta_liquid1` etc. are also added, [-]
+    '''
+    default_props = ('T', 'P', 'H', 'S', 'rho_mass', 'Cp', 'mu', 'k', 'VF')
+
+    def __init__(self, var0, values0, var1, values1, props, data, metadata=None):
+        self.var0, self.var1 = var0, var1
+        self.values0, self.values1 = np.asarray(values0, dtype=float), np.asarray(values1, dtype=float)
+        self.props = list(props)
+        self.data = data
+        self.metadata = {} if metadata is None else metadata
+        # Pressure axes are interpolated in log
+        self.log0, self.log1 = var0 == 'P', var1 == 'P'
+        self.x0 = np.log(self.values0) if self.log0 else self.values0
+        self.x1 = np.log(self.values1) if self.log1 else self.values1
+        self._splines = {}
+
+    @staticmethod
+    def flash_row(flasher, zs, var0, value0, var1, values1, props):
+        r'''Flash one row of a table, and return the properties at each node.
+
+        Parameters
+        ----------
+        flasher : :obj:`Flash`
+            Flasher, [-]
+        zs : list[float]
+            Mole fractions, [-]
+        var0 : str
+            First specification, [-]
+        value0 : float
+            Value of the first specification, [various]
+        var1 : str
+            Second specification, [-]
+        values1 : list[float]
+            Values of the second specification, [various]
+        props : list[str]
+            Names of the properties, [-]
+
+        Returns
+        -------
+        row : list[list[float]]
+            Value of each property at each node; NaN where the flash or the
+            property failed, [various]
+        '''
+        nan = float('nan')
+        row = [[nan]*len(values1) for _ in props]
+        for j, value1 in enumerate(values1):
+            try:
+                res = flasher.flash(zs=zs, **{var0: value0, var1: value1})
+            except Exception:
+                continue
+            # betas are ordered gas, liquids, solids
+            N_gas = 0 if res.gas is None else 1
+            for i, prop in enumerate(props):
+                try:
+                    if prop == 'beta_gas':
+                        v = res.betas[0] if N_gas else 0.0
+                    elif prop.startswith('beta_liquid'):
+                        k = int(prop[11:])
+                        v = res.betas[N_gas + k] if k < len(res.liquids) else 0.0
+                    else:
+                        v = getattr(res, prop)
+                        if callable(v):
+                            v = v()
+                    row[i][j] = float(v)
+                except Exception:
+                    pass
+        return row
+
+    @classmethod
+    def from_flasher(cls, flasher, zs, var0, values0, var1, values1, props=None,
+                     workers=None, executor=None):
+        r'''Generate a table by flashing every node of a grid of two
+        specifications, optionally in parallel.
+
+        Parameters
+        ----------
+        flasher : :obj:`Flash`
+            Flasher, [-]
+        zs : list[float]
+            Mole fractions, [-]
+        var0 : str
+            First specification, such as 'P', [-]
+        values0 : list[float]
+            Increasing values of `var0`, [various]
+        var1 : str
+            Second specification, such as 'H', [-]
+        values1 : list[float]
+            Increasing values of `var1`, [various]
+        props : list[str], optional
+            Names of the properties to tabulate; :obj:`default_props` and the
+            fractions of the gas and each liquid of the flasher by default, [-]
+        workers : int, optional
+            Number of processes to split the rows of the table between; when
+            None or 1 and no `executor` is given, the table is flashed
+            serially in this process, [-]
+        executor : :obj:`concurrent.futures.Executor`, optional
+            An existing process based executor to distribute the rows of the
+            table to; it is not shut down afterwards, [-]
+
+        Returns
+        -------
+        table : :obj:`FlashTable`
+            Table, [-]
+
+        Notes
+        -----
+        Rows are distributed the same way as in
+        :obj:`Flash.grid_flash <thermo.flash.Flash.grid_flash>`; see its
+        notes for how the flasher is sent to the workers.
+        '''
+        if props is None:
+            props = list(cls.default_props) + ['beta_gas']
+            props += ['beta_liquid%d' %(i) for i in range(len(flasher.liquids))]
+        values0, values1 = [float(v) for v in values0], [float(v) for v in values1]
+        if executor is None and (workers is None or workers <= 1):
+            rows = _flash_table_rows(flasher, zs, var0, values0, var1, values1, props)
+        else:
+            own_executor = executor is None
+            if own_executor:
+                from concurrent.futures import ProcessPoolExecutor
+                executor = ProcessPoolExecutor(max_workers=workers,
+                                               initializer=_grid_flash_worker_init,
+                                               initargs=(flasher,))
+                chunk_count = 4*workers
+                chunk_flasher = None
+            else:
+                _grid_flash_check_executor(executor)
+                chunk_count = workers if workers is not None else getattr(executor, '_max_workers', 1)
+                chunk_flasher = flasher
+            N0 = len(values0)
+            chunk_count = max(1, min(chunk_count, N0))
+            bounds = [N0*i//chunk_count for i in range(chunk_count+1)]
+            try:
+                futures = [executor.submit(_flash_table_rows, chunk_flasher, zs, var0,
+                                           values0[bounds[i]:bounds[i+1]], var1, values1, props)
+                           for i in range(chunk_count)]
+                rows = [row for f in futures for row in f.result()]
+            finally:
+                if own_executor:
+                    executor.shutdown()
+        data = np.array(rows).transpose(1, 0, 2)
+        constants = flasher.constants
+        metadata = {'zs': list(zs), 'CASs': constants.CASs, 'names': constants.names,
+                    'flasher': type(flasher).__name__,
+                    'phases': [type(phase).__name__ for phase in flasher.phases]}
+        return cls(var0, values0, var1, values1, props, data, metadata)
+
+    def _coordinates(self, value0, value1):
+        x0 = np.log(value0) if self.log0 else np.asarray(value0, dtype=float)
+        x1 = np.log(value1) if self.log1 else np.asarray(value1, dtype=float)
+        return x0, x1
+
+    def value(self, prop, value0, value1, method='linear'):
+        r'''Look up a property in the table. The values of the specifications
+        may be arrays of the same shape, to look up many states at once.
+
+        Parameters
+        ----------
+        prop : str
+            Name of the property, [-]
+        value0 : float or ndarray
+            Value of the first specification, [various]
+        value1 : float or ndarray
+            Value of the second specification, [various]
+        method : str, optional
+            'linear' for bilinear interpolation or 'cubic' for bicubic spline
+            interpolation, [-]
+
+        Returns
+        -------
+        value : float or ndarray
+            Value of the property; NaN outside the table, [various]
+        '''
+        x0, x1 = self._coordinates(value0, value1)
+        scalar = x0.ndim == 0 and x1.ndim == 0
+        x0, x1 = np.atleast_1d(x0), np.atleast_1d(x1)
+        axis0, axis1 = self.x0, self.x1
+        outside = (x0 < axis0[0]) | (x0 > axis0[-1]) | (x1 < axis1[0]) | (x1 > axis1[-1])
+        if method == 'linear':
+            values = self.data[self.props.index(prop)]
+            i = np.clip(np.searchsorted(axis0, x0) - 1, 0, len(axis0) - 2)
+            j = np.clip(np.searchsorted(axis1, x1) - 1, 0, len(axis1) - 2)
+            t = (x0 - axis0[i])/(axis0[i+1] - axis0[i])
+            u = (x1 - axis1[j])/(axis1[j+1] - axis1[j])
+            ans = ((1.0 - t)*(1.0 - u)*values[i, j] + t*(1.0 - u)*values[i+1, j]
+                   + (1.0 - t)*u*values[i, j+1] + t*u*values[i+1, j+1])
+        elif method == 'cubic':
+            try:
+                spline = self._splines[prop]
+            except KeyError:
+                from scipy.interpolate import RectBivariateSpline
+                values = np.asarray(self.data[self.props.index(prop)])
+                if np.isnan(values).any():
+                    raise ValueError("The table of %s has failed nodes; use linear interpolation" %(prop))
+                spline = self._splines[prop] = RectBivariateSpline(axis0, axis1, values)
+            ans = spline(x0, x1, grid=False)
+        else:
+            raise ValueError("Unrecognized method")
+        ans = np.where(outside, np.nan, ans)
+        return float(ans[0]) if scalar else ans
+
+    def save(self, path):
+        r'''Save the table to an uncompressed .npz file, with the metadata
+        stored as JSON.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file, [-]
+        '''
+        np.savez(path, data=np.ascontiguousarray(self.data), values0=self.values0,
+                 values1=self.values1, var0=self.var0, var1=self.var1,
+                 props=np.array(self.props), metadata=json.dumps(self.metadata))
+
+    @classmethod
+    def load(cls, path, mmap=False):
+        r'''Load a table saved by :obj:`save`.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file, [-]
+        mmap : bool, optional
+            Whether to memory-map the tabulated data instead of reading it, [-]
+
+        Returns
+        -------
+        table : :obj:`FlashTable`
+            Table, [-]
+        '''
+        with np.load(path) as f:
+            var0, var1 = str(f['var0']), str(f['var1'])
+            values0, values1 = f['values0'], f['values1']
+            props = [str(v) for v in f['props']]
+            metadata = json.loads(str(f['metadata']))
+            if not mmap:
+                data = f['data']
+        if mmap:
+            data = cls._memmap_npz_member(path, 'data.npy')
+        return cls(var0, values0, var1, values1, props, data, metadata)
+
+    @staticmethod
+    def _memmap_npz_member(path, name):
+        # Members of uncompressed .npz files are stored as-is, so the array
+        # data can be mapped at its offset in the file
+        import zipfile
+        import struct
+        with zipfile.ZipFile(path) as archive:
+            info = archive.getinfo(name)
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError("Compressed tables cannot be memory-mapped")
+        with open(path, 'rb') as f:
+            f.seek(info.header_offset)
+            header = f.read(30)
+            name_length, extra_length = struct.unpack('<HH', header[26:30])
+            f.seek(info.header_offset + 30 + name_length + extra_length)
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+            offset = f.tell()
+        return np.memmap(path, dtype=dtype, mode='r', shape=shape, offset=offset,
+                         order='F' if fortran_order else 'C')
+
+
 class FlashPureVLS(Flash):
     r'''Class for performing flash calculations on pure-component systems.
     This class is subtantially more robust than using multicomponent algorithms
@@ -6834,6 +9695,10 @@ class FlashPureVLS(Flash):
     PSF_xtol : float
         Convergence tolerance in the pressure dimension when converging a
         flashes with a pressure and solid fraction specification, [-]
+    flash_tables : dict[tuple(str, str), :obj:`PureFlashTable`]
+        Tables built by :obj:`build_flash_table` or loaded by
+        :obj:`load_flash_table`, by their fixed variable and specification;
+        `P`-`H` flashes inside a table are interpolated from it, [-]
 
 
     Notes
@@ -6924,6 +9789,8 @@ class FlashPureVLS(Flash):
     PSF_maxiter = 200
     PSF_xtol = 1e-10
 
+    flash_tables = None
+
     def __repr__(self):
         return "FlashPureVLS(gas=%s, liquids=%s, solids=%s)" %(self.gas, self.liquids, self.solids)
     def __init__(self, constants, correlations, gas, liquids, solids,
@@ -7341,6 +10208,10 @@ class FlashPureVLS(Flash):
                         selection_fun_1P=None, hot_start=None):
         # Be prepared to have a flag here to handle zero flow
         zs = [1.0]
+        if self.flash_tables is not None and solution is None and hot_start is None:
+            sln = self.flash_table(fixed_var, spec, fixed_var_val, spec_val)
+            if sln is not None:
+                return sln
         constants, correlations = self.constants, self.correlations
         if solution is None:
             if fixed_var == 'P' and spec == 'H':
@@ -7727,6 +10598,196 @@ class FlashPureVLS(Flash):
 
 
 
+    def build_flash_table(self, fixed_var='P', spec='H', fixed_min=None,
+                          fixed_max=None, spec_min=None, spec_max=None,
+                          fixed_pts=30, spec_pts=30):
+        r'''Method to tabulate the fluid on a grid of `fixed_var` and `spec`
+        as a :obj:`PureFlashTable`, and store it in :obj:`flash_tables`.
+
+        Afterwards, `P`-`H` flashes inside the table are interpolated
+        instead of solved. `T`-`P` flashes do not iterate to begin with and
+        are not affected; `T`-`P` tables are for
+        :obj:`PureFlashTable.value` lookups. Single phase results are
+        created at the interpolated temperature and the specified pressure,
+        so with `P` and `H` specified, the enthalpy of the result matches to
+        within the interpolation error only; if the volume of the phase
+        does not match the interpolated volume to 10%, as when the phase is
+        very close to the saturation curve, the flash is solved instead.
+        The phases of two phase results are created from the interpolated
+        saturation temperature and saturated phase volumes.
+
+        Each node of the table is a full flash; tables of fine grids can be
+        saved with :obj:`PureFlashTable.save` and loaded with
+        :obj:`load_flash_table`.
+
+        Parameters
+        ----------
+        fixed_var : str, optional
+            Fixed variable of each row of the table; 'P' or 'T', [-]
+        spec : str, optional
+            Specification varying along each row; 'H' when `fixed_var` is
+            'P', 'P' when `fixed_var` is 'T', [-]
+        fixed_min : float
+            Lowest value of `fixed_var`, [various]
+        fixed_max : float
+            Highest value of `fixed_var`, [various]
+        spec_min : float
+            Lowest value of `spec`, [various]
+        spec_max : float
+            Highest value of `spec`, [various]
+        fixed_pts : int, optional
+            Number of rows below and above the critical point each, [-]
+        spec_pts : int, optional
+            Number of nodes along each region of each row, [-]
+
+        Returns
+        -------
+        table : :obj:`PureFlashTable`
+            Table, [-]
+        '''
+        if not self.VL_only:
+            raise ValueError("Tables require one gas and one liquid phase and no solids")
+        if (fixed_var, spec) not in (('P', 'H'), ('T', 'P')):
+            raise ValueError("Tables are available for fixed P and H or fixed T and P only")
+        if None in (fixed_min, fixed_max, spec_min, spec_max):
+            raise ValueError("The range of the table must be specified")
+        if fixed_pts < 4 or spec_pts < 4:
+            raise ValueError("Bicubic interpolation needs at least 4 points in each direction")
+        props = PureFlashTable.props
+        zs = [1.0]
+        log_fixed, log_spec = fixed_var == 'P', spec == 'P'
+        spec_idx = props.index(spec)
+        crit = self.constants.Pcs[0] if log_fixed else self.constants.Tcs[0]
+
+        def rows(low, high):
+            if log_fixed:
+                return logspace(log10(low), log10(high), fixed_pts)
+            return linspace(low, high, fixed_pts)
+
+        def to_coord(v):
+            return log(v) if log_spec else v
+
+        def spec_nodes(low, high):
+            if log_spec:
+                return [exp(v) for v in linspace(low, high, spec_pts)]
+            return linspace(low, high, spec_pts)
+
+        def row_nodes(fixed_val, spec_vals):
+            values, prev = [], None
+            for spec_val in spec_vals:
+                kwargs = {fixed_var: fixed_val, spec: spec_val}
+                try:
+                    res = self.flash(zs=zs, **kwargs)
+                    values.append([res.value(k) for k in props] + [1.0 if res.gas is not None else 0.0])
+                    prev = res
+                except Exception:
+                    # Near the critical point, solve the phase of the previous
+                    # node starting from its temperature
+                    if prev is None or spec != 'H':
+                        raise
+                    phase = prev.gas if prev.gas is not None else prev.liquid0
+                    _, _, phase, _, _ = solve_PTV_HSGUA_1P(phase, zs, fixed_val, spec_val, fixed_var='P',
+                                                           spec='H', iter_var='T', constants=self.constants,
+                                                           correlations=self.correlations, last_conv=prev.T,
+                                                           maxiter=self.TPV_HSGUA_maxiter, xtol=self.TPV_HSGUA_xtol)
+                    values.append([phase.value(k) for k in props] + [1.0 if prev.gas is not None else 0.0])
+            return values
+
+        def transpose(region):
+            # [row][node][prop] to [prop][row][node]
+            return [[[region[j][k][i] for k in range(spec_pts)] for j in range(len(region))]
+                    for i in range(len(props) + 1)]
+
+        sat_rows = rows(fixed_min, min(fixed_max, 0.99*crit)) if fixed_min < 0.99*crit else []
+        sat_liquid, sat_gas, low, high = [], [], [], []
+        for fixed_val in sat_rows:
+            if log_fixed:
+                _, liquid, gas, _, _ = self.flash_PVF(fixed_val, VF=.5, zs=zs)
+            else:
+                _, liquid, gas, _, _ = self.flash_TVF(fixed_val, VF=.5, zs=zs)
+            liquid_vals = [liquid.value(k) for k in props]
+            gas_vals = [gas.value(k) for k in props]
+            sat_liquid.append(liquid_vals)
+            sat_gas.append(gas_vals)
+            if log_fixed:
+                low_sat, high_sat = liquid_vals + [0.0], gas_vals + [1.0]
+            else:
+                low_sat, high_sat = gas_vals + [1.0], liquid_vals + [0.0]
+            b_low, b_high = to_coord(low_sat[spec_idx]), to_coord(high_sat[spec_idx])
+            low_start, high_end = PureFlashTable.region_bounds(to_coord(spec_min), to_coord(spec_max),
+                                                               b_low, b_high)
+            low.append(row_nodes(fixed_val, spec_nodes(low_start, b_low)[:-1]) + [low_sat])
+            high.append([high_sat] + row_nodes(fixed_val, spec_nodes(b_high, high_end)[1:]))
+
+        super_rows = rows(max(fixed_min, 1.01*crit), fixed_max) if fixed_max > 1.01*crit else []
+        supercritical = [row_nodes(fixed_val, spec_nodes(to_coord(spec_min), to_coord(spec_max)))
+                         for fixed_val in super_rows]
+
+        empty = [[] for _ in range(len(props) + 1)]
+        table = PureFlashTable(fixed_var, spec, spec_min, spec_max, sat_rows,
+                               [[row[i] for row in sat_liquid] for i in range(len(props))],
+                               [[row[i] for row in sat_gas] for i in range(len(props))],
+                               transpose(low) if low else empty,
+                               transpose(high) if high else empty,
+                               super_rows, transpose(supercritical) if supercritical else empty)
+        if self.flash_tables is None:
+            self.flash_tables = {}
+        self.flash_tables[(fixed_var, spec)] = table
+        return table
+
+    def load_flash_table(self, path):
+        r'''Method to load a :obj:`PureFlashTable` saved with
+        :obj:`PureFlashTable.save`, check it was generated with the same
+        model as this flasher, and store it in :obj:`flash_tables`.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file, [-]
+
+        Returns
+        -------
+        table : :obj:`PureFlashTable`
+            Table, [-]
+        '''
+        table = PureFlashTable.load(path)
+        nodes = table.low if len(table.sat_rows) else table.supercritical
+        T, P, V, H = [nodes[table.props.index(k)][0][0] for k in ('T', 'P', 'V', 'H')]
+        phase = self.gas.to(T=T, V=V, zs=[1.0])
+        if not (isclose(phase.P, P, rel_tol=1e-7) and isclose(phase.H(), H, rel_tol=1e-7)):
+            raise ValueError("Table was generated with a different model")
+        if self.flash_tables is None:
+            self.flash_tables = {}
+        self.flash_tables[(table.fixed_var, table.spec)] = table
+        return table
+
+    def flash_table(self, fixed_var, spec, fixed_val, spec_val):
+        table = self.flash_tables.get((fixed_var, spec))
+        if table is None:
+            return None
+        state = table.state(fixed_val, spec_val)
+        if state is None:
+            return None
+        T, VF, V_liquid, V_gas = state
+        zs = [1.0]
+        if V_liquid is not None and V_gas is not None:
+            gas = self.gas.to(T=T, V=V_gas, zs=zs)
+            liquid = self.liquid.to(T=T, V=V_liquid, zs=zs)
+            return gas, [liquid], [], [VF, 1.0 - VF], {'table': True}
+        if fixed_var == 'T':
+            T, P = fixed_val, spec_val
+        else:
+            P = fixed_val
+        if V_gas is not None:
+            phase, V = self.gas.to(T=T, P=P, zs=zs), V_gas
+        else:
+            phase, V = self.liquid.to(T=T, P=P, zs=zs), V_liquid
+        if abs(phase.V() - V) > 0.1*V:
+            return None
+        if V_gas is not None:
+            return phase, [], [], [1.0], {'table': True}
+        return None, [phase], [], [1.0], {'table': True}
+
     def flash_VF_HSGUA(self, fixed_var_val, spec_val, fixed_var='VF', spec_var='H', zs=None,
                        hot_start=None, solution='high'):
         # solution at high T by default
@@ -8053,3 +11114,471 @@ class FlashPureVLS(Flash):
     # For one phase - solve each phase for H, if there is a solution.
     # Take the one with lowest Gibbs energy
 
+
+class FlashTracker(object):
+    r'''Class to repeatedly flash a set of slowly changing states, as in a
+    dynamic simulation where every vessel is flashed once per time step.
+    The last converged state of each tracked object is kept; the next
+    flash of that object is predicted from it with first-order derivatives
+    and polished with a few Newton iterations, instead of performing the
+    whole flash.
+
+    Flashes with one of `T`, `P` or `V` and one of `H`, `S`, `U`, `G` or `A`
+    specified are tracked. Single phase states are polished with
+    :obj:`TPV_solve_HSGUA_1P`; two phase states of a
+    :obj:`FlashVL` or :obj:`FlashVLN` with `T` or `P` specified are
+    polished with :obj:`nonlin_spec_NP`. Whenever the number of phases may
+    have changed, the polishing fails, the composition has changed more than
+    `zs_tol`, or the specifications cannot be tracked, the wrapped
+    flasher is used with the previous state as a hot start. Each tracked
+    single phase result is checked for a new phase appearing by comparing it
+    with the other phase models of the wrapped flasher at the same
+    temperature, pressure and composition, with a Michelsen stability test
+    for mixtures.
+
+    The previous state need not have been flashed with the same kind of
+    specifications; a state may be stored in :obj:`states` directly, for
+    example to track `V` and `U` flashes starting from a `TP` flash.
+
+    Parameters
+    ----------
+    flasher : :obj:`Flash`
+        Flasher to track states with, [-]
+    check_stability : bool, optional
+        Whether or not to also confirm each tracked result with a `TP` flash
+        of the wrapped flasher at the polished temperature and pressure. This
+        costs a full flash every step, so it is off by default; without it,
+        only the stability test of single phase results and the
+        disappearance of a phase of a two phase state are checked, [-]
+    zs_tol : float, optional
+        Largest change in any mole fraction from the previous state at which
+        the state is still tracked, [-]
+    maxiter : int, optional
+        Maximum number of Newton iterations to polish a tracked state, [-]
+
+    Attributes
+    ----------
+    states : dict[hashable : :obj:`EquilibriumState <thermo.equilibrium.EquilibriumState>`]
+        Last converged state of each tracked object, [-]
+    tracked_count : int
+        Number of flashes solved by tracking, [-]
+    full_count : int
+        Number of flashes solved with the wrapped flasher, [-]
+
+    Examples
+    --------
+    >>> from thermo import ChemicalConstantsPackage, PropertyCorrelationsPackage, HeatCapacityGas, CEOSGas, CEOSLiquid, PRMIX, FlashVL, FlashTracker
+    >>> constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0], omegas=[0.098, 0.251], MWs=[30.06904, 72.14878], CASs=['74-84-0', '109-66-0'])
+    >>> correlations = PropertyCorrelationsPackage(constants, skip_missing=True, HeatCapacityGases=[HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.1e-21, -3.3e-17, 6.6e-14, -7.2e-11, 4.5e-08, -1.5e-05, 0.0023, -0.08, 34.])), HeatCapacityGas(poly_fit=(200.0, 1000.0, [7.5e-20, -3.7e-16, 7.7e-13, -8.9e-10, 6.2e-07, -2.6e-04, 0.061, -6.9, 455.]))])
+    >>> eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    >>> gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases)
+    >>> liquid = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases)
+    >>> tracker = FlashTracker(FlashVL(constants, correlations, liquid=liquid, gas=gas))
+    >>> for H in (-20000.0, -19990.0, -19980.0):
+    ...     res = tracker.flash('drum', P=1e6, H=H, zs=[0.5, 0.5])
+    >>> round(res.H(), 6), tracker.tracked_count, tracker.full_count
+    (-19980.0, 2, 1)
+    '''
+    tracked_specs = ('H', 'S', 'U', 'G', 'A')
+    fixed_specs = ('T', 'P', 'V')
+
+    def __init__(self, flasher, check_stability=False, zs_tol=1e-3, maxiter=20):
+        self.flasher = flasher
+        self.check_stability = check_stability
+        self.zs_tol = zs_tol
+        self.maxiter = maxiter
+        self.states = {}
+        self.tracked_count = 0
+        self.full_count = 0
+
+    def forget(self, key):
+        r'''Method to drop the stored state of a tracked object, so its next
+        flash is done by the wrapped flasher.
+
+        Parameters
+        ----------
+        key : hashable
+            Identifier of the tracked object, [-]
+        '''
+        self.states.pop(key, None)
+
+    def flash(self, key, zs=None, **specs):
+        r'''Method to flash a tracked object, using its previous state when
+        possible.
+
+        Parameters
+        ----------
+        key : hashable
+            Identifier of the tracked object, [-]
+        zs : list[float], optional
+            Mole fractions of each component, [-]
+        specs : float
+            Two specifications accepted by :obj:`Flash.flash`, [various]
+
+        Returns
+        -------
+        res : :obj:`EquilibriumState <thermo.equilibrium.EquilibriumState>`
+            Flash result, [-]
+        '''
+        flasher = self.flasher
+        if zs is None:
+            zs = [1.0]
+        prev = self.states.get(key)
+        res = None
+        if prev is not None:
+            try:
+                res = self._track(prev, zs, specs)
+            except Exception:
+                res = None
+        if res is None:
+            res = flasher.flash(zs=zs, hot_start=prev, **specs)
+            self.full_count += 1
+        else:
+            self.tracked_count += 1
+        self.states[key] = res
+        return res
+
+    def _track(self, prev, zs, specs):
+        if len(specs) != 2:
+            return None
+        fixed_var = spec = None
+        for k in specs:
+            if k in self.fixed_specs:
+                fixed_var = k
+            elif k in self.tracked_specs:
+                spec = k
+        if fixed_var is None or spec is None:
+            return None
+        if max([abs(zi - zj) for zi, zj in zip(zs, prev.zs)]) > self.zs_tol:
+            return None
+        fixed_val, spec_val = specs[fixed_var], specs[spec]
+        iter_var = 'T' if fixed_var != 'T' else 'P'
+
+        # First order prediction of the iteration variable; composition
+        # changes are left to the Newton polishing
+        src = prev.phases[0] if prev.phase_count == 1 else prev
+        d_iter = getattr(src, 'd%s_d%s_%s' %(spec, iter_var, fixed_var))()
+        d_fixed = getattr(src, 'd%s_d%s_%s' %(spec, fixed_var, iter_var))()
+        fixed_prev = src.V() if fixed_var == 'V' else getattr(src, fixed_var)
+        guess = getattr(src, iter_var) + (spec_val - getattr(src, spec)() - d_fixed*(fixed_val - fixed_prev))/d_iter
+
+        flasher = self.flasher
+        if prev.phase_count == 1:
+            iter_val, phase, iterations, err = TPV_solve_HSGUA_1P(zs, prev.phases[0], guess, fixed_val, spec_val,
+                                                                 iter_var=iter_var, fixed_var=fixed_var, spec=spec,
+                                                                 maxiter=self.maxiter, xtol=1e-10, ytol=1e-6,
+                                                                 fprime=True)
+            if not self.check_stability and not self._stable_1P(prev, phase, zs):
+                return None
+            phases, betas = [phase], [1.0]
+        elif prev.phase_count == 2 and fixed_var != 'V' and hasattr(flasher, 'TPV_HSGUA_NEWTON_SOLVER'):
+            sln = nonlin_spec_NP(guess, fixed_val, spec_val, zs, [p.zs for p in prev.phases],
+                                 list(prev.betas), prev.phases, iter_var=iter_var, fixed_var=fixed_var,
+                                 spec=spec, maxiter=self.maxiter, tol=flasher.TPV_HSGUA_NEWTON_XTOL,
+                                 trivial_solution_tol=1e-5, ref_phase=-1,
+                                 method=flasher.TPV_HSGUA_NEWTON_SOLVER,
+                                 analytical_jac=flasher.HSGUA_NEWTON_ANALYTICAL_JAC)
+            iter_val, betas, compositions, phases, err, _, iterations = sln
+            for beta in betas:
+                if beta <= 0.0 or beta >= 1.0:
+                    # A phase is disappearing
+                    return None
+        else:
+            return None
+
+        T, P = phases[0].T, phases[0].P
+        flash_specs = {'zs': zs}
+        flash_specs.update(specs)
+        flash_convergence = {'iterations': iterations, 'err': err, 'tracked': True}
+        if self.check_stability:
+            check = flasher.flash(T=T, P=P, zs=zs)
+            if check.phase_count != len(phases):
+                return None
+            if len(phases) == 1:
+                # Use the identification of the full flash
+                return EquilibriumState(T, P, zs, gas=check.gas, liquids=check.liquids, solids=check.solids,
+                                        betas=check.betas, flash_specs=flash_specs,
+                                        flash_convergence=flash_convergence,
+                                        constants=flasher.constants, correlations=flasher.correlations,
+                                        flasher=flasher)
+        # Phases keep the roles they had in the previous state, which is
+        # ordered gas, liquids, solids
+        N_gas = 0 if prev.gas is None else 1
+        N_liq = len(prev.liquids)
+        gas = phases[0] if N_gas else None
+        liquids = phases[N_gas:N_gas+N_liq]
+        solids = phases[N_gas+N_liq:]
+        return EquilibriumState(T, P, zs, gas=gas, liquids=liquids, solids=solids, betas=betas,
+                                flash_specs=flash_specs, flash_convergence=flash_convergence,
+                                constants=flasher.constants, correlations=flasher.correlations,
+                                flasher=flasher)
+
+    def _stable_1P(self, prev, phase, zs):
+        # The other phase models the wrapped flasher would consider; a single
+        # liquid is also tested against the liquid models for a second liquid
+        flasher = self.flasher
+        gas = getattr(flasher, 'gas', None)
+        liquids = list(getattr(flasher, 'liquids', None) or ())
+        solids = list(getattr(flasher, 'solids', None) or ())
+        if prev.gas is not None:
+            others = liquids + solids
+        elif prev.liquids:
+            others = ([gas] if gas is not None else []) + (liquids if len(liquids) > 1 else []) + solids
+        else:
+            others = ([gas] if gas is not None else []) + liquids
+        T, P = phase.T, phase.P
+        ideal_gas_basis = getattr(flasher, 'ideal_gas_basis', False)
+        G = phase.G_dep() if ideal_gas_basis else phase.G()
+        G_tol = 1e-9*R*T
+        stability_test = getattr(flasher, 'stability_test_Michelsen', None)
+        for model in others:
+            other = model.to(T=T, P=P, zs=zs)
+            G_other = other.G_dep() if ideal_gas_basis else other.G()
+            if G_other < G - G_tol:
+                return False
+            if (stability_test is not None and flasher.N > 1 and not other.is_solid
+                    and not stability_test(T, P, zs, phase, other)[0]):
+                return False
+        return True
+
+
+# The methods are patched once for all active profilers, by the first one
+# entered, and restored by the last one to exit; each profiler records the
+# calls made by the thread which entered it
+_flash_profiler_lock = threading.Lock()
+_flash_profiler_local = threading.local()
+_flash_profiler_count = 0
+_flash_profiler_originals = []
+
+def _flash_profiler_wrap(func, name):
+    is_flash = name == 'Flash.flash'
+    def profiled(*args, **kwargs):
+        profilers = getattr(_flash_profiler_local, 'active', None)
+        if not profilers:
+            return func(*args, **kwargs)
+        profilers = tuple(profilers)
+        outer_flashes = [p._push(name) for p in profilers]
+        t0 = perf_counter()
+        try:
+            res = func(*args, **kwargs)
+        finally:
+            elapsed = perf_counter() - t0
+            for p in profilers:
+                p._pop(elapsed)
+        if is_flash and any(outer_flashes):
+            specs = {k: v for k, v in kwargs.items() if v is not None and k != 'zs'}
+            convergence = getattr(res, 'flash_convergence', None) or {}
+            for p, outer_flash in zip(profilers, outer_flashes):
+                if outer_flash:
+                    p.flashes.append({'specs': specs.copy(), 'time': elapsed,
+                                      'iterations': convergence.get('iterations'),
+                                      'err': convergence.get('err')})
+        return res
+    return profiled
+
+def _flash_profiler_patch():
+    from thermo.eos import GCEOS
+    from thermo.bulk import Bulk
+    targets = []
+    for classes, names in ((FlashProfiler._subclasses(Flash), FlashProfiler.flash_methods),
+                           (FlashProfiler._subclasses(Phase), FlashProfiler.phase_methods),
+                           (FlashProfiler._subclasses(GCEOS), FlashProfiler.eos_methods),
+                           ([EquilibriumState, Bulk], ('__init__',))):
+        for cls in classes:
+            for name in names:
+                if name in cls.__dict__:
+                    targets.append((cls, name))
+    for cls, name in targets:
+        original = cls.__dict__[name]
+        if getattr(original, 'state_attr', None) is not None:
+            # Methods decorated with memoize_state are found by their
+            # attributes; wrapping them would hide their cached values
+            continue
+        label = cls.__name__ + '.' + name
+        if isinstance(original, staticmethod):
+            wrapped = staticmethod(_flash_profiler_wrap(original.__func__, label))
+        else:
+            wrapped = _flash_profiler_wrap(original, label)
+        _flash_profiler_originals.append((cls, name, original))
+        setattr(cls, name, wrapped)
+    module = globals()
+    _flash_profiler_originals.append((None, 'identify_sort_phases', module['identify_sort_phases']))
+    module['identify_sort_phases'] = _flash_profiler_wrap(module['identify_sort_phases'], 'identify_sort_phases')
+
+def _flash_profiler_restore():
+    module = globals()
+    for cls, name, original in reversed(_flash_profiler_originals):
+        if cls is None:
+            module[name] = original
+        else:
+            setattr(cls, name, original)
+    del _flash_profiler_originals[:]
+
+
+class FlashProfiler(object):
+    r'''Context manager to profile flashes. While it is active, the main
+    steps of the flashers, the phase methods most often called by them, the
+    volume root solvers of the cubic equations of state, and the
+    construction of the :obj:`EquilibriumState <thermo.equilibrium.EquilibriumState>`
+    and :obj:`Bulk <thermo.bulk.Bulk>` results are timed; the time spent in
+    each nested call stack is recorded, and the iterations of each flash.
+
+    The methods are only wrapped while a profiler is active, and restored
+    when the last active profiler exits; there is no cost when no profiler
+    is in use. The wrapped methods are those named in :obj:`flash_methods`
+    of each :obj:`Flash` class, in :obj:`phase_methods` of each
+    :obj:`Phase <thermo.phases.Phase>` class, and in :obj:`eos_methods`
+    of each :obj:`GCEOS <thermo.eos.GCEOS>` class which defines them,
+    except methods decorated with :obj:`memoize_state <thermo.phases.memoize_state>`.
+
+    Profilers may be nested, and used in several threads at once; each one
+    records the calls made by the thread it was entered in.
+
+    Attributes
+    ----------
+    flash_methods : tuple(str)
+        Names of the flasher methods to time, [-]
+    phase_methods : tuple(str)
+        Names of the phase methods to time, [-]
+    eos_methods : tuple(str)
+        Names of the equation of state methods to time, [-]
+    stacks : dict[tuple(str), list[int, float]]
+        Number of calls and time in seconds spent in each call stack,
+        excluding the time spent in the calls made from it, [-]
+    flashes : list[dict]
+        Specifications, time in seconds, iterations, and convergence error
+        of each flash made while the profiler was active; flashes made by
+        another flash are not included, [-]
+
+    Examples
+    --------
+    >>> from thermo import ChemicalConstantsPackage, PropertyCorrelationsPackage, HeatCapacityGas, CEOSGas, CEOSLiquid, PRMIX, FlashVL, FlashProfiler
+    >>> constants = ChemicalConstantsPackage(Tcs=[305.32, 469.7], Pcs=[4872000.0, 3370000.0], omegas=[0.098, 0.251], MWs=[30.06904, 72.14878], CASs=['74-84-0', '109-66-0'])
+    >>> correlations = PropertyCorrelationsPackage(constants, skip_missing=True, HeatCapacityGases=[HeatCapacityGas(poly_fit=(50.0, 1000.0, [7.1e-21, -3.3e-17, 6.6e-14, -7.2e-11, 4.5e-08, -1.5e-05, 0.0023, -0.08, 34.])), HeatCapacityGas(poly_fit=(200.0, 1000.0, [7.5e-20, -3.7e-16, 7.7e-13, -8.9e-10, 6.2e-07, -2.6e-04, 0.061, -6.9, 455.]))])
+    >>> eos_kwargs = dict(Tcs=constants.Tcs, Pcs=constants.Pcs, omegas=constants.omegas)
+    >>> gas = CEOSGas(PRMIX, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases)
+    >>> liquid = CEOSLiquid(PRMIX, eos_kwargs, HeatCapacityGases=correlations.HeatCapacityGases)
+    >>> flasher = FlashVL(constants, correlations, liquid=liquid, gas=gas)
+    >>> with FlashProfiler() as profiler:
+    ...     res = flasher.flash(T=300.0, P=1e6, zs=[0.5, 0.5])
+    >>> len(profiler.flashes), profiler.summary()['Flash.flash']['calls']
+    (1, 1)
+    '''
+    flash_methods = ('flash', 'flash_TPV', 'flash_TP_stability_test',
+                     'stability_test_Michelsen', 'flash_2P', 'phases_at',
+                     'flash_TPV_HSGUA', 'flash_TVF', 'flash_PVF',
+                     'flash_TP_cubic_kernel')
+    phase_methods = ('to_TP_zs', 'to', 'lnphis', 'lnphis_at_zs', 'fugacities',
+                     'fugacities_at_zs')
+    eos_methods = ('volume_solutions',)
+
+    def __init__(self):
+        self.stacks = {}
+        self.flashes = []
+        self._stack = []
+        self._child_times = []
+
+    @staticmethod
+    def _subclasses(cls):
+        classes = [cls]
+        for sub in cls.__subclasses__():
+            for c in FlashProfiler._subclasses(sub):
+                if c not in classes:
+                    classes.append(c)
+        return classes
+
+    def _push(self, name):
+        # Returns whether the call is a flash not made by another flash
+        outer_flash = name == 'Flash.flash' and name not in self._stack
+        self._stack.append(name)
+        self._child_times.append(0.0)
+        return outer_flash
+
+    def _pop(self, elapsed):
+        stack, child_times, stacks = self._stack, self._child_times, self.stacks
+        key = tuple(stack)
+        stack.pop()
+        self_time = elapsed - child_times.pop()
+        if child_times:
+            child_times[-1] += elapsed
+        try:
+            record = stacks[key]
+            record[0] += 1
+            record[1] += self_time
+        except KeyError:
+            stacks[key] = [1, self_time]
+
+    def __enter__(self):
+        global _flash_profiler_count
+        with _flash_profiler_lock:
+            if _flash_profiler_count == 0:
+                _flash_profiler_patch()
+            _flash_profiler_count += 1
+        active = getattr(_flash_profiler_local, 'active', None)
+        if active is None:
+            active = _flash_profiler_local.active = []
+        active.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        global _flash_profiler_count
+        _flash_profiler_local.active.remove(self)
+        with _flash_profiler_lock:
+            _flash_profiler_count -= 1
+            if _flash_profiler_count == 0:
+                _flash_profiler_restore()
+        return False
+
+    def summary(self):
+        r'''Method to summarize the profile by the method called.
+
+        Returns
+        -------
+        summary : dict[str, dict]
+            Number of calls, total time in seconds including the calls made
+            from the method, and time in seconds excluding them, of each
+            method, [-]
+        '''
+        summary = {}
+        for key, (calls, self_time) in self.stacks.items():
+            name = key[-1]
+            try:
+                record = summary[name]
+            except KeyError:
+                record = summary[name] = {'calls': 0, 'time': 0.0, 'self_time': 0.0}
+            record['calls'] += calls
+            record['self_time'] += self_time
+        # A method's total time is the time of all stacks it is in, counted
+        # once for recursive calls
+        for key, (calls, self_time) in self.stacks.items():
+            for name in set(key):
+                summary[name]['time'] += self_time
+        return summary
+
+    def collapsed(self):
+        r'''Method to export the profile in the collapsed stack format read
+        by flame graph tools such as `flamegraph.pl` and `speedscope`; each
+        line is a call stack separated by semicolons and the time spent in
+        it, in microseconds.
+
+        Returns
+        -------
+        collapsed : str
+            Collapsed stacks, [-]
+        '''
+        lines = []
+        for key, (calls, self_time) in self.stacks.items():
+            lines.append('%s %d' %(';'.join(key), int(round(self_time*1e6))))
+        return '\n'.join(lines) + '\n'
+
+    def save(self, path):
+        r'''Method to write the profile in the collapsed stack format of
+        :obj:`collapsed` to a file.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file, [-]
+        '''
+        with open(path, 'w') as f:
+            f.write(self.collapsed())
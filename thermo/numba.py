@@ -55,6 +55,7 @@ def transform_complete_thermo(replaced, __funcs, __all__, normal, vec=False):
                      'identity_phase_states', 'sort_phases',
                     'sequential_substitution_2P',
                     'sequential_substitution_NP',
+                    'newton_equilibrium_NP',
                     'sequential_substitution_Mehra_2P',
                     'sequential_substitution_GDEM3_2P',
                     'nonlin_equilibrium_NP',
@@ -64,11 +65,13 @@ def transform_complete_thermo(replaced, __funcs, __all__, normal, vec=False):
                     'nonlin_n_2P',
                     'nonlin_2P_newton',
                     'minimize_gibbs_2P_transformed',
+                    'solve_PT_2P',
                     'minimize_gibbs_NP_transformed',
                     'TP_solve_VF_guesses',
                     'dew_P_newton',
                     'dew_bubble_newton_zs',
                     'dew_bubble_Michelsen_Mollerup',
+                    'phase_envelope_continuation',
                     'existence_3P_Michelsen_Mollerup',
                     'bubble_T_Michelsen_Mollerup',
                     'dew_T_Michelsen_Mollerup',
@@ -121,6 +124,8 @@ def transform_complete_thermo(replaced, __funcs, __all__, normal, vec=False):
                  'eos_mix_methods.PR_lnphis', 'eos_mix_methods.PR_lnphis_fastest',
                  'eos_mix_methods.a_alpha_aijs_composition_independent',
                  'eos_mix_methods.a_alpha_and_derivatives_full',
+                 'eos_mix_methods.cubic_lnphis_fastest',
+                 'flash.cubic_flash_TP_2P',
 
                  'regular_solution.regular_solution_Hi_sums',
                  'regular_solution.regular_solution_dGE_dxs',
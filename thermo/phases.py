@@ -31,6 +31,8 @@ Base Class
     :show-inheritance:
     :exclude-members:
 
+.. autofunction:: memoize_state
+
 Ideal Gas Equation of State
 ===========================
 
@@ -141,6 +143,7 @@ __all__ = ['GibbsExcessLiquid', 'GibbsExcessSolid', 'Phase', 'CEOSLiquid', 'CEOS
            'gas_phases', 'liquid_phases', 'solid_phases', 'CombinedPhase', 'CoolPropPhase', 'CoolPropLiquid', 'CoolPropGas', 'INCOMPRESSIBLE_CONST',
            'HumidAirRP1485',
            'derivatives_thermodynamic', 'derivatives_thermodynamic_mass', 'derivatives_jacobian',
+           'memoize_state',
 
            'VirialCorrelationsPitzerCurl', # For testing - try to get rid of
            ]
@@ -153,15 +156,17 @@ from fluids.numerics import (horner, horner_and_der, horner_and_der2, horner_log
                              poly_fit_integral_value, poly_fit_integral_over_T_value,
                              evaluate_linear_fits, evaluate_linear_fits_d,
                              evaluate_linear_fits_d2, quadratic_from_f_ders,
-                             newton_system, trunc_log, trunc_exp, newton)
+                             newton_system, trunc_log, trunc_exp, newton,
+                             numpy as np)
 from chemicals.utils import (log, log10, exp, Cp_minus_Cv, phase_identification_parameter,
                           isothermal_compressibility, isobaric_expansion, property_mass_to_molar,
                           Joule_Thomson, speed_of_sound, dxs_to_dns, dns_to_dn_partials,
                           normalize, hash_any_primitive, rho_to_Vm, Vm_to_rho)
 from thermo.activity import IdealSolution
 from thermo.coolprop import has_CoolProp
-from thermo.eos_mix import IGMIX
-from thermo.eos_mix_methods import PR_lnphis_fastest
+from thermo.eos_mix import IGMIX, batch_cubic_eos_constants
+from thermo.eos_mix_methods import (cubic_lnphis_many, cubic_lnphis_fastest,
+                                    a_alpha_aijs_composition_independent)
 from random import randint
 from collections import OrderedDict
 from chemicals.iapws import *
@@ -192,6 +197,80 @@ enthalpy calculation.
 SORTED_DICT = sys.version_info >= (3, 6)
 INCOMPRESSIBLE_CONST = 1e30
 
+STATE_VARIABLES = ('T', 'P', 'zs')
+
+def memoize_state(*depends, **kwargs):
+    r'''Decorator for :obj:`Phase` methods which take no arguments and depend
+    only on the state of the phase. The first call stores the result on the
+    phase and later calls return it; as phases are never modified, the
+    value stays valid for the life of the phase. Setting
+    :obj:`Phase.MEMOIZE_STATE` to False stops results from being stored.
+
+    The dependencies of each memoized value are recorded so
+    :obj:`Phase.transfer_state_cache` can carry values over to a new phase
+    created with `to_TP_zs` or `to` when the variables they depend on are
+    unchanged. Values which depend only on temperature are also recorded in
+    the phase's `_T_values` dictionary when it has one, which is how
+    :obj:`GibbsExcessLiquid` shares them between phases at the same
+    temperature.
+
+    Parameters
+    ----------
+    depends : str
+        State variables ('T', 'P', or 'zs') and names of other memoized
+        methods of the phase which the value depends on, [-]
+    attr : str, optional
+        Name of the attribute the value is stored in; defaults to the name
+        of the method prefixed by an underscore, [-]
+
+    Returns
+    -------
+    decorator : callable
+        Decorator which memoizes the method, [-]
+
+    Examples
+    --------
+    >>> class MyPhase(Phase):
+    ...     @memoize_state('T')
+    ...     def Psats(self):
+    ...         return [1e5*self.T/300.0]
+    >>> phase = MyPhase()
+    >>> phase.T = 330.0
+    >>> phase.Psats() is phase.Psats()
+    True
+    >>> MyPhase.state_dependencies('Psats')
+    ('T',)
+    '''
+    attr = kwargs.pop('attr', None)
+    if kwargs:
+        raise TypeError("Unexpected keyword arguments %s" %(list(kwargs)))
+    def decorator(f):
+        name = '_' + f.__name__ if attr is None else attr
+        def memoized(self):
+            d = self.__dict__
+            try:
+                return d[name]
+            except KeyError:
+                pass
+            value = f(self)
+            if self.MEMOIZE_STATE:
+                d[name] = value
+                T_values = d.get('_T_values')
+                if T_values is not None and name in self._state_cache_attributes(('T',)):
+                    T_values[name] = value
+            return value
+        memoized.__name__ = f.__name__
+        memoized.__doc__ = f.__doc__
+        memoized.__wrapped__ = f
+        memoized.state_depends = depends
+        memoized.state_attr = name
+        return memoized
+    return decorator
+
+
+
+_state_dependencies_cache = {}
+_state_cache_attributes_cache = {}
 
 class Phase(object):
 
@@ -255,6 +334,134 @@ class Phase(object):
     Cpgs_locked = False
     composition_independent = False
 
+    MEMOIZE_STATE = True
+    '''Whether or not methods decorated with :obj:`memoize_state` store their
+    results on the phase. Set to False on a phase class (or :obj:`Phase`
+    itself) to save memory in bulk calculations where each phase is only
+    queried once; the values are then recomputed on every call.'''
+
+    model_attributes = ()
+    '''Tuple of the names of the instance attributes which do not depend on
+    `T`, `P`, or `zs` - correlation objects, fitted coefficients, and model
+    settings. When set, they are gathered into a single dictionary by
+    :obj:`Phase._freeze_model` at the end of the constructor, and every
+    phase cloned with :obj:`Phase._new_from_model` starts from a copy of that
+    dictionary instead of copying each attribute. The model is frozen:
+    changing one of these attributes on an existing phase does not affect the
+    phases created from it; create a new phase instead.'''
+
+    def _freeze_model(self):
+        r'''Method to gather the attributes listed in `model_attributes` into
+        the dictionary shared by every phase created with
+        :obj:`Phase._new_from_model`. Called by the constructor of phases
+        which set `model_attributes`; later changes to those attributes are
+        not seen by the phases created from this one.
+        '''
+        d = self.__dict__
+        model = {k: d[k] for k in self.model_attributes if k in d}
+        model['_model'] = model
+        # Reserve the state entries so setting them does not resize the copy
+        model['T'] = model['P'] = model['zs'] = None
+        self._model = model
+
+    def _new_from_model(self):
+        r'''Method to create an uninitialized Phase object of the same class
+        which already holds the state-independent model data of this phase,
+        as listed in `model_attributes`. The model dictionary is built once
+        and shared by every phase cloned from it, so creating the new object
+        costs one allocation and a dictionary copy; the caller only needs to
+        set the state. See `model_attributes` for when the dictionary is
+        built.
+
+        Returns
+        -------
+        new : Phase
+            New phase without its state set, [-]
+
+        Notes
+        -----
+        On CPython 3.11+, setting a few attributes directly is faster than
+        replacing the instance dictionary, so this only pays off for phases
+        with a large number of model attributes.
+        '''
+        try:
+            model = self._model
+        except AttributeError:
+            # Subclasses which do not freeze their model in the constructor
+            self._freeze_model()
+            model = self._model
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__ = model.copy()
+        return new
+
+    @classmethod
+    def state_dependencies(cls, name):
+        r'''Method to return the state variables a method decorated with
+        :obj:`memoize_state` depends on, following its dependencies on other
+        memoized methods.
+
+        Parameters
+        ----------
+        name : str
+            Name of the memoized method, [-]
+
+        Returns
+        -------
+        depends : tuple[str]
+            State variables among ('T', 'P', 'zs') the value depends on, [-]
+        '''
+        try:
+            return _state_dependencies_cache[(cls, name)]
+        except KeyError:
+            pass
+        try:
+            direct = getattr(cls, name).state_depends
+        except AttributeError:
+            raise ValueError("%s.%s is not a memoized method" %(cls.__name__, name))
+        found = set()
+        for dep in direct:
+            if dep in STATE_VARIABLES:
+                found.add(dep)
+            else:
+                found.update(cls.state_dependencies(dep))
+        depends = tuple(v for v in STATE_VARIABLES if v in found)
+        _state_dependencies_cache[(cls, name)] = depends
+        return depends
+
+    @classmethod
+    def _state_cache_attributes(cls, unchanged):
+        try:
+            return _state_cache_attributes_cache[(cls, unchanged)]
+        except KeyError:
+            pass
+        attrs = []
+        for name in dir(cls):
+            method = getattr(cls, name, None)
+            state_attr = getattr(method, 'state_attr', None)
+            if state_attr is not None and all(v in unchanged for v in cls.state_dependencies(name)):
+                attrs.append(state_attr)
+        attrs = tuple(attrs)
+        _state_cache_attributes_cache[(cls, unchanged)] = attrs
+        return attrs
+
+    def transfer_state_cache(self, new, unchanged):
+        r'''Method to copy the values memoized by :obj:`memoize_state` onto a
+        new phase of the same class, when every state variable the value
+        depends on is the same in both phases.
+
+        Parameters
+        ----------
+        new : Phase
+            Phase to copy the memoized values to, [-]
+        unchanged : tuple[str]
+            State variables which are the same in both phases, among
+            ('T', 'P', 'zs'), [-]
+        '''
+        d, new_d = self.__dict__, new.__dict__
+        for attr in self._state_cache_attributes(unchanged):
+            if attr in d:
+                new_d[attr] = d[attr]
+
     def __str__(self):
         s =  '<%s, ' %(self.__class__.__name__)
         try:
@@ -381,6 +588,89 @@ class Phase(object):
         '''
         raise NotImplementedError("Must be implemented by subphases")
 
+    def evaluate_many(self, Ts, Ps, zs, props=('V', 'H', 'S', 'lnphis')):
+        r'''Method to calculate properties of the phase at many states at once,
+        without creating a new Phase object for each state. `Ts` and `Ps` may
+        be scalars or one value per state; `zs` may be a single composition
+        or one composition per state.
+
+        Parameters
+        ----------
+        Ts : float or list[float]
+            Temperatures of the states, [K]
+        Ps : float or list[float]
+            Pressures of the states, [Pa]
+        zs : list[float] or list[list[float]]
+            Molar compositions of the states, [-]
+        props : str or iterable[str], optional
+            Names of the properties to calculate, [-]
+
+        Returns
+        -------
+        values : dict[str, ndarray]
+            Property values keyed by name; scalar properties have shape (n,)
+            and per-component properties shape (n, N), [various]
+
+        Notes
+        -----
+        Phases with a vectorized implementation (cubic equations of state,
+        the ideal gas, and :obj:`GibbsExcessLiquid`) calculate the properties
+        they support as arrays, creating at most one Phase object per unique
+        temperature for the temperature-only pure component properties. Any
+        other property falls back to :obj:`Phase.to_TP_zs` and
+        :obj:`Phase.value` for each state.
+
+        Examples
+        --------
+
+        >>> phase = IdealGas(T=300, P=1e5, zs=[.79, .21], HeatCapacityGases=[])
+        >>> phase.evaluate_many([300.0, 400.0], 1e5, [.79, .21], props='V')['V']
+        array([0.02494338, 0.03325785])
+        '''
+        if isinstance(props, str):
+            props = (props,)
+        zs = np.atleast_2d(np.array(zs, dtype=float))
+        Ts, Ps = np.array(Ts, dtype=float), np.array(Ps, dtype=float)
+        n = max(Ts.size, Ps.size, zs.shape[0])
+        Ts, Ps = np.broadcast_to(Ts, (n,)), np.broadcast_to(Ps, (n,))
+        zs = np.broadcast_to(zs, (n, zs.shape[1]))
+
+        values = self._evaluate_many(Ts, Ps, zs, props)
+        missing = [p for p in props if p not in values]
+        if missing:
+            rows = {p: [] for p in missing}
+            for T, P, zs_i in zip(Ts.tolist(), Ps.tolist(), zs.tolist()):
+                new = self.to_TP_zs(T, P, zs_i)
+                for p in missing:
+                    rows[p].append(new.value(p))
+            for p in missing:
+                values[p] = np.array(rows[p])
+        return {p: values[p] for p in props}
+
+    def _evaluate_many(self, Ts, Ps, zs, props):
+        # Subclasses return the subset of `props` they can vectorize
+        return {}
+
+    @staticmethod
+    def _unique_Ts_many(Ts):
+        # Group the states by temperature; yields (T, indices of the states)
+        T_unique, inverse = np.unique(Ts, return_inverse=True)
+        for k, T in enumerate(T_unique.tolist()):
+            yield T, np.nonzero(inverse == k)[0]
+
+    def _probes_many(self, Ts, zs):
+        # One phase per unique temperature, for the pure component properties
+        for T, idx in self._unique_Ts_many(Ts):
+            yield T, idx, self.to_TP_zs(T, self.P_REF_IG, zs[idx[0]].tolist())
+
+    def _ideal_gas_HS_many(self, T, Ps, zs, probe):
+        # Ideal gas enthalpies and entropies of many states at one temperature
+        zs_log_zs = np.where(zs > 0.0, zs*np.log(np.where(zs > 0.0, zs, 1.0)), 0.0)
+        H = zs.dot(probe.Cpig_integrals_pure())
+        S = (zs.dot(probe.Cpig_integrals_over_T_pure()) - R*zs_log_zs.sum(axis=1)
+             - R*np.log(Ps*self.P_REF_IG_INV))
+        return H, S
+
     def V(self):
         r'''Method to return the molar volume of the phase.
 
@@ -785,6 +1075,32 @@ class Phase(object):
         lnphis = self.lnphis_at_zs(zs)
         return [P*zs[i]*trunc_exp(lnphis[i]) for i in range(len(zs))]
 
+    def with_zs(self, zs):
+        r'''Method to create a new Phase object at the same `T` and `P` as
+        the existing phase but with a different composition, as needed
+        inside successive substitution. Values which depend only on `T`
+        are reused where the phase supports it. When only the log fugacity
+        coefficients are needed, :obj:`Phase.lnphis_at_zs` avoids creating
+        the phase at all.
+
+        Parameters
+        ----------
+        zs : list[float]
+            Molar composition of the new phase, [-]
+
+        Returns
+        -------
+        new_phase : Phase
+            New phase at the specified composition, [-]
+
+        Examples
+        --------
+        >>> phase = IdealGas(T=300, P=1e5, zs=[.79, .21], HeatCapacityGases=[])
+        >>> phase.with_zs([.5, .5])
+        IdealGas(HeatCapacityGases=[], T=300, P=100000.0, zs=[0.5, 0.5])
+        '''
+        return self.to_TP_zs(self.T, self.P, zs)
+
     def lnphi(self):
         r'''Method to calculate and return the log of fugacity coefficient of
         the phase; provided the phase is 1 component.
@@ -3123,6 +3439,7 @@ class Phase(object):
             Cp_integrals_over_T_pure.append(S - Cps_data[15][i])
         return Cp_integrals_over_T_pure
 
+    @memoize_state('T', attr='_Cpigs')
     def Cpigs_pure(self):
         r'''Method to calculate and return the ideal-gas heat capacities of
         every component in the phase. This method is powered by the
@@ -3135,18 +3452,13 @@ class Phase(object):
         Cp_ig : list[float]
             Molar ideal gas heat capacities, [J/(mol*K)]
         '''
-        try:
-            return self._Cpigs
-        except AttributeError:
-            pass
         if self.Cpgs_locked:
-            self._Cpigs = self._Cp_pure_fast(self._Cpgs_data)
-            return self._Cpigs
+            return self._Cp_pure_fast(self._Cpgs_data)
 
         T = self.T
-        self._Cpigs = [i.T_dependent_property(T) for i in self.HeatCapacityGases]
-        return self._Cpigs
+        return [i.T_dependent_property(T) for i in self.HeatCapacityGases]
 
+    @memoize_state('T')
     def Cpig_integrals_pure(self):
         r'''Method to calculate and return the integrals of the ideal-gas heat
         capacities of every component in the phase from a temperature of
@@ -3164,19 +3476,14 @@ class Phase(object):
             Integrals of ideal gas heat capacity from the reference
             temperature to the system temperature, [J/(mol)]
         '''
-        try:
-            return self._Cpig_integrals_pure
-        except AttributeError:
-            pass
         if self.Cpgs_locked:
-            self._Cpig_integrals_pure = self._Cp_integrals_pure_fast(self._Cpgs_data)
-            return self._Cpig_integrals_pure
+            return self._Cp_integrals_pure_fast(self._Cpgs_data)
 
         T, T_REF_IG, HeatCapacityGases = self.T, self.T_REF_IG, self.HeatCapacityGases
-        self._Cpig_integrals_pure = [obj.T_dependent_property_integral(T_REF_IG, T)
-                                   for obj in HeatCapacityGases]
-        return self._Cpig_integrals_pure
+        return [obj.T_dependent_property_integral(T_REF_IG, T)
+                for obj in HeatCapacityGases]
 
+    @memoize_state('T')
     def Cpig_integrals_over_T_pure(self):
         r'''Method to calculate and return the integrals of the ideal-gas heat
         capacities divided by temperature of every component in the phase from
@@ -3195,20 +3502,14 @@ class Phase(object):
             Integrals of ideal gas heat capacity over temperature from the
             reference temperature to the system temperature, [J/(mol)]
         '''
-        try:
-            return self._Cpig_integrals_over_T_pure
-        except AttributeError:
-            pass
 
         if self.Cpgs_locked:
-            self._Cpig_integrals_over_T_pure = self._Cp_integrals_over_T_pure_fast(self._Cpgs_data)
-            return self._Cpig_integrals_over_T_pure
+            return self._Cp_integrals_over_T_pure_fast(self._Cpgs_data)
 
 
         T, T_REF_IG, HeatCapacityGases = self.T, self.T_REF_IG, self.HeatCapacityGases
-        self._Cpig_integrals_over_T_pure = [obj.T_dependent_property_integral_over_T(T_REF_IG, T)
-                                   for obj in HeatCapacityGases]
-        return self._Cpig_integrals_over_T_pure
+        return [obj.T_dependent_property_integral_over_T(T_REF_IG, T)
+                for obj in HeatCapacityGases]
 
     def dCpigs_dT_pure(self):
         r'''Method to calculate and return the first temperature derivative of
@@ -3239,24 +3540,15 @@ class Phase(object):
         return self._dCpigs_dT
 
 
+    @memoize_state('T', attr='_Cpls')
     def _Cpls_pure(self):
-        try:
-            return self._Cpls
-        except AttributeError:
-            pass
         if self.Cpls_locked:
-            self._Cpls = self._Cp_pure_fast(self._Cpls_data)
-            return self._Cpls
-
+            return self._Cp_pure_fast(self._Cpls_data)
         T = self.T
-        self._Cpls = [i.T_dependent_property(T) for i in self.HeatCapacityLiquids]
-        return self._Cpls
+        return [i.T_dependent_property(T) for i in self.HeatCapacityLiquids]
 
+    @memoize_state('T', attr='_Cpl_integrals')
     def _Cpl_integrals_pure(self):
-        try:
-            return self._Cpl_integrals_pure
-        except AttributeError:
-            pass
 #        def to_quad(T, i):
 #            l2 = self.to_TP_zs(T, self.P, self.zs)
 #            return l2._Cpls_pure()[i] + (l2.Vms_sat()[i] - T*l2.dVms_sat_dT()[i])*l2.dPsats_dT()[i]
@@ -3266,19 +3558,14 @@ class Phase(object):
 #        return vals
 
         if self.Cpls_locked:
-            self._Cpl_integrals_pure = self._Cp_integrals_pure_fast(self._Cpls_data)
-            return self._Cpl_integrals_pure
+            return self._Cp_integrals_pure_fast(self._Cpls_data)
 
         T, T_REF_IG, HeatCapacityLiquids = self.T, self.T_REF_IG, self.HeatCapacityLiquids
-        self._Cpl_integrals_pure = [obj.T_dependent_property_integral(T_REF_IG, T)
-                                   for obj in HeatCapacityLiquids]
-        return self._Cpl_integrals_pure
+        return [obj.T_dependent_property_integral(T_REF_IG, T)
+                for obj in HeatCapacityLiquids]
 
+    @memoize_state('T', attr='_Cpl_integrals_over_T')
     def _Cpl_integrals_over_T_pure(self):
-        try:
-            return self._Cpl_integrals_over_T_pure
-        except AttributeError:
-            pass
 #        def to_quad(T, i):
 #            l2 = self.to_TP_zs(T, self.P, self.zs)
 #            return (l2._Cpls_pure()[i] + (l2.Vms_sat()[i] - T*l2.dVms_sat_dT()[i])*l2.dPsats_dT()[i])/T
@@ -3288,14 +3575,11 @@ class Phase(object):
 #        return vals
 
         if self.Cpls_locked:
-            self._Cpl_integrals_over_T_pure = self._Cp_integrals_over_T_pure_fast(self._Cpls_data)
-            return self._Cpl_integrals_over_T_pure
-
+            return self._Cp_integrals_over_T_pure_fast(self._Cpls_data)
 
         T, T_REF_IG, HeatCapacityLiquids = self.T, self.T_REF_IG, self.HeatCapacityLiquids
-        self._Cpl_integrals_over_T_pure = [obj.T_dependent_property_integral_over_T(T_REF_IG, T)
-                                   for obj in HeatCapacityLiquids]
-        return self._Cpl_integrals_over_T_pure
+        return [obj.T_dependent_property_integral_over_T(T_REF_IG, T)
+                for obj in HeatCapacityLiquids]
 
     def V_ideal_gas(self):
         r'''Method to calculate and return the ideal-gas molar volume of the
@@ -4874,6 +5158,23 @@ class IdealGas(Phase):
     dT_dP_V = dT_dP
     dT_dV_P = dT_dV
 
+    def _evaluate_many(self, Ts, Ps, zs, props):
+        values = {}
+        if 'V' in props:
+            values['V'] = R*Ts/Ps
+        if 'Z' in props:
+            values['Z'] = np.ones(Ts.shape)
+        if 'lnphis' in props:
+            values['lnphis'] = np.zeros(zs.shape)
+        if 'phis' in props:
+            values['phis'] = np.ones(zs.shape)
+        if 'H' in props or 'S' in props or 'G' in props:
+            Hs, Ss = np.empty(Ts.shape), np.empty(Ts.shape)
+            for T, idx, probe in self._probes_many(Ts, zs):
+                Hs[idx], Ss[idx] = self._ideal_gas_HS_many(T, Ps[idx], zs[idx], probe)
+            values['H'], values['S'], values['G'] = Hs, Ss, Hs - Ts*Ss
+        return values
+
     ### Thermodynamic properties
 
     def H(self):
@@ -5199,6 +5500,23 @@ class IdealGas(Phase):
         self._k = k
         return k
 
+class _LazyEOSMix(object):
+    # Non-data descriptor building the `eos_mix` of a phase created by
+    # `with_zs` on first use; phases holding an `eos_mix` in their instance
+    # dict never reach it
+    def __get__(self, phase, cls):
+        if phase is None:
+            return self
+        try:
+            base = phase.__dict__['_eos_mix_base']
+        except KeyError:
+            raise AttributeError('eos_mix')
+        eos_mix = base.to_TP_zs_fast(T=phase.T, P=phase.P, zs=phase.zs, only_l=phase.is_liquid,
+                                     only_g=phase.is_gas, full_alphas=True)
+        phase.eos_mix = eos_mix
+        return eos_mix
+
+
 class CEOSGas(Phase):
     r'''Class for representing a cubic equation of state gas phase
     as a phase object. All departure
@@ -5246,6 +5564,8 @@ class CEOSGas(Phase):
     is_gas = True
     is_liquid = False
     ideal_gas_basis = True
+    eos_mix = _LazyEOSMix()
+
     def model_hash(self, ignore_phase=False):
         if ignore_phase:
             try:
@@ -5390,11 +5710,7 @@ class CEOSGas(Phase):
         >>> new_liq.eos_mix is gas.eos_mix
         True
         '''
-        # Why so slow
-        new = self.__class__.__new__(self.__class__)
-        new.T = T
-        new.P = P
-        new.zs = zs
+        new = self._new_same_model(T, P, zs)
         if other_eos is not None:
             other_eos.solve_missing_volumes()
             new.eos_mix = other_eos
@@ -5407,6 +5723,20 @@ class CEOSGas(Phase):
             except AttributeError:
                 new.eos_mix = self.eos_class(T=T, P=P, zs=zs, **self.eos_kwargs)
 
+        # The ideal gas integrals and the lnphis_at_zs kernel only depend on T
+        if T == self.__dict__.get('T'):
+            self.transfer_state_cache(new, ('T',))
+        return new
+
+    def _new_same_model(self, T, P, zs):
+        # Nearly all of the time of `to_TP_zs` is spent creating `eos_mix`;
+        # copying the dozen model attributes one by one is faster than
+        # `_new_from_model`
+        new = self.__class__.__new__(self.__class__)
+        new.T = T
+        new.P = P
+        new.zs = zs
+
         new.eos_class = self.eos_class
         new.eos_kwargs = self.eos_kwargs
 
@@ -5425,7 +5755,39 @@ class CEOSGas(Phase):
             new.eos_pures_STP = self.eos_pures_STP
         except:
             pass
+        return new
 
+    def with_zs(self, zs):
+        r'''Method to create a new phase at the same `T` and `P` but with a
+        different composition. For the cubic EOSs in
+        :obj:`thermo.eos_mix.batch_cubic_eos_constants`, only the mixed
+        :math:`a\alpha` and `b`, the volume root and the log fugacity
+        coefficients are calculated, reusing the matrix
+        :math:`(a\alpha)_{ij}` and `bs` of this phase; the
+        :obj:`GCEOSMIX <thermo.eos_mix.GCEOSMIX>` object of the new phase is
+        only created if another property is requested from it.
+
+        Parameters
+        ----------
+        zs : list[float]
+            Molar composition of the new phase, [-]
+
+        Returns
+        -------
+        new_phase : Phase
+            New phase at the specified composition, [-]
+        '''
+        args = self._lnphis_kernel_args()
+        if args is None:
+            return self.to_TP_zs(self.T, self.P, zs)
+        T, P = self.T, self.P
+        new = self._new_same_model(T, P, zs)
+        new._lnphis = cubic_lnphis_fastest(T, P, zs, *args, liquid=self.is_liquid)[0]
+        # Chained calls keep sharing the first EOS object instead of creating
+        # the skipped ones
+        d = self.__dict__
+        new._eos_mix_base = d['eos_mix'] if 'eos_mix' in d else d['_eos_mix_base']
+        self.transfer_state_cache(new, ('T', 'P'))
         return new
 
     def to(self, zs, T=None, P=None, V=None):
@@ -5510,12 +5872,41 @@ class CEOSGas(Phase):
         except AttributeError:
             return eos_mix.fugacity_coefficients(eos_mix.Z_l)
 
-    def lnphis_at_zs(self, zs):
+    @memoize_state('T', attr='_lnphis_kernel')
+    def _lnphis_kernel_args(self):
+        # Temperature-only inputs of `cubic_lnphis_fastest`; None when the
+        # EOS is not one it can solve
+        try:
+            constants = batch_cubic_eos_constants[self.eos_class]
+        except KeyError:
+            return None
         eos_mix = self.eos_mix
-        if eos_mix.__class__.__name__ == 'PRMIX':
-            return PR_lnphis_fastest(zs, self.T, self.P, eos_mix.kijs, self.is_liquid, self.is_gas,
-                                     eos_mix.ais, eos_mix.bs, eos_mix.a_alphas, eos_mix.a_alpha_roots,
-                                     eos_mix.kappas)
+        a_alpha_ijs = a_alpha_aijs_composition_independent(eos_mix.a_alphas, eos_mix.kijs)[0]
+        return (eos_mix.bs, a_alpha_ijs) + constants
+
+    def lnphis_at_zs(self, zs):
+        r'''Method to directly calculate the log fugacity coefficients at a
+        different composition than the current phase, at the same `T` and
+        `P`. For the cubic EOSs in
+        :obj:`thermo.eos_mix.batch_cubic_eos_constants`, the matrix
+        :math:`(a\alpha)_{ij}` is calculated once per phase and each call
+        only mixes `b` and :math:`a\alpha`, solves for the volume root,
+        and evaluates the log fugacity coefficients; no new phase or EOS
+        object is created.
+
+        Parameters
+        ----------
+        zs : list[float]
+            Molar composition, [-]
+
+        Returns
+        -------
+        lnphis : list[float]
+            Log fugacity coefficients, [-]
+        '''
+        args = self._lnphis_kernel_args()
+        if args is not None:
+            return cubic_lnphis_fastest(self.T, self.P, zs, *args, liquid=self.is_liquid)[0]
         return self.to_TP_zs(self.T, self.P, zs).lnphis()
 
 
@@ -5531,6 +5922,11 @@ class CEOSGas(Phase):
         lnphis : list[float]
             Log fugacity coefficients, [-]
         '''
+        try:
+            # Set by `with_zs`
+            return self._lnphis
+        except AttributeError:
+            pass
         try:
             return self.eos_mix.fugacity_coefficients(self.eos_mix.Z_g)
         except AttributeError:
@@ -5815,6 +6211,44 @@ class CEOSGas(Phase):
         self._S = S
         return S
 
+    def _evaluate_many(self, Ts, Ps, zs, props):
+        try:
+            constants = batch_cubic_eos_constants[self.eos_class]
+        except KeyError:
+            return {}
+        sigma, epsilon = constants[:2]
+        n, N = zs.shape
+        Vs, lnphis = np.empty(n), np.empty((n, N))
+        Hs, Ss = np.empty(n), np.empty(n)
+        HS = 'H' in props or 'S' in props or 'G' in props
+        for T, idx, probe in self._probes_many(Ts, zs):
+            eos = probe.eos_mix
+            bs = np.array(eos.bs)
+            one_m_kijs = 1.0 - np.array(eos.kijs)
+            a_alphas, da_alpha_dTs = np.array(eos.a_alphas), np.array(eos.da_alpha_dTs)
+            a_alpha_roots = np.sqrt(a_alphas)
+            a_alpha_ijs = one_m_kijs*np.outer(a_alpha_roots, a_alpha_roots)
+            comps, P = zs[idx], Ps[idx]
+            lnphis[idx], V, a_alpha_j_rows = cubic_lnphis_many(T, P, comps, bs, a_alpha_ijs,
+                                                               *constants, liquid=self.is_liquid)
+            Vs[idx] = V
+            if HS:
+                da_alpha_dT_ijs = 0.5*one_m_kijs*(np.outer(da_alpha_dTs, a_alphas)
+                                                  + np.outer(a_alphas, da_alpha_dTs))/np.outer(a_alpha_roots, a_alpha_roots)
+                b = comps.dot(bs)
+                a_alpha = (comps*a_alpha_j_rows).sum(axis=1)
+                da_alpha_dT = (comps.dot(da_alpha_dT_ijs)*comps).sum(axis=1)
+                L = np.log((V + epsilon*b)/(V + sigma*b))/((sigma - epsilon)*b)
+                H_ig, S_ig = self._ideal_gas_HS_many(T, P, comps, probe)
+                Hs[idx] = H_ig + P*V - R*T + (a_alpha - T*da_alpha_dT)*L
+                Ss[idx] = S_ig + R*np.log(P*(V - b)/(R*T)) - da_alpha_dT*L
+        values = {'V': Vs, 'Z': Ps*Vs/(R*Ts), 'lnphis': lnphis}
+        if 'phis' in props:
+            values['phis'] = np.exp(lnphis)
+        if HS:
+            values['H'], values['S'], values['G'] = Hs, Ss, Hs - Ts*Ss
+        return values
+
 
 
     def Cp(self):
@@ -6198,6 +6632,19 @@ class GibbsExcessLiquid(Phase):
     _Psats_data = None
     Psats_locked = False
     Vms_sat_locked = False
+    model_attributes = ('VaporPressures', 'Psats_locked', '_Psats_data', 'N',
+                        'cmps', 'HeatCapacityGases', 'Cpgs_locked', '_Cpgs_data',
+                        'HeatCapacityLiquids', 'Cpls_locked', '_Cpls_data',
+                        'Hvaps_T_ref', 'dSvaps_T_ref', 'use_eos_volume',
+                        'VolumeLiquids', 'Vms_sat_locked', '_Vms_sat_data',
+                        'VolumeSupercriticalLiquids', 'Vms_supercritical_locked',
+                        'Vms_supercritical_data', 'incompressible', 'use_Tait',
+                        '_Tait_B_data', '_Tait_C_data', 'EnthalpyVaporizations',
+                        'Hvap_locked', '_Hvap_data', 'eos_pure_instances',
+                        'use_IG_Cp', 'use_Poynting', 'use_phis_sat',
+                        'has_henry_components', 'henry_components', 'henry_data',
+                        'composition_independent', 'Hfs', 'Gfs', 'Sfs',
+                        'P_DEPENDENT_H_LIQ', '_T_cache')
     _Vms_sat_data = None
     Hvap_locked = False
     _Hvap_data = None
@@ -6208,6 +6655,14 @@ class GibbsExcessLiquid(Phase):
     Cpls_locked = False
     _Cpls_data = None
 
+    T_CACHE_SIZE = 32
+    '''Number of temperatures for which the temperature-only pure component
+    values (vapor pressures, saturation volumes, heats of vaporization, heat
+    capacity integrals, and their derivatives) are kept once they have been
+    calculated. The cache is shared by every phase cloned from the same
+    phase, so a flash which returns to a temperature it has already visited
+    does not evaluate the correlations again. Set to 0 to disable.'''
+
     _Tait_B_data = None
     _Tait_C_data = None
     def __init__(self, VaporPressures, VolumeLiquids=None,
@@ -6359,6 +6814,9 @@ class GibbsExcessLiquid(Phase):
 
         self.composition_independent = isinstance(GibbsExcessModel, IdealSolution) and not self.has_henry_components
 
+        # Temperature -> {attribute: value} of the values memoized on 'T' only
+        self._T_cache = OrderedDict()
+
         self.Hfs = Hfs
         self.Gfs = Gfs
         self.Sfs = Sfs
@@ -6367,15 +6825,15 @@ class GibbsExcessLiquid(Phase):
             self.T = T
             self.P = P
             self.zs = zs
+            self._T_values = self._T_cache[T] = {}
+        self._freeze_model()
 
     def to_TP_zs(self, T, P, zs):
         T_equal = hasattr(self, 'T') and T == self.T
-        new = self.__class__.__new__(self.__class__)
+        new = self._new_from_model()
         new.T = T
         new.P = P
         new.zs = zs
-        new.N = self.N
-        new.cmps = self.cmps
 
         self.transfer_data(new, zs, T, T_equal)
         return new
@@ -6387,114 +6845,59 @@ class GibbsExcessLiquid(Phase):
         except:
             T_equal = False
 
-        new = self.__class__.__new__(self.__class__)
+        new = self._new_from_model()
         new.zs = zs
-        new.N = self.N
-        new.cmps = self.cmps
 
         if T is not None:
             if P is not None:
-                new.T = T
-                new.P = P
+                pass
             elif V is not None:
                 def to_solve(P):
                     return self.to_TP_zs(T, P, zs).V() - V
                 P = secant(to_solve, 0.0002, xtol=1e-8, ytol=1e-10)
-                new.P = P
         elif P is not None and V is not None:
             def to_solve(T):
                 return self.to_TP_zs(T, P, zs).V() - V
             T = secant(to_solve, 300, xtol=1e-9, ytol=1e-5)
-            new.T = T
         else:
             raise ValueError("Two of T, P, or V are needed")
+        new.T = T
+        new.P = P
 
         self.transfer_data(new, zs, T, T_equal)
         return new
 
     def transfer_data(self, new, zs, T, T_equal):
-        new.VaporPressures = self.VaporPressures
-        new.VolumeLiquids = self.VolumeLiquids
-        new.eos_pure_instances = self.eos_pure_instances
-        new.HeatCapacityGases = self.HeatCapacityGases
-        new.EnthalpyVaporizations = self.EnthalpyVaporizations
-        new.HeatCapacityLiquids = self.HeatCapacityLiquids
-
-
-        new.Psats_locked = self.Psats_locked
-        new._Psats_data = self._Psats_data
-
-        new.Cpgs_locked = self.Cpgs_locked
-        new._Cpgs_data = self._Cpgs_data
-
-        new.Cpls_locked = self.Cpls_locked
-        new._Cpls_data = self._Cpls_data
-
-        new.Vms_sat_locked = self.Vms_sat_locked
-        new._Vms_sat_data = self._Vms_sat_data
-
-        new._Hvap_data = self._Hvap_data
-        new.Hvap_locked = self.Hvap_locked
-
-        new.incompressible = self.incompressible
-
-        new.use_phis_sat = self.use_phis_sat
-        new.use_Poynting = self.use_Poynting
-        new.P_DEPENDENT_H_LIQ = self.P_DEPENDENT_H_LIQ
-        new.use_IG_Cp = self.use_IG_Cp
-        new.use_eos_volume = self.use_eos_volume
-
-        new.Hfs = self.Hfs
-        new.Gfs = self.Gfs
-        new.Sfs = self.Sfs
-
-        new.henry_data = self.henry_data
-        new.henry_components = self.henry_components
-        new.has_henry_components = self.has_henry_components
-
-        new.composition_independent = self.composition_independent
-
-        new.use_Tait = self.use_Tait
-        new._Tait_B_data = self._Tait_B_data
-        new._Tait_C_data = self._Tait_C_data
-
-
         if T_equal and (self.composition_independent or self.zs is zs):
             # Allow the composition inconsistency as it is harmless
             new.GibbsExcessModel = self.GibbsExcessModel
         else:
             new.GibbsExcessModel = self.GibbsExcessModel.to_T_xs(T=T, xs=zs)
 
-        try:
-            if T_equal:
-                if not self.has_henry_components:
-                    try:
-                        new._Psats = self._Psats
-                        new._dPsats_dT = self._dPsats_dT
-                        new._d2Psats_dT2 = self._d2Psats_dT2
-                    except:
-                        pass
-
-                try:
-                    new._Vms_sat = self._Vms_sat
-                    new._Vms_sat_dT = self._Vms_sat_dT
-                    new._d2Vms_sat_dT2 = self._d2Vms_sat_dT2
-                except:
-                    pass
-                try:
-                    new._Cpigs = self._Cpigs
-                except:
-                    pass
-                try:
-                    new._Cpig_integrals_over_T_pure = self._Cpig_integrals_over_T_pure
-                except:
-                    pass
-                try:
-                    new._Cpig_integrals_pure = self._Cpig_integrals_pure
-                except:
-                    pass
-        except:
-            pass
+        # Henry's law components make the vapor pressures depend on composition
+        if self.has_henry_components:
+            return new
+        if T_equal:
+            if new.P == getattr(self, 'P', None):
+                self.transfer_state_cache(new, ('T', 'P'))
+            else:
+                self.transfer_state_cache(new, ('T',))
+            T_values = self.__dict__.get('_T_values')
+            if T_values is not None:
+                new._T_values = T_values
+        elif self.T_CACHE_SIZE:
+            # Give the new phase the values already known at its temperature;
+            # the ones it calculates are recorded in the same dictionary
+            T_cache = self._T_cache
+            try:
+                T_values = T_cache.pop(T)
+                new.__dict__.update(T_values)
+            except KeyError:
+                T_values = {}
+                if len(T_cache) >= self.T_CACHE_SIZE:
+                    T_cache.popitem(last=False)
+            # Re-insert so the most recently used temperatures are evicted last
+            T_cache[T] = new._T_values = T_values
         return new
 
 
@@ -6555,14 +6958,11 @@ class GibbsExcessLiquid(Phase):
 
         return Psats
 
+    @memoize_state('T')
     def Psats(self):
-        try:
-            return self._Psats
-        except AttributeError:
-            pass
         T, cmps = self.T, self.cmps
         if self.Psats_locked:
-            self._Psats = Psats = self._Psats_at_locked(T, self._Psats_data, cmps)
+            Psats = self._Psats_at_locked(T, self._Psats_data, cmps)
 #            _Psats_data = self._Psats_data
 #            Tmins, Tmaxes, coeffs = _Psats_data[0], _Psats_data[3], _Psats_data[6]
 #            for i in cmps:
@@ -6582,7 +6982,7 @@ class GibbsExcessLiquid(Phase):
             return Psats
 
 
-        self._Psats = Psats = []
+        Psats = []
         for i in self.VaporPressures:
             Psats.append(i.T_dependent_property(T))
 
@@ -6662,11 +7062,8 @@ class GibbsExcessLiquid(Phase):
         return [VaporPressure.T_dependent_property_derivative(T=T)
                      for VaporPressure in self.VaporPressures]
 
+    @memoize_state('T')
     def dPsats_dT(self):
-        try:
-            return self._dPsats_dT
-        except:
-            pass
         T, cmps = self.T, self.cmps
         # Need to reset the method because for the T bounded solver,
         # will normally get a different than prefered method as it starts
@@ -6676,18 +7073,13 @@ class GibbsExcessLiquid(Phase):
                 Psats = self._Psats
             except AttributeError:
                 Psats = self.Psats()
-            self._dPsats_dT = dPsats_dT = self._dPsats_dT_at_locked(T, self._Psats_data, cmps, Psats)
-            return dPsats_dT
+            return self._dPsats_dT_at_locked(T, self._Psats_data, cmps, Psats)
 
-        self._dPsats_dT = dPsats_dT = [VaporPressure.T_dependent_property_derivative(T=T)
-                     for VaporPressure in self.VaporPressures]
-        return dPsats_dT
+        return [VaporPressure.T_dependent_property_derivative(T=T)
+                for VaporPressure in self.VaporPressures]
 
+    @memoize_state('T')
     def d2Psats_dT2(self):
-        try:
-            return self._d2Psats_dT2
-        except:
-            pass
         try:
             Psats = self._Psats
         except AttributeError:
@@ -6701,7 +7093,7 @@ class GibbsExcessLiquid(Phase):
         T_inv2 = T_inv*T_inv
         Tinv3 = T_inv*T_inv*T_inv
 
-        self._d2Psats_dT2 = d2Psats_dT2 = []
+        d2Psats_dT2 = []
         if self.Psats_locked:
             Psats_data = self._Psats_data
             Tmins, Tmaxes, d2coeffs = Psats_data[0], Psats_data[3], Psats_data[8]
@@ -6726,15 +7118,11 @@ class GibbsExcessLiquid(Phase):
                 d2Psats_dT2.append(d2Psat_dT2)
             return d2Psats_dT2
 
-        self._d2Psats_dT2 = d2Psats_dT2 = [VaporPressure.T_dependent_property_derivative(T=T, n=2)
-                     for VaporPressure in self.VaporPressures]
-        return d2Psats_dT2
+        return [VaporPressure.T_dependent_property_derivative(T=T, n=2)
+                for VaporPressure in self.VaporPressures]
 
+    @memoize_state('T')
     def lnPsats(self):
-        try:
-            return self._lnPsats
-        except AttributeError:
-            pass
         T, cmps = self.T, self.cmps
         T_inv = 1.0/T
         logT = log(T)
@@ -6755,10 +7143,8 @@ class GibbsExcessLiquid(Phase):
                     for c in coeffs[i]:
                         Psat = Psat*T + c
                 lnPsats.append(Psat)
-            self._lnPsats = lnPsats
             return lnPsats
-        self._lnPsats = [log(i) for i in self.Psats()]
-        return self._lnPsats
+        return [log(i) for i in self.Psats()]
 
     def dlnPsats_dT(self):
         T, cmps = self.T, self.cmps
@@ -6807,11 +7193,8 @@ class GibbsExcessLiquid(Phase):
                 d2lnPsats_dT2.append(d2lnPsat_dT2)
             return d2lnPsats_dT2
 
+    @memoize_state('T')
     def dPsats_dT_over_Psats(self):
-        try:
-            return self._dPsats_dT_over_Psats
-        except AttributeError:
-            pass
         T, cmps = self.T, self.cmps
         T_inv = 1.0/T
         Tinv2 = T_inv*T_inv
@@ -6830,18 +7213,13 @@ class GibbsExcessLiquid(Phase):
                     for c in dcoeffs[i]:
                         dPsat_dT_over_Psat = dPsat_dT_over_Psat*T + c
                 dPsat_dT_over_Psats.append(dPsat_dT_over_Psat)
-            self._dPsats_dT_over_Psats = dPsat_dT_over_Psats
             return dPsat_dT_over_Psats
 
         dPsat_dT_over_Psats = [i/j for i, j in zip(self.dPsats_dT(), self.Psats())]
-        self._dPsats_dT_over_Psats = dPsat_dT_over_Psats
         return dPsat_dT_over_Psats
 
+    @memoize_state('T')
     def d2Psats_dT2_over_Psats(self):
-        try:
-            return self._d2Psats_dT2_over_Psats
-        except AttributeError:
-            pass
         T, cmps = self.T, self.cmps
         T_inv = 1.0/T
         Tinv2 = T_inv*T_inv
@@ -6870,11 +7248,9 @@ class GibbsExcessLiquid(Phase):
                     d2Psat_dT2_over_Psat = dPsat_dT*dPsat_dT + d2Psat_dT2
 
                 d2Psat_dT2_over_Psats.append(d2Psat_dT2_over_Psat)
-            self._d2Psats_dT2_over_Psats = d2Psat_dT2_over_Psats
             return d2Psat_dT2_over_Psats
 
         d2Psat_dT2_over_Psats = [i/j for i, j in zip(self.d2Psats_dT2(), self.Psats())]
-        self._d2Psats_dT2_over_Psats = d2Psat_dT2_over_Psats
         return d2Psat_dT2_over_Psats
 
     @staticmethod
@@ -6902,17 +7278,13 @@ class GibbsExcessLiquid(Phase):
         VolumeLiquids = self.VolumeLiquids
         return [VolumeLiquids[i].T_dependent_property(T) for i in self.cmps]
 
+    @memoize_state('T')
     def Vms_sat(self):
-        try:
-            return self._Vms_sat
-        except AttributeError:
-            pass
         T = self.T
         if self.Vms_sat_locked:
 #            self._Vms_sat = evaluate_linear_fits(self._Vms_sat_data, T)
 #            return self._Vms_sat
-            self._Vms_sat = Vms_sat = self._Vms_sat_at(T, self._Vms_sat_data, self.cmps)
-            return Vms_sat
+            return self._Vms_sat_at(T, self._Vms_sat_data, self.cmps)
         elif self.use_eos_volume:
             Vms = []
             eoss = self.eos_pure_instances
@@ -6926,15 +7298,13 @@ class GibbsExcessLiquid(Phase):
                         Vms.append(e.V_l)
                     except:
                         Vms.append(e.V_g)
-            self._Vms_sat = Vms
             return Vms
 
 
         VolumeLiquids = self.VolumeLiquids
 #        Psats = self.Psats()
 #        self._Vms_sat = [VolumeLiquids[i](T, Psats[i]) for i in self.cmps]
-        self._Vms_sat = [VolumeLiquids[i].T_dependent_property(T) for i in self.cmps]
-        return self._Vms_sat
+        return [VolumeLiquids[i].T_dependent_property(T) for i in self.cmps]
 
     @staticmethod
     def _dVms_sat_dT_at(T, Vms_sat_data, cmps):
@@ -6958,34 +7328,26 @@ class GibbsExcessLiquid(Phase):
             return self._dVms_sat_dT_at(T, self._Vms_sat_data, self.cmps)
         return [obj.T_dependent_property_derivative(T=T) for obj in VolumeLiquids]
 
+    @memoize_state('T', attr='_Vms_sat_dT')
     def dVms_sat_dT(self):
-        try:
-            return self._Vms_sat_dT
-        except:
-            pass
         T = self.T
 
         if self.Vms_sat_locked:
 #            self._Vms_sat_dT = evaluate_linear_fits_d(self._Vms_sat_data, T)
-            self._Vms_sat_dT = self._dVms_sat_dT_at(T, self._Vms_sat_data, self.cmps)
-            return self._Vms_sat_dT
+            return self._dVms_sat_dT_at(T, self._Vms_sat_data, self.cmps)
 
         VolumeLiquids = self.VolumeLiquids
-        self._Vms_sat_dT = Vms_sat_dT = [obj.T_dependent_property_derivative(T=T) for obj in VolumeLiquids]
-        return Vms_sat_dT
+        return [obj.T_dependent_property_derivative(T=T) for obj in VolumeLiquids]
 
+    @memoize_state('T')
     def d2Vms_sat_dT2(self):
-        try:
-            return self._d2Vms_sat_dT2
-        except:
-            pass
 
         T = self.T
 
         if self.Vms_sat_locked:
 #            self._d2Vms_sat_dT2 = evaluate_linear_fits_d2(self._Vms_sat_data, T)
 #            return self._d2Vms_sat_dT2
-            d2Vms_sat_dT2 = self._d2Vms_sat_dT2 = []
+            d2Vms_sat_dT2 = []
 
             Vms_sat_data = self._Vms_sat_data
             Tmins, Tmaxes, d2coeffs = Vms_sat_data[0], Vms_sat_data[3], Vms_sat_data[8]
@@ -7000,8 +7362,7 @@ class GibbsExcessLiquid(Phase):
             return d2Vms_sat_dT2
 
         VolumeLiquids = self.VolumeLiquids
-        self._d2Vms_sat_dT2 = [obj.T_dependent_property_derivative(T=T, order=2) for obj in VolumeLiquids]
-        return self._d2Vms_sat_dT2
+        return [obj.T_dependent_property_derivative(T=T, order=2) for obj in VolumeLiquids]
 
     def Vms_sat_T_ref(self):
         try:
@@ -7048,14 +7409,11 @@ class GibbsExcessLiquid(Phase):
     def d2Vms_dPdT(self):
         return [0.0]*self.N
 
+    @memoize_state('T')
     def Hvaps(self):
-        try:
-            return self._Hvaps
-        except AttributeError:
-            pass
         T, EnthalpyVaporizations, cmps = self.T, self.EnthalpyVaporizations, self.cmps
 
-        self._Hvaps = Hvaps = []
+        Hvaps = []
         if self.Hvap_locked:
             Hvap_data = self._Hvap_data
             Tmins, Tmaxes, Tcs, Tcs_inv, coeffs = Hvap_data[0], Hvap_data[1], Hvap_data[2], Hvap_data[3], Hvap_data[4]
@@ -7069,20 +7427,17 @@ class GibbsExcessLiquid(Phase):
                 Hvaps.append(Hvap)
             return Hvaps
 
-        self._Hvaps = Hvaps = [EnthalpyVaporizations[i](T) for i in cmps]
+        Hvaps = [EnthalpyVaporizations[i](T) for i in cmps]
         for i in cmps:
             if Hvaps[i] is None:
                 Hvaps[i] = 0.0
         return Hvaps
 
+    @memoize_state('T')
     def dHvaps_dT(self):
-        try:
-            return self._dHvaps_dT
-        except AttributeError:
-            pass
         T, EnthalpyVaporizations, cmps = self.T, self.EnthalpyVaporizations, self.cmps
 
-        self._dHvaps_dT = dHvaps_dT = []
+        dHvaps_dT = []
         if self.Hvap_locked:
             Hvap_data = self._Hvap_data
             Tmins, Tmaxes, Tcs, Tcs_inv, coeffs = Hvap_data[0], Hvap_data[1], Hvap_data[2], Hvap_data[3], Hvap_data[4]
@@ -7101,7 +7456,7 @@ class GibbsExcessLiquid(Phase):
                 dHvaps_dT.append(dHvap_dT)
             return dHvaps_dT
 
-        self._dHvaps_dT = dHvaps_dT = [EnthalpyVaporizations[i].T_dependent_property_derivative(T) for i in cmps]
+        dHvaps_dT = [EnthalpyVaporizations[i].T_dependent_property_derivative(T) for i in cmps]
         for i in cmps:
             if dHvaps_dT[i] is None:
                 dHvaps_dT[i] = 0.0
@@ -7129,14 +7484,10 @@ class GibbsExcessLiquid(Phase):
         RT_inv = 1.0/(R*T)
         return [exp(Vms[i]*(P-Psats[i])*RT_inv) for i in cmps]
 
+    @memoize_state('P', 'Psats', 'Vms_sat')
     def Poyntings(self):
-        try:
-            return self._Poyntings
-        except AttributeError:
-            pass
         if not self.use_Poynting:
-            self._Poyntings = [1.0]*self.N
-            return self._Poyntings
+            return [1.0]*self.N
 
         T, P = self.T, self.P
         try:
@@ -7148,18 +7499,13 @@ class GibbsExcessLiquid(Phase):
         except AttributeError:
             Vms_sat = self.Vms_sat()
         RT_inv = 1.0/(R*T)
-        self._Poyntings = [exp(Vml*(P-Psat)*RT_inv) for Psat, Vml in zip(Psats, Vms_sat)]
-        return self._Poyntings
+        return [exp(Vml*(P-Psat)*RT_inv) for Psat, Vml in zip(Psats, Vms_sat)]
 
 
+    @memoize_state('Poyntings')
     def dPoyntings_dT(self):
-        try:
-            return self._dPoyntings_dT
-        except AttributeError:
-            pass
         if not self.use_Poynting:
-            self._dPoyntings_dT = [0.0]*self.N
-            return self._dPoyntings_dT
+            return [0.0]*self.N
 
         T, P = self.T, self.P
 
@@ -7172,7 +7518,7 @@ class GibbsExcessLiquid(Phase):
         x1 = 1.0/T
         RT_inv = x0*x1
 
-        self._dPoyntings_dT = dPoyntings_dT = []
+        dPoyntings_dT = []
         for i in self.cmps:
             x2 = Vms[i]
             x3 = Psats[i]
@@ -7210,14 +7556,10 @@ class GibbsExcessLiquid(Phase):
             dPoyntings_dT.append(dPoyntings_dTi)
         return dPoyntings_dT
 
+    @memoize_state('Poyntings')
     def d2Poyntings_dT2(self):
-        try:
-            return self._d2Poyntings_dT2
-        except AttributeError:
-            pass
         if not self.use_Poynting:
-            self._d2Poyntings_dT2 = [0.0]*self.N
-            return self._d2Poyntings_dT2
+            return [0.0]*self.N
 
         T, P = self.T, self.P
 
@@ -7234,7 +7576,7 @@ class GibbsExcessLiquid(Phase):
         x12 = x11*x6
         c0 = 2.0*x6*x6
 
-        self._d2Poyntings_dT2 = d2Poyntings_dT2 = []
+        d2Poyntings_dT2 = []
         '''
         from sympy import *
         R, T, P = symbols('R, T, P')
@@ -7260,30 +7602,27 @@ class GibbsExcessLiquid(Phase):
             d2Poyntings_dT2.append(d2Poyntings_dT2i)
         return d2Poyntings_dT2
 
+    @memoize_state('Poyntings')
     def dPoyntings_dP(self):
         '''from sympy import *
         R, T, P, zi = symbols('R, T, P, zi')
         Vml = symbols('Vml', cls=Function)
         cse(diff(exp(Vml(T)*(P - Psati(T))/(R*T)), P), optimizations='basic')
         '''
-        try:
-            return self._dPoyntings_dP
-        except AttributeError:
-            pass
         if not self.use_Poynting:
-            self._dPoyntings_dP = [0.0]*self.N
-            return self._dPoyntings_dP
+            return [0.0]*self.N
         T, P = self.T, self.P
         Psats = self.Psats()
 
         Vms = self.Vms_sat()
 
-        self._dPoyntings_dP = dPoyntings_dPs = []
+        dPoyntings_dPs = []
         for i in self.cmps:
             x0 = Vms[i]/(R*T)
             dPoyntings_dPs.append(x0*exp(x0*(P - Psats[i])))
         return dPoyntings_dPs
 
+    @memoize_state('Poyntings')
     def d2Poyntings_dPdT(self):
         '''
         from sympy import *
@@ -7294,13 +7633,8 @@ class GibbsExcessLiquid(Phase):
         Poyf = symbols('Poyf')
         cse(diff(Poy, T, P).subs(Poy, Poyf), optimizations='basic')
         '''
-        try:
-            return self._d2Poyntings_dPdT
-        except AttributeError:
-            pass
         if not self.use_Poynting:
-            self._d2Poyntings_dPdT = [0.0]*self.N
-            return self._d2Poyntings_dPdT
+            return [0.0]*self.N
 
         try:
             Psats = self._Psats
@@ -7327,7 +7661,7 @@ class GibbsExcessLiquid(Phase):
         x1 = 1.0/self.T
         P = self.P
         nRT_inv = -x0*x1
-        self._d2Poyntings_dPdT = d2Poyntings_dPdT = []
+        d2Poyntings_dPdT = []
         for i in self.cmps:
             x2 = Vms[i]
             x3 = x1*x2
@@ -7346,20 +7680,15 @@ class GibbsExcessLiquid(Phase):
             return [1.0]*self.N
         return [i.phi_sat(T, polish=True) for i in self.eos_pure_instances]
 
+    @memoize_state('T')
     def phis_sat(self):
-        try:
-            return self._phis_sat
-        except AttributeError:
-            pass
         # Goal: Have the polynomial here. Fitting specific to the compound is required.
 
         if not self.use_phis_sat:
-            self._phis_sat = [1.0]*self.N
-            return self._phis_sat
+            return [1.0]*self.N
 
         T = self.T
-        self._phis_sat = [i.phi_sat(T, polish=True) for i in self.eos_pure_instances]
-        return self._phis_sat
+        return [i.phi_sat(T, polish=True) for i in self.eos_pure_instances]
 
 
 
@@ -7369,33 +7698,23 @@ class GibbsExcessLiquid(Phase):
             return [0.0]*self.N
         return [i.dphi_sat_dT(T) for i in self.eos_pure_instances]
 
+    @memoize_state('T')
     def dphis_sat_dT(self):
-        try:
-            return self._dphis_sat_dT
-        except AttributeError:
-            pass
 
         if not self.use_phis_sat:
-            self._dphis_sat_dT = [0.0]*self.N
-            return self._dphis_sat_dT
+            return [0.0]*self.N
 
         T = self.T
-        self._dphis_sat_dT = [i.dphi_sat_dT(T) for i in self.eos_pure_instances]
-        return self._dphis_sat_dT
+        return [i.dphi_sat_dT(T) for i in self.eos_pure_instances]
 
+    @memoize_state('T')
     def d2phis_sat_dT2(self):
         # Numerically implemented
-        try:
-            return self._d2phis_sat_dT2
-        except AttributeError:
-            pass
         if not self.use_phis_sat:
-            self._d2phis_sat_dT2 = [0.0]*self.N
-            return self._d2phis_sat_dT2
+            return [0.0]*self.N
 
         T = self.T
-        self._d2phis_sat_dT2 = [i.d2phi_sat_dT2(T) for i in self.eos_pure_instances]
-        return self._d2phis_sat_dT2
+        return [i.d2phi_sat_dT2(T) for i in self.eos_pure_instances]
 
 
     def phis_at(self, T, P, zs, Psats=None, gammas=None, phis_sat=None, Poyntings=None):
@@ -7472,6 +7791,27 @@ class GibbsExcessLiquid(Phase):
 
     lnphis_G_min = lnphis
 
+    def _evaluate_many(self, Ts, Ps, zs, props):
+        # Henry's law components make the vapor pressures depend on composition
+        if self.has_henry_components:
+            return {}
+        n, N = zs.shape
+        Vs, lnphis = np.empty(n), np.empty((n, N))
+        for T, idx in self._unique_Ts_many(Ts):
+            comps, P = zs[idx], Ps[idx]
+            Vms = np.array(self.Vms_sat_at(T))
+            Psats = np.array(self.Psats_at(T))
+            Vs[idx] = comps.dot(Vms)
+            lnphis_T = np.log(Psats*np.array(self.phis_sat_at(T))) - np.log(P)[:, None]
+            if self.use_Poynting:
+                lnphis_T += (np.outer(P, Vms) - Vms*Psats)/(R*T)
+            if not self.composition_independent:
+                GibbsExcessModel = self.GibbsExcessModel
+                lnphis_T += np.log([GibbsExcessModel.to_T_xs(T, xs).gammas()
+                                    for xs in comps.tolist()])
+            lnphis[idx] = lnphis_T
+        return {'V': Vs, 'lnphis': lnphis, 'phis': np.exp(lnphis)}
+
 #    def fugacities(self, T, P, zs):
 #        # DO NOT EDIT _ CORRECT
 #        gammas = self.gammas(T, zs)
@@ -7642,6 +7982,27 @@ class GibbsExcessLiquid(Phase):
     def dgammas_dT(self):
         return self.GibbsExcessModel.dgammas_dT()
 
+    def dlnphis_dns(self):
+        r'''Method to calculate and return the mole number derivatives of the
+        log fugacity coefficients of the phase. Only the activity
+        coefficients depend on composition.
+
+        .. math::
+            \frac{\partial \ln \phi_i}{\partial n_j} = \frac{1}{\gamma_i}
+            \frac{\partial \gamma_i}{\partial n_j}
+
+        Returns
+        -------
+        dlnphis_dns : list[list[float]]
+            Mole number derivatives of the log fugacity coefficients, [1/mol]
+        '''
+        N, cmps = self.N, self.cmps
+        if self.composition_independent:
+            return [[0.0]*N for _ in cmps]
+        gammas = self.gammas()
+        dgammas_dns = self.GibbsExcessModel.dgammas_dns()
+        return [[dgammas_dns[i][j]/gammas[i] for j in cmps] for i in cmps]
+
     def H_old(self):
 #        try:
 #            return self._H